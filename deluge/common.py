@@ -14,6 +14,7 @@
 import binascii
 import functools
 import glob
+import itertools
 import locale
 import logging
 import numbers
@@ -1059,6 +1060,63 @@ def utf8_encode_structure(data):
     return data
 
 
+# The state of a piece in the pieces status, stored in 2 bits by pack_pieces.
+PIECE_MISSING = 0
+PIECE_AVAILABLE = 1
+PIECE_DOWNLOADING = 2
+PIECE_COMPLETED = 3
+
+# Maps the states of 4 consecutive pieces to their packed byte, the first lowest.
+_PIECES_TO_BYTE = {
+    states: states[0] | states[1] << 2 | states[2] << 4 | states[3] << 6
+    for states in itertools.product(range(4), repeat=4)
+}
+_BYTE_TO_PIECES = tuple(
+    states for dummy_byte, states in sorted((v, k) for k, v in _PIECES_TO_BYTE.items())
+)
+
+
+def pack_pieces(states):
+    """Packs the piece states in 2 bits each.
+
+    Args:
+        states (bytearray): The state of each piece, one of the PIECE_* values.
+
+    Returns:
+        str: The packed states, base64 encoded. None if states is None.
+
+    """
+    if states is None:
+        return None
+    states = states + bytearray(-len(states) % 4)
+    packed = bytearray(
+        map(
+            _PIECES_TO_BYTE.__getitem__,
+            zip(states[0::4], states[1::4], states[2::4], states[3::4]),
+        )
+    )
+    return base64.b64encode(bytes(packed)).decode('ascii')
+
+
+def unpack_pieces(packed, num_pieces):
+    """Unpacks the piece states packed by pack_pieces.
+
+    Args:
+        packed (str): The packed states, base64 encoded.
+        num_pieces (int): The number of pieces of the torrent.
+
+    Returns:
+        list of int: The state of each piece. None if packed is None.
+
+    """
+    if packed is None:
+        return None
+    data = bytearray(base64.b64decode(packed))
+    states = list(itertools.chain.from_iterable(map(_BYTE_TO_PIECES.__getitem__, data)))
+    del states[num_pieces:]
+    return states
+
+
 @functools.total_ordering
 class VersionSplit(object):
     """
@@ -197,6 +197,7 @@ def __init__(
         self.session_status.update(self._session_prev_bytes)
         hit_ratio_keys = ['write_hit_ratio', 'read_hit_ratio']
         self.session_status.update({k: 0.0 for k in hit_ratio_keys})
+        self.session_status.update(self.torrentmanager.prev_status.get_memory_status())
 
         self.session_status_timer_interval = 0.5
         self.session_status_timer = task.LoopingCall(self.session.post_session_stats)
@@ -343,6 +344,7 @@ def _on_alert_session_stats(self, alert):
         """The handler for libtorrent session stats alert"""
         self.session_status.update(alert.values)
         self._update_session_cache_hit_ratio()
+        self.session_status.update(self.torrentmanager.prev_status.get_memory_status())
 
     def _update_session_cache_hit_ratio(self):
         """Calculates the cache read/write hit ratios for session_status."""
@@ -757,6 +759,9 @@ def create_torrent_status(
 
     @export
     def get_torrent_status(self, torrent_id, keys, diff=False):
+        if self.torrentmanager.is_pending(torrent_id):
+            # Not loaded yet on startup
+            return self.torrentmanager.get_pending_status(torrent_id, keys)
         torrent_keys, plugin_keys = self.torrentmanager.separate_keys(
             keys, [torrent_id]
         )
@@ -801,8 +806,12 @@ def get_filter_tree(self, show_zero_hits=True, hide_cat=None):
     @export
     def get_session_state(self):
         """Returns a list of torrent_ids in the session."""
-        # Get the torrent list from the TorrentManager
-        return self.torrentmanager.get_torrent_list()
+        # Get the torrent list from the TorrentManager, with the torrents not
+        # loaded yet on startup.
+        return (
+            self.torrentmanager.get_torrent_list()
+            + self.torrentmanager.get_pending_list()
+        )
 
     @export
     def get_config(self):
@@ -1264,6 +1273,21 @@ def get_external_ip(self):
         """
         return self.external_ip
 
+    @export
+    def get_session_startup_status(self):
+        """
+        Returns the progress of loading the torrents of the session on startup.
+
+        :returns: the number of torrents in the session state as 'total', the number
+            added to the session as 'loaded', the number of unfinished torrents,
+            loaded first, as 'downloads' and the seconds until they and all the
+            torrents are loaded as 'downloads_duration' and 'duration', None until
+            then
+        :rtype: dict
+
+        """
+        return dict(self.torrentmanager.startup_status)
+
     @export
     def get_libtorrent_version(self):
         """
@@ -19,6 +19,7 @@
 import deluge.component as component
 from deluge.common import get_version, is_ip, is_process_running, windows_check
 from deluge.configmanager import get_config_dir
+from deluge.core.authmanager import AUTH_LEVEL_ADMIN
 from deluge.core.core import Core
 from deluge.core.rpcserver import RPCServer, export
 from deluge.error import DaemonRunningError
@@ -187,6 +188,41 @@ def get_version(self):
         """Returns the daemon version"""
         return get_version()
 
+    @export(AUTH_LEVEL_ADMIN)
+    def get_rpc_queue_status(self):
+        """Returns the status of the RPC dispatch queue.
+
+        Returns:
+            dict: The total number of queued requests (`queue_depth`), the
+                number of queued requests per session id (`session_backlog`)
+                and the number of requests dispatched for a session before
+                other sessions are served (`session_budget`).
+        """
+        return self.rpcserver.get_dispatch_queue_status()
+
+    @export(AUTH_LEVEL_ADMIN)
+    def get_rpc_send_buffers(self):
+        """Returns the state of the send buffer of the client sessions.
+
+        Returns:
+            dict: For each session id, whether the client is not reading fast
+                enough (`paused`), the bytes sent since then (`buffered`) and
+                the number of events dropped since then (`events_dropped`).
+        """
+        return self.rpcserver.get_send_buffer_status()
+
+    @export(AUTH_LEVEL_ADMIN)
+    def get_rpc_stats(self):
+        """Returns the call counts, latency and payload size histograms of the RPCs.
+
+        Returns:
+            dict: The statistics per method (`methods`) and per auth user and
+                method (`users`). Each method has the number of `calls` and
+                `errors` and the `wall_time`, `deferred_time`, `request_bytes`
+                and `response_bytes` histograms.
+        """
+        return self.rpcserver.get_rpc_stats()
+
     @export(1)
     def authorized_call(self, rpc):
         """Determines if session auth_level is authorized to call RPC.
@@ -11,15 +11,45 @@
 
 import logging
 
+from twisted.internet import reactor
+
 import deluge.component as component
+from deluge.event import TorrentsStateChangedEvent
 
 log = logging.getLogger(__name__)
 
+# The events merged into a batch event for the clients interested in the
+# batch event. The batch holds the second argument of the events with
+# the first argument as key.
+COALESCED_EVENTS = {'TorrentStateChangedEvent': TorrentsStateChangedEvent}
+# The events whose first argument is dropped from the pending batch events, so
+# that e.g. no state change of a torrent is emitted after its removal.
+PRUNING_EVENTS = {'TorrentRemovedEvent': (TorrentsStateChangedEvent,)}
+# The default time in seconds events are merged before the batch is emitted.
+EVENT_COALESCE_WINDOW = 0.5
+
 
 class EventManager(component.Component):
     def __init__(self):
         component.Component.__init__(self, 'EventManager')
         self.handlers = {}
+        self.coalesce_window = EVENT_COALESCE_WINDOW
+        # Holds the merged event arguments with the batch event class as key
+        self.coalesced = {}
+        self.coalesce_timer = None
+
+    def stop(self):
+        self.flush_coalesced()
+
+    def set_coalesce_window(self, window):
+        """
+        Sets the time events are merged before the batch event is emitted.
+
+        :param window: the time in seconds, batches are emitted immediately if 0.
+        :type window: float
+
+        """
+        self.coalesce_window = window
 
     def emit(self, event):
         """
@@ -27,8 +57,18 @@ def emit(self, event):
 
         :param event: DelugeEvent
         """
-        # Emit the event to the interested clients
-        component.get('RPCServer').emit_event(event)
+        if event.name in PRUNING_EVENTS:
+            self.prune_coalesced(event.args[0], PRUNING_EVENTS[event.name])
+        batch_event = COALESCED_EVENTS.get(event.name)
+        if batch_event and self.is_batch_wanted(batch_event):
+            # Clients interested in the batch event receive the batch instead.
+            component.get('RPCServer').emit_event(
+                event, exclude_interest=batch_event.__name__
+            )
+            self.coalesce(event, batch_event)
+        else:
+            # Emit the event to the interested clients
+            component.get('RPCServer').emit_event(event)
         # Call any handlers for the event
         if event.name in self.handlers:
             for handler in self.handlers[event.name]:
@@ -43,6 +83,61 @@ def emit(self, event):
                         ex,
                     )
 
+    def is_batch_wanted(self, batch_event):
+        """
+        Checks if a client or handler is interested in a batch event, the events
+        are not merged otherwise.
+
+        :param batch_event: class, the DelugeEvent the events are merged into
+        :returns: bool, True if the batch event is wanted
+
+        """
+        name = batch_event.__name__
+        if self.handlers.get(name):
+            return True
+        return component.get('RPCServer').has_event_interest(name)
+
+    def coalesce(self, event, batch_event):
+        """
+        Merges the event into the pending batch event.
+
+        :param event: DelugeEvent
+        :param batch_event: class, the DelugeEvent the event is merged into
+
+        """
+        key, value = event.args
+        self.coalesced.setdefault(batch_event, {})[key] = value
+        if self.coalesce_window <= 0:
+            self.flush_coalesced()
+        elif not self.coalesce_timer or not self.coalesce_timer.active():
+            self.coalesce_timer = reactor.callLater(
+                self.coalesce_window, self.flush_coalesced
+            )
+
+    def prune_coalesced(self, key, batch_events):
+        """
+        Drops a key from the pending batch events.
+
+        :param key: the first argument of the merged events
+        :param batch_events: list, the DelugeEvent classes of the batches
+
+        """
+        for batch_event in batch_events:
+            args = self.coalesced.get(batch_event)
+            if args and key in args:
+                del args[key]
+                if not args:
+                    del self.coalesced[batch_event]
+
+    def flush_coalesced(self):
+        """Emits the pending batch events."""
+        if self.coalesce_timer and self.coalesce_timer.active():
+            self.coalesce_timer.cancel()
+        self.coalesce_timer = None
+        coalesced, self.coalesced = self.coalesced, {}
+        for batch_event, args in coalesced.items():
+            self.emit(batch_event(args))
+
     def register_event_handler(self, event, handler):
         """
         Registers a function to be called when a `:param:event` is emitted.
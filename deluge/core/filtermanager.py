@@ -15,6 +15,8 @@
 
 import deluge.component as component
 from deluge.common import TORRENT_STATE
+from deluge.core.torrent import LT_STATUS_GETTERS, get_status_getter
+from deluge.core.torrentmanager import PENDING_STATUS_GETTERS
 
 log = logging.getLogger(__name__)
 
@@ -45,7 +47,7 @@ def filter_one_keyword(torrent_ids, keyword):
             yield torrent_id
         elif keyword in torrent.state.lower():
             yield torrent_id
-        elif torrent.trackers and keyword in torrent.trackers[0]['url']:
+        elif torrent.tracker_entries and keyword in torrent.tracker_entries[0][0]:
             yield torrent_id
         elif keyword in torrent_id:
             yield torrent_id
@@ -53,8 +55,8 @@ def filter_one_keyword(torrent_ids, keyword):
         elif keyword in torrent.tracker_status.lower():
             yield torrent_id
         else:
-            for t_file in torrent.get_files():
-                if keyword in t_file['path'].lower():
+            for path in torrent.get_file_table().paths:
+                if keyword in path.lower():
                     yield torrent_id
                     break
 
@@ -134,16 +136,59 @@ def filter_torrent_ids(self, filter_dict):
         core filter method
         """
         if not filter_dict:
-            return self.torrents.get_torrent_list()
+            return self.torrents.get_torrent_list() + self.torrents.get_pending_list()
 
         # Sanitize input: filter-value must be a list of strings
         for key, value in filter_dict.items():
             if isinstance(value, string_types):
                 filter_dict[key] = [value]
 
+        # The torrents not loaded yet on startup are filtered on their state.
+        pending_ids = self.filter_pending_ids(filter_dict)
+        return self.filter_loaded_ids(filter_dict) + pending_ids
+
+    def filter_pending_ids(self, filter_dict):
+        """Returns the torrent_ids not loaded yet on startup matching filter_dict.
+
+        They match only the plain filters on the keys of their pending status.
+        """
+        if not self.torrents.torrents_pending_load and not self.torrents.state_index:
+            return []
+
+        if 'id' in filter_dict:
+            torrent_ids = [
+                torrent_id
+                for torrent_id in filter_dict['id']
+                if self.torrents.is_pending(torrent_id)
+            ]
+        else:
+            torrent_ids = self.torrents.get_pending_list()
+        keys = [field for field in filter_dict if field != 'id']
+        if any(
+            field not in PENDING_STATUS_GETTERS or field in self.registered_filters
+            for field in keys
+        ):
+            return []
+
+        filtered_ids = []
+        for torrent_id in torrent_ids:
+            status = self.torrents.get_pending_status(torrent_id, keys)
+            if all(
+                field in status and status[field] in filter_dict[field]
+                for field in keys
+            ):
+                filtered_ids.append(torrent_id)
+        return filtered_ids
+
+    def filter_loaded_ids(self, filter_dict):
+        """Returns the torrent_ids in the session matching filter_dict."""
         # Optimized filter for id
         if 'id' in filter_dict:
-            torrent_ids = list(filter_dict['id'])
+            torrent_ids = [
+                torrent_id
+                for torrent_id in filter_dict['id']
+                if not self.torrents.is_pending(torrent_id)
+            ]
             del filter_dict['id']
         else:
             torrent_ids = self.torrents.get_torrent_list()
@@ -178,14 +223,32 @@ def filter_torrent_ids(self, filter_dict):
         if not filter_dict:
             return torrent_ids
 
-        torrent_keys, plugin_keys = self.torrents.separate_keys(
-            list(filter_dict), torrent_ids
-        )
+        # Fields depending only on the libtorrent status are filtered on the
+        # values in the status snapshot.
+        for field, values in list(filter_dict.items()):
+            if field in LT_STATUS_GETTERS:
+                torrent_ids = [
+                    torrent_id
+                    for torrent_id in torrent_ids
+                    if torrent_id in self.torrents.torrents
+                ]
+                field_values = self.torrents.status_snapshot.get_values(
+                    field, torrent_ids
+                )
+                torrent_ids = [
+                    torrent_id
+                    for torrent_id, value in zip(torrent_ids, field_values)
+                    if value in values
+                ]
+                del filter_dict[field]
+
+        if not filter_dict:
+            return torrent_ids
+
         # Leftover filter arguments, default filter on status fields.
-        for torrent_id in list(torrent_ids):
-            status = self.core.create_torrent_status(
-                torrent_id, torrent_keys, plugin_keys
-            )
+        for torrent_id, status in self.get_torrents_status(
+            list(torrent_ids), list(filter_dict)
+        ):
             for field, values in filter_dict.items():
                 if field in status and status[field] in values:
                     continue
@@ -193,6 +256,27 @@ def filter_torrent_ids(self, filter_dict):
                     torrent_ids.remove(torrent_id)
         return torrent_ids
 
+    def get_torrents_status(self, torrent_ids, keys):
+        """Yields the torrent_id and status dict of each torrent for keys.
+
+        The torrent keys are read by one compiled status getter for all the
+        torrents, the plugin keys are filled in by the plugin manager.
+        """
+        torrent_keys, plugin_keys = self.torrents.separate_keys(keys, torrent_ids)
+        get_status = get_status_getter(torrent_keys)
+        for torrent_id in torrent_ids:
+            try:
+                status = get_status(self.torrents[torrent_id])
+            except KeyError:
+                # Torrent was probably removed meanwhile
+                yield torrent_id, {}
+                continue
+            if plugin_keys:
+                status.update(
+                    self.core.pluginmanager.get_status(torrent_id, plugin_keys)
+                )
+            yield torrent_id, status
+
     def get_filter_tree(self, show_zero_hits=True, hide_cat=None):
         """
         returns {field: [(value,count)] }
@@ -204,19 +288,22 @@ def get_filter_tree(self, show_zero_hits=True, hide_cat=None):
             for cat in hide_cat:
                 tree_keys.remove(cat)
 
-        torrent_keys, plugin_keys = self.torrents.separate_keys(tree_keys, torrent_ids)
         items = {field: self.tree_fields[field]() for field in tree_keys}
 
-        for torrent_id in list(torrent_ids):
-            status = self.core.create_torrent_status(
-                torrent_id, torrent_keys, plugin_keys
-            )  # status={key:value}
+        for torrent_id, status in self.get_torrents_status(torrent_ids, tree_keys):
             for field in tree_keys:
                 value = status[field]
                 items[field][value] = items[field].get(value, 0) + 1
 
+        # The torrents not loaded yet on startup are counted from their state.
+        pending_ids = self.torrents.get_pending_list()
+        for torrent_id in pending_ids:
+            status = self.torrents.get_pending_status(torrent_id, tree_keys)
+            for field, value in status.items():
+                items[field][value] = items[field].get(value, 0) + 1
+
         if 'tracker_host' in items:
-            items['tracker_host']['All'] = len(torrent_ids)
+            items['tracker_host']['All'] = len(torrent_ids) + len(pending_ids)
             items['tracker_host']['Error'] = len(
                 tracker_error_filter(torrent_ids, ('Error',))
             )
@@ -236,7 +323,9 @@ def get_filter_tree(self, show_zero_hits=True, hide_cat=None):
 
     def _init_state_tree(self):
         init_state = {}
-        init_state['All'] = len(self.torrents.get_torrent_list())
+        init_state['All'] = len(self.torrents.get_torrent_list()) + len(
+            self.torrents.get_pending_list()
+        )
         for state in TORRENT_STATE:
             init_state[state] = 0
         init_state['Active'] = len(
@@ -17,6 +17,7 @@
 
 import deluge.component as component
 import deluge.pluginmanagerbase
+from deluge.core.torrent import STATUS_GETTER_CACHE_SIZE
 from deluge.event import PluginDisabledEvent, PluginEnabledEvent
 
 log = logging.getLogger(__name__)
@@ -30,6 +31,8 @@ def __init__(self, core):
         component.Component.__init__(self, 'CorePluginManager')
 
         self.status_fields = {}
+        # The status field functions for each tuple of fields requested
+        self.status_getters = {}
 
         # Call the PluginManagerBase constructor
         deluge.pluginmanagerbase.PluginManagerBase.__init__(
@@ -81,14 +84,28 @@ def on_disable_plugin(result):
             d.addBoth(on_disable_plugin)
         return d
 
+    def get_status_getters(self, fields):
+        """Return the registered (field, function) pairs for fields, cached."""
+        fields = tuple(fields)
+        try:
+            return self.status_getters[fields]
+        except KeyError:
+            getters = [
+                (field, self.status_fields[field])
+                for field in (fields or list(self.status_fields))
+                if field in self.status_fields
+            ]
+            if len(self.status_getters) >= STATUS_GETTER_CACHE_SIZE:
+                self.status_getters.clear()
+            self.status_getters[fields] = getters
+            return getters
+
     def get_status(self, torrent_id, fields):
         """Return the value of status fields for the selected torrent_id."""
         status = {}
-        if len(fields) == 0:
-            fields = list(self.status_fields)
-        for field in fields:
+        for field, function in self.get_status_getters(fields):
             try:
-                status[field] = self.status_fields[field](torrent_id)
+                status[field] = function(torrent_id)
             except KeyError:
                 pass
         return status
@@ -98,11 +115,13 @@ def register_status_field(self, field, function):
         client requests other status information from core."""
         log.debug('Registering status field %s with PluginManager', field)
         self.status_fields[field] = function
+        self.status_getters.clear()
 
     def deregister_status_field(self, field):
         """Deregisters a status field"""
         log.debug('Deregistering status field %s with PluginManager', field)
         try:
             del self.status_fields[field]
+            self.status_getters.clear()
         except Exception:
             log.warning('Unable to deregister status field %s', field)
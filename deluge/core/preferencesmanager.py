@@ -127,6 +127,8 @@
     'auto_manage_prefer_seeds': False,
     'shared': False,
     'super_seeding': False,
+    'event_coalesce_window': 0.5,
+    'prev_status_memory_limit': 16 * 1024 * 1024,
 }
 
 
@@ -478,5 +480,11 @@ def _on_set_cache_size(self, key, value):
     def _on_set_cache_expiry(self, key, value):
         self.core.apply_session_setting('cache_expiry', value)
 
+    def _on_set_event_coalesce_window(self, key, value):
+        self.core.eventmanager.set_coalesce_window(value)
+
+    def _on_set_prev_status_memory_limit(self, key, value):
+        self.core.torrentmanager.prev_status.set_memory_limit(value)
+
     def _on_auto_manage_prefer_seeds(self, key, value):
         self.core.apply_session_setting('auto_manage_prefer_seeds', value)
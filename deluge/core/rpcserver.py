@@ -14,13 +14,19 @@
 import os
 import stat
 import sys
+import time
 import traceback
-from collections import namedtuple
+from bisect import bisect_left
+from collections import OrderedDict, deque, namedtuple
+from itertools import islice
 from types import FunctionType
 
+import rencode
 from OpenSSL import crypto
-from twisted.internet import defer, reactor
+from twisted.internet import defer, reactor, task
+from twisted.internet.interfaces import IPushProducer
 from twisted.internet.protocol import Factory, connectionDone
+from zope.interface import implementer
 
 import deluge.component as component
 import deluge.configmanager
@@ -38,11 +44,33 @@
     _ClientSideRecreateError,
 )
 from deluge.event import ClientDisconnectedEvent
-from deluge.transfer import DelugeTransferProtocol
+from deluge.transfer import (
+    COMPRESSION_THRESHOLD,
+    PROTOCOL_VERSION,
+    PROTOCOL_VERSION_LEGACY,
+    DelugeTransferProtocol,
+    get_compression_level,
+)
 
 RPC_RESPONSE = 1
 RPC_ERROR = 2
 RPC_EVENT = 3
+RPC_RESPONSE_CHUNK = 4
+
+# Dict results with more items are sent in chunks of this size to clients
+# using protocol version 2 or later.
+RESPONSE_CHUNK_ITEMS = 1000
+# The number of requests dispatched for a session before other sessions are served.
+DISPATCH_SESSION_BUDGET = 20
+
+# Upper bounds of the RPC statistics histogram buckets, in seconds and bytes.
+LATENCY_BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10)
+SIZE_BUCKETS = tuple(4 ** exp for exp in range(3, 14))
+
+# The bytes sent to a session whose transport buffer is full above which
+# events are dropped, and above which the session is disconnected.
+EVENT_DROP_WATERMARK = 1024 * 1024
+SEND_BUFFER_LIMIT = 32 * 1024 * 1024
 
 log = logging.getLogger(__name__)
 
@@ -112,11 +140,318 @@ def format_request(call):
         return s
 
 
+class Histogram(object):
+    """
+    A fixed size histogram.
+
+    :param bounds: the upper bounds of the buckets in increasing order. Values
+        larger than the last bound are counted in an extra overflow bucket.
+    :type bounds: tuple
+
+    """
+
+    __slots__ = ('bounds', 'counts', 'count', 'total', 'maximum')
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0
+        self.maximum = 0
+
+    def add(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.maximum = max(self.maximum, value)
+
+    def merge(self, other):
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.maximum = max(self.maximum, other.maximum)
+
+    def to_dict(self):
+        """
+        Returns the histogram in a form that can be sent to clients.
+
+        :returns: the count, total and maximum of the values and the buckets
+            as (upper bound, count) pairs, the bound of the overflow bucket is None.
+        :rtype: dict
+
+        """
+        return {
+            'count': self.count,
+            'total': self.total,
+            'max': self.maximum,
+            'buckets': list(zip(self.bounds + (None,), self.counts)),
+        }
+
+
+class RPCMethodStats(object):
+    """Call count, latency and payload size histograms of an RPC method."""
+
+    __slots__ = (
+        'calls',
+        'errors',
+        'rejected',
+        'wall_time',
+        'deferred_time',
+        'request_bytes',
+        'response_bytes',
+    )
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        # The calls refused as the session auth level is too low, not in calls.
+        self.rejected = 0
+        # The time spent running the method on the reactor thread.
+        self.wall_time = Histogram(LATENCY_BUCKETS)
+        # The time until the Deferred returned by the method fired.
+        self.deferred_time = Histogram(LATENCY_BUCKETS)
+        self.request_bytes = Histogram(SIZE_BUCKETS)
+        self.response_bytes = Histogram(SIZE_BUCKETS)
+
+    def merge(self, other):
+        self.calls += other.calls
+        self.errors += other.errors
+        self.rejected += other.rejected
+        for name in ('wall_time', 'deferred_time', 'request_bytes', 'response_bytes'):
+            getattr(self, name).merge(getattr(other, name))
+
+    def to_dict(self):
+        stats = {'calls': self.calls, 'errors': self.errors, 'rejected': self.rejected}
+        for name in ('wall_time', 'deferred_time', 'request_bytes', 'response_bytes'):
+            stats[name] = getattr(self, name).to_dict()
+        return stats
+
+
+class RPCStats(object):
+    """Collects the statistics of the dispatched RPCs per method and auth user."""
+
+    def __init__(self):
+        # Holds the RPCMethodStats with (username, method) as key
+        self.stats = {}
+
+    def get(self, username, method):
+        """
+        Returns the statistics of a method called by a user, creating them if needed.
+
+        :returns: the statistics
+        :rtype: RPCMethodStats
+
+        """
+        try:
+            return self.stats[(username, method)]
+        except KeyError:
+            stats = self.stats[(username, method)] = RPCMethodStats()
+            return stats
+
+    def to_dict(self):
+        """
+        Returns the statistics in a form that can be sent to clients.
+
+        :returns: the statistics per method in `methods` and per user and
+            method in `users`.
+        :rtype: dict
+
+        """
+        methods = {}
+        users = {}
+        for (username, method), stats in self.stats.items():
+            if method not in methods:
+                methods[method] = RPCMethodStats()
+            methods[method].merge(stats)
+            users.setdefault(username, {})[method] = stats.to_dict()
+        return {
+            'methods': {method: stats.to_dict() for method, stats in methods.items()},
+            'users': users,
+        }
+
+
+class DispatchQueue(object):
+    """
+    Queues the RPC requests received from the sessions until they are dispatched.
+
+    The requests are dispatched in a single pass in the next reactor
+    iteration, taking up to `session_budget` requests from each session in
+    turn. Any requests left are dispatched in the following iteration, so a
+    session sending many requests cannot starve the others.
+
+    :param session_budget: the number of requests dispatched for a session per pass.
+    :type session_budget: int
+
+    """
+
+    def __init__(self, session_budget=DISPATCH_SESSION_BUDGET):
+        self.session_budget = session_budget
+        # Holds the protocol and the queued requests with the session_id as key
+        self.sessions = OrderedDict()
+        self._dispatch_call = None
+
+    def put(self, protocol, requests, request_size=0):
+        """
+        Queues requests from a session to be dispatched.
+
+        :param protocol: the protocol of the session the requests were received on.
+        :type protocol: DelugeRPCProtocol
+        :param requests: the requests in the form (request_id, method, args, kwargs).
+        :type requests: list
+        :param request_size: the size in bytes of each request on the wire.
+        :type request_size: int
+
+        """
+        session_id = protocol.transport.sessionno
+        if session_id not in self.sessions:
+            self.sessions[session_id] = (protocol, deque())
+        self.sessions[session_id][1].extend(
+            (request, request_size) for request in requests
+        )
+        if not self._dispatch_call:
+            self._dispatch_call = reactor.callLater(0, self.dispatch)
+
+    def dispatch(self):
+        """Dispatches the queued requests, up to `session_budget` per session."""
+        if self._dispatch_call and self._dispatch_call.active():
+            self._dispatch_call.cancel()
+        self._dispatch_call = None
+
+        for session_id in list(self.sessions):
+            if session_id not in self.sessions:
+                # The session was removed by a previous request.
+                continue
+            protocol, requests = self.sessions[session_id]
+            for dummy in range(min(self.session_budget, len(requests))):
+                request, request_size = requests.popleft()
+                try:
+                    protocol.dispatch(*request, request_size=request_size)
+                except Exception as ex:
+                    log.exception('Exception dispatching RPC request: %s', ex)
+            if not requests:
+                self.sessions.pop(session_id, None)
+
+        if self.sessions:
+            self._dispatch_call = reactor.callLater(0, self.dispatch)
+
+    def remove_session(self, session_id):
+        """
+        Drops the queued requests of a session.
+
+        :param session_id: the session id
+        :type session_id: int
+
+        """
+        self.sessions.pop(session_id, None)
+
+    def get_status(self):
+        """
+        Returns the status of the queue.
+
+        :returns: the total number of queued requests, the number of queued
+            requests per session and the session budget.
+        :rtype: dict
+
+        """
+        backlog = {
+            session_id: len(requests)
+            for session_id, (dummy_protocol, requests) in self.sessions.items()
+        }
+        return {
+            'queue_depth': sum(backlog.values()),
+            'session_backlog': backlog,
+            'session_budget': self.session_budget,
+        }
+
+
+@implementer(IPushProducer)
 class DelugeRPCProtocol(DelugeTransferProtocol):
+    """
+    Deluge RPC protocol of the daemon.
+
+    The protocol is registered as the producer of its transport so that it is
+    told when the transport buffer is full, i.e. when the client does not read
+    the data as fast as it is sent. The data sent from then until the buffer
+    drains is counted: above EVENT_DROP_WATERMARK events are dropped and above
+    SEND_BUFFER_LIMIT the client is disconnected.
+    """
+
     def __init__(self):
         super(DelugeRPCProtocol, self).__init__()
         # namedtuple subclass with auth_level, username for the connected session.
         self.AuthLevel = namedtuple('SessionAuthlevel', 'auth_level, username')
+        self._send_paused = False
+        self._send_buffered = 0
+        self._events_dropped = 0
+        # Holds the Deferreds fired when the transport buffer drains.
+        self._send_waiters = []
+
+    def pauseProducing(self):  # NOQA: N802
+        self._send_paused = True
+
+    def resumeProducing(self):  # NOQA: N802
+        if self._events_dropped:
+            log.info(
+                'Session %s resumed after %d events were dropped',
+                self.transport.sessionno,
+                self._events_dropped,
+            )
+        self._send_paused = False
+        self._send_buffered = 0
+        self._events_dropped = 0
+        self._fire_send_waiters()
+
+    def stopProducing(self):  # NOQA: N802
+        self._fire_send_waiters()
+
+    def _fire_send_waiters(self):
+        waiters, self._send_waiters = self._send_waiters, []
+        for waiter in waiters:
+            waiter.callback(None)
+
+    def wait_for_send_buffer(self):
+        """
+        Returns a Deferred fired when the transport buffer is no longer full.
+
+        :returns: a Deferred, already fired if the buffer is not full.
+        :rtype: twisted.internet.defer.Deferred
+
+        """
+        if not self._send_paused:
+            return defer.succeed(None)
+        waiter = defer.Deferred()
+        self._send_waiters.append(waiter)
+        return waiter
+
+    def get_send_buffer_status(self):
+        """
+        Returns the state of the send buffer of the session.
+
+        :returns: whether the transport buffer is full (`paused`), the bytes
+            sent since it became full (`buffered`) and the number of events
+            dropped since then (`events_dropped`).
+        :rtype: dict
+
+        """
+        return {
+            'paused': self._send_paused,
+            'buffered': self._send_buffered,
+            'events_dropped': self._events_dropped,
+        }
+
+    def write_message(self, message):
+        if self._send_paused:
+            self._send_buffered += len(message)
+            if self._send_buffered > SEND_BUFFER_LIMIT:
+                log.warning(
+                    'Disconnecting session %s, %d bytes are waiting to be sent',
+                    self.transport.sessionno,
+                    self._send_buffered,
+                )
+                self.transport.abortConnection()
+                return
+        super(DelugeRPCProtocol, self).write_message(message)
 
     def message_received(self, request):
         """
@@ -137,6 +472,7 @@ def message_received(self, request):
             log.debug('Received invalid message: there are no items')
             return
 
+        calls = []
         for call in request:
             if len(call) != 4:
                 log.debug(
@@ -145,7 +481,13 @@ def message_received(self, request):
                 )
                 continue
             # log.debug('RPCRequest: %s', format_request(call))
-            reactor.callLater(0, self.dispatch, *call)
+            calls.append(call)
+        if calls:
+            # The size of the calls is not known individually, share the
+            # size of the message between them.
+            self.factory.dispatch_queue.put(
+                self, calls, self._message_length // len(calls)
+            )
 
     def sendData(self, data):  # NOQA: N802
         """
@@ -163,6 +505,138 @@ def sendData(self, data):  # NOQA: N802
             log.exception(ex)
             raise
 
+    def send_message(self, message):
+        """
+        Sends a message that was already encoded for this session.
+
+        :param message: the message built by :meth:`encode_message`.
+        :type message: bytes
+
+        """
+        try:
+            self.write_message(message)
+        except Exception as ex:
+            log.warning('Error occurred when sending message: %s.', ex)
+            log.exception(ex)
+            raise
+
+    def send_event(self, message):
+        """
+        Sends an event message that was already encoded for this session,
+        unless the event drop watermark has been reached.
+
+        :param message: the message built by :meth:`encode_message`.
+        :type message: bytes
+
+        :returns: True if the event was sent, False if it was dropped.
+        :rtype: bool
+
+        """
+        if self._send_buffered > EVENT_DROP_WATERMARK:
+            if not self._events_dropped:
+                log.warning(
+                    'Dropping events for session %s until its send buffer drains',
+                    self.transport.sessionno,
+                )
+            self._events_dropped += 1
+            return False
+        self.send_message(message)
+        return True
+
+    def send_response(self, request_id, result):
+        """
+        Sends a RPC Response to the client.
+
+        Large dict results, such as the status of many torrents, are sent in
+        chunks if the client supports it.
+
+        :param request_id: the request_id from the client.
+        :type request_id: int
+        :param result: the result of the RPC.
+        :type result: object
+
+        :returns: the number of bytes sent or, for a chunked response, a
+            Deferred fired with it once all the chunks have been sent.
+
+        """
+        if (
+            self._protocol_version > PROTOCOL_VERSION_LEGACY
+            and isinstance(result, dict)
+            and len(result) > RESPONSE_CHUNK_ITEMS
+        ):
+            return self.send_chunked_response(request_id, result)
+        bytes_sent = self.get_bytes_sent()
+        self.sendData((RPC_RESPONSE, request_id, result))
+        return self.get_bytes_sent() - bytes_sent
+
+    def send_chunked_response(self, request_id, result):
+        """
+        Sends a dict result as a sequence of RPC Response Chunk messages.
+
+        Each message is in the form (RPC_RESPONSE_CHUNK, request_id, sequence,
+        last, items) and holds up to RESPONSE_CHUNK_ITEMS items of the result.
+        The reactor is given control between messages so that other sessions
+        are served while the response is sent, so the items of the result are
+        copied first in case it is changed meanwhile. If sending fails, an RPC
+        Error is sent in place of the remaining chunks.
+
+        :param request_id: the request_id from the client.
+        :type request_id: int
+        :param result: the result of the RPC.
+        :type result: dict
+
+        :returns: a Deferred fired with the number of bytes sent when all the
+            chunks have been sent.
+
+        """
+        sent = [0]
+        items = iter(list(result.items()))
+
+        def send_chunks():
+            chunk = dict(islice(items, RESPONSE_CHUNK_ITEMS))
+            sequence = 0
+            while chunk:
+                if self._send_paused:
+                    # Wait for the client to catch up before sending more.
+                    yield self.wait_for_send_buffer()
+                if not self.valid_session():
+                    log.debug('Session lost, not sending response %s', request_id)
+                    return
+                next_chunk = dict(islice(items, RESPONSE_CHUNK_ITEMS))
+                bytes_sent = self.get_bytes_sent()
+                self.sendData(
+                    (RPC_RESPONSE_CHUNK, request_id, sequence, not next_chunk, chunk)
+                )
+                sent[0] += self.get_bytes_sent() - bytes_sent
+                chunk = next_chunk
+                sequence += 1
+                yield
+
+        def on_fail(failure):
+            log.warning('Error occurred when sending response chunks: %s', failure)
+            if not self.valid_session():
+                return
+            formated_tb = failure.getTraceback()
+            try:
+                self.sendData(
+                    (
+                        RPC_ERROR,
+                        request_id,
+                        WrappedException.__name__,
+                        (str(failure.value), failure.type.__name__, formated_tb),
+                        {},
+                        formated_tb,
+                    )
+                )
+            except Exception as ex:
+                log.error(
+                    'An exception occurred while sending RPC_ERROR to client: %s', ex
+                )
+
+        d = task.cooperate(send_chunks()).whenDone()
+        d.addCallbacks(lambda dummy: sent[0], on_fail)
+        return d
+
     def connectionMade(self):  # NOQA: N802
         """
         This method is called when a new client connects.
@@ -173,6 +647,7 @@ def connectionMade(self):  # NOQA: N802
         self.factory.authorized_sessions[self.transport.sessionno] = self.AuthLevel(
             AUTH_LEVEL_NONE, ''
         )
+        self.transport.registerProducer(self, True)
 
     def connectionLost(self, reason=connectionDone):  # NOQA: N802
         """
@@ -188,7 +663,14 @@ def connectionLost(self, reason=connectionDone):  # NOQA: N802
         if self.transport.sessionno in self.factory.session_protocols:
             del self.factory.session_protocols[self.transport.sessionno]
         if self.transport.sessionno in self.factory.interested_events:
-            del self.factory.interested_events[self.transport.sessionno]
+            for event in self.factory.interested_events.pop(self.transport.sessionno):
+                sessions = self.factory.event_sessions.get(event)
+                if sessions:
+                    sessions.discard(self.transport.sessionno)
+                    if not sessions:
+                        del self.factory.event_sessions[event]
+        self.factory.dispatch_queue.remove_session(self.transport.sessionno)
+        self._fire_send_waiters()
 
         if self.factory.state == 'running':
             component.get('EventManager').emit(
@@ -199,7 +681,30 @@ def connectionLost(self, reason=connectionDone):  # NOQA: N802
     def valid_session(self):
         return self.transport.sessionno in self.factory.authorized_sessions
 
-    def dispatch(self, request_id, method, args, kwargs):
+    def negotiate_protocol(self, version):
+        """
+        Agree on the wire protocol options with the client.
+
+        :param version: the highest protocol version supported by the client.
+        :type version: int
+
+        :returns: the protocol options both sides will send messages with.
+        :rtype: dict
+
+        """
+        version = min(version, PROTOCOL_VERSION)
+        if version < PROTOCOL_VERSION_LEGACY:
+            raise DelugeError('Unsupported protocol version: %s' % version)
+
+        options = {'version': version}
+        if version > PROTOCOL_VERSION_LEGACY:
+            options['compression_level'] = get_compression_level(
+                self.transport.getPeer().host
+            )
+            options['compression_threshold'] = COMPRESSION_THRESHOLD
+        return options
+
+    def dispatch(self, request_id, method, args, kwargs, request_size=0):
         """
         This method is run when a RPC Request is made.  It will run the local method
         and will send either a RPC Response or RPC Error back to the client.
@@ -213,6 +718,8 @@ def dispatch(self, request_id, method, args, kwargs):
         :type args: list
         :param kwargs: the keyword-arguments to pass to `method`
         :type kwargs: dict
+        :param request_size: the size of the request in bytes, for the RPC statistics.
+        :type request_size: int
 
         """
 
@@ -293,12 +800,30 @@ def send_error():
                 if self.transport.sessionno not in self.factory.interested_events:
                     self.factory.interested_events[self.transport.sessionno] = []
                 self.factory.interested_events[self.transport.sessionno].extend(args[0])
+                for event in args[0]:
+                    self.factory.event_sessions.setdefault(event, set()).add(
+                        self.transport.sessionno
+                    )
             except Exception:
                 send_error()
             else:
                 self.sendData((RPC_RESPONSE, request_id, (True)))
             return
 
+        if method == 'daemon.negotiate_protocol':
+            log.debug('RPC dispatch daemon.negotiate_protocol')
+            # This special case allows clients to agree on the protocol version
+            # and compression used for messages. The response is sent with the
+            # current options and the agreed ones apply to subsequent messages.
+            try:
+                options = self.negotiate_protocol(*args)
+            except Exception:
+                send_error()
+            else:
+                self.sendData((RPC_RESPONSE, request_id, options))
+                self.set_protocol_options(**options)
+            return
+
         if method not in self.factory.methods:
             try:
                 # Raise exception to be sent back to client
@@ -308,41 +833,62 @@ def send_error():
                 return
 
         log.debug('RPC dispatch %s', method)
+        session = self.factory.authorized_sessions[self.transport.sessionno]
+        stats = self.factory.rpc_stats.get(getattr(session, 'username', None), method)
+        method_auth_requirement = self.factory.methods[method]._rpcserver_auth_level
+        if session.auth_level < method_auth_requirement:
+            # This session is not allowed to call this method
+            log.debug(
+                'Session %s is attempting an unauthorized method call!',
+                self.transport.sessionno,
+            )
+            stats.rejected += 1
+            try:
+                raise NotAuthorizedError(session.auth_level, method_auth_requirement)
+            except NotAuthorizedError:
+                send_error()
+                return
+
+        stats.calls += 1
+        stats.request_bytes.add(request_size)
+        start = time.time()
         try:
-            method_auth_requirement = self.factory.methods[method]._rpcserver_auth_level
-            auth_level = self.factory.authorized_sessions[
-                self.transport.sessionno
-            ].auth_level
-            if auth_level < method_auth_requirement:
-                # This session is not allowed to call this method
-                log.debug(
-                    'Session %s is attempting an unauthorized method call!',
-                    self.transport.sessionno,
-                )
-                raise NotAuthorizedError(auth_level, method_auth_requirement)
             # Set the session_id in the factory so that methods can know
             # which session is calling it.
             self.factory.session_id = self.transport.sessionno
             ret = self.factory.methods[method](*args, **kwargs)
         except Exception as ex:
+            stats.wall_time.add(time.time() - start)
+            stats.errors += 1
             send_error()
             # Don't bother printing out DelugeErrors, because they are just
             # for the client
             if not isinstance(ex, DelugeError):
                 log.exception('Exception calling RPC request: %s', ex)
         else:
+            stats.wall_time.add(time.time() - start)
+
+            def record_response_size(bytes_sent):
+                if isinstance(bytes_sent, defer.Deferred):
+                    bytes_sent.addCallback(record_response_size)
+                elif bytes_sent is not None:
+                    stats.response_bytes.add(bytes_sent)
+
             # Check if the return value is a deferred, since we'll need to
             # wait for it to fire before sending the RPC_RESPONSE
             if isinstance(ret, defer.Deferred):
 
                 def on_success(result):
+                    stats.deferred_time.add(time.time() - start)
                     try:
-                        self.sendData((RPC_RESPONSE, request_id, result))
+                        record_response_size(self.send_response(request_id, result))
                     except Exception:
                         send_error()
                     return result
 
                 def on_fail(failure):
+                    stats.deferred_time.add(time.time() - start)
+                    stats.errors += 1
                     try:
                         failure.raiseException()
                     except Exception:
@@ -351,7 +897,7 @@ def on_fail(failure):
 
                 ret.addCallbacks(on_success, on_fail)
             else:
-                self.sendData((RPC_RESPONSE, request_id, ret))
+                record_response_size(self.send_response(request_id, ret))
 
 
 class RPCServer(component.Component):
@@ -386,6 +932,12 @@ def __init__(self, port=58846, interface='', allow_remote=False, listen=True):
         self.factory.session_protocols = {}
         # Holds the interested event list for the sessions
         self.factory.interested_events = {}
+        # Holds the set of interested session_ids with the event name as key
+        self.factory.event_sessions = {}
+        # Holds the requests waiting to be dispatched
+        self.factory.dispatch_queue = DispatchQueue()
+        # Holds the statistics of the dispatched requests
+        self.factory.rpc_stats = RPCStats()
 
         self.listen = listen
         if not listen:
@@ -529,22 +1081,82 @@ def is_session_valid(self, session_id):
         """
         return session_id in self.factory.authorized_sessions
 
-    def emit_event(self, event):
+    def get_dispatch_queue_status(self):
+        """
+        Returns the status of the RPC dispatch queue.
+
+        :returns: the total number of queued requests, the number of queued
+            requests per session and the session budget.
+        :rtype: dict
+
+        """
+        return self.factory.dispatch_queue.get_status()
+
+    def get_send_buffer_status(self):
+        """
+        Returns the state of the send buffer of the sessions.
+
+        :returns: the status of each session with the session_id as key, see
+            :meth:`DelugeRPCProtocol.get_send_buffer_status`.
+        :rtype: dict
+
+        """
+        return {
+            session_id: protocol.get_send_buffer_status()
+            for session_id, protocol in self.factory.session_protocols.items()
+        }
+
+    def get_rpc_stats(self):
+        """
+        Returns the statistics of the dispatched RPCs.
+
+        :returns: the statistics per method in `methods` and per auth user and
+            method in `users`, see :meth:`RPCStats.to_dict`.
+        :rtype: dict
+
+        """
+        return self.factory.rpc_stats.to_dict()
+
+    def has_event_interest(self, event_name):
+        """
+        Checks if any session is interested in an event.
+
+        :param event_name: the name of the event
+        :type event_name: str
+
+        :returns: True if a session is interested in the event
+        :rtype: bool
+        """
+        return bool(self.factory.event_sessions.get(event_name))
+
+    def emit_event(self, event, exclude_interest=None):
         """
         Emits the event to interested clients.
 
         :param event: the event to emit
         :type event: :class:`deluge.event.DelugeEvent`
+        :param exclude_interest: the name of an event, sessions interested in
+            it do not receive this event.
+        :type exclude_interest: str
         """
-        log.debug('intevents: %s', self.factory.interested_events)
-        # Find sessions interested in this event
-        for session_id, interest in self.factory.interested_events.items():
-            if event.name in interest:
-                log.debug('Emit Event: %s %s', event.name, event.args)
-                # This session is interested so send a RPC_EVENT
-                self.factory.session_protocols[session_id].sendData(
-                    (RPC_EVENT, event.name, event.args)
-                )
+        session_ids = self.factory.event_sessions.get(event.name)
+        if session_ids and exclude_interest in self.factory.event_sessions:
+            session_ids = session_ids - self.factory.event_sessions[exclude_interest]
+        if not session_ids:
+            return
+        log.debug('Emit Event: %s %s', event.name, event.args)
+        # The event is encoded once and the message built once for each set
+        # of protocol options in use by the interested sessions.
+        body = rencode.dumps((RPC_EVENT, event.name, event.args))
+        messages = {}
+        for session_id in session_ids:
+            protocol = self.factory.session_protocols.get(session_id)
+            if protocol is None:
+                continue
+            options = tuple(sorted(protocol.get_protocol_options().items()))
+            if options not in messages:
+                messages[options] = protocol.encode_message(body)
+            protocol.send_event(messages[options])
 
     def emit_event_for_session_id(self, session_id, event):
         """
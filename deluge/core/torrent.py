@@ -11,6 +11,18 @@
 
 Attributes:
     LT_TORRENT_STATE_MAP (dict): Maps the torrent state from libtorrent to Deluge state.
+    STATUS_EXPRESSIONS (dict): Maps the status keys to the Python expression of their
+        value, compiled into the status getters.
+    STATUS_GETTERS (dict): Maps the status keys to the function getting their value
+        from a torrent.
+    LT_STATUS_GETTERS (dict): Maps the status keys that only depend on the libtorrent
+        torrent status to the function getting their value from it.
+    OPTION_STATUS_KEYS (dict): Maps the torrent options to the status keys reporting
+        them, when they differ from the option name.
+    VERSIONED_STATUS_KEYS (frozenset): The status keys whose changes are recorded
+        in the change versions of a torrent, the others are computed on every diff.
+    PREV_STATUS_IDLE_TIMEOUT (int): Seconds after which the previous status of a
+        session that stopped diffing is dropped.
 
 """
 
@@ -19,12 +31,23 @@
 import logging
 import os
 import socket
+import sys
+import time
+from array import array
+from collections import OrderedDict
 
 from twisted.internet.defer import Deferred, DeferredList
 
 import deluge.component as component
 from deluge._libtorrent import lt
-from deluge.common import decode_bytes
+from deluge.common import (
+    PIECE_AVAILABLE,
+    PIECE_COMPLETED,
+    PIECE_DOWNLOADING,
+    PIECE_MISSING,
+    decode_bytes,
+    pack_pieces,
+)
 from deluge.configmanager import ConfigManager, get_config_dir
 from deluge.core.authmanager import AUTH_LEVEL_ADMIN
 from deluge.decorators import deprecated
@@ -40,6 +63,12 @@
     # PY2 fallback
     from urlparse import urlparse  # pylint: disable=ungrouped-imports
 
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    # PY2 fallback
+    from collections import MutableMapping  # pylint: disable=ungrouped-imports
+
 try:
     from future_builtins import zip
 except ImportError:
@@ -60,6 +89,303 @@
 }
 
 
+def get_ratio(status):
+    """The ratio of upload/download of a libtorrent torrent status, -1.0 for infinity."""
+    if status.total_done > 0:
+        return status.all_time_upload / status.total_done
+    else:
+        return -1.0
+
+
+def get_seeds_peers_ratio(status):
+    """The ratio of seeds/peers of a libtorrent torrent status, -1.0 for infinity."""
+    if status.num_incomplete == 0:
+        return -1.0
+    return status.num_complete / status.num_incomplete
+
+
+def get_time_since_transfer(status):
+    """The time since either upload/download from peers of a libtorrent torrent status."""
+    time_since = (status.time_since_download, status.time_since_upload)
+    try:
+        return min(x for x in time_since if x != -1)
+    except ValueError:
+        return -1
+
+
+# The status keys only depending on the libtorrent torrent status and the
+# expression of their value from it.
+LT_STATUS_EXPRESSIONS = {
+    'active_time': 'status.active_time',
+    'all_time_download': 'status.all_time_download',
+    'completed_time': 'status.completed_time',
+    'distributed_copies': 'max(0.0, status.distributed_copies)',
+    'download_payload_rate': 'status.download_payload_rate',
+    'finished_time': 'status.finished_time',
+    'is_seed': 'status.is_seeding',
+    'last_seen_complete': 'status.last_seen_complete',
+    'next_announce': 'status.next_announce.seconds',
+    'num_peers': 'status.num_peers - status.num_seeds',
+    'num_seeds': 'status.num_seeds',
+    'paused': 'status.paused',
+    'queue': 'status.queue_position',
+    'ratio': 'get_ratio(status)',
+    'seed_mode': 'status.seed_mode',
+    'seed_rank': 'status.seed_rank',
+    'seeding_time': 'status.seeding_time',
+    # Use -1.0 to signify infinity
+    'seeds_peers_ratio': 'get_seeds_peers_ratio(status)',
+    # sparse or allocate
+    'storage_mode': "status.storage_mode.name.split('_')[2]",
+    'super_seeding': 'status.super_seeding',
+    'time_added': 'status.added_time',
+    'time_since_download': 'status.time_since_download',
+    'time_since_transfer': 'get_time_since_transfer(status)',
+    'time_since_upload': 'status.time_since_upload',
+    'total_done': 'status.total_done',
+    'total_payload_download': 'status.total_payload_download',
+    'total_payload_upload': 'status.total_payload_upload',
+    'total_peers': 'status.num_incomplete',
+    'total_remaining': 'status.total_wanted - status.total_wanted_done',
+    'total_seeds': 'status.num_complete',
+    'total_uploaded': 'status.all_time_upload',
+    'total_wanted': 'status.total_wanted',
+    'tracker': 'status.current_tracker',
+    'upload_payload_rate': 'status.upload_payload_rate',
+}
+
+# The expression of the value of each status key from the torrent, its
+# libtorrent status and its options.
+STATUS_EXPRESSIONS = {
+    'file_priorities': 'torrent.get_file_priorities()',
+    'hash': 'torrent.torrent_id',
+    'auto_managed': "options['auto_managed']",
+    'is_auto_managed': "options['auto_managed']",
+    'is_finished': 'torrent.is_finished',
+    'max_connections': "options['max_connections']",
+    'max_download_speed': "options['max_download_speed']",
+    'max_upload_slots': "options['max_upload_slots']",
+    'max_upload_speed': "options['max_upload_speed']",
+    'message': 'torrent.statusmsg',
+    # Deprecated: move_completed_path
+    'move_on_completed_path': "options['move_completed_path']",
+    # Deprecated: Use move_completed
+    'move_on_completed': "options['move_completed']",
+    'move_completed_path': "options['move_completed_path']",
+    'move_completed': "options['move_completed']",
+    'owner': "options['owner']",
+    # Deprecated: Use prioritize_first_last_pieces
+    'prioritize_first_last': "options['prioritize_first_last_pieces']",
+    'prioritize_first_last_pieces': "options['prioritize_first_last_pieces']",
+    'sequential_download': "options['sequential_download']",
+    'progress': 'torrent.get_progress()',
+    'shared': "options['shared']",
+    'remove_at_ratio': "options['remove_at_ratio']",
+    # Deprecated: Use download_location
+    'save_path': "options['download_location']",
+    'download_location': "options['download_location']",
+    'state': 'torrent.state',
+    'stop_at_ratio': "options['stop_at_ratio']",
+    'stop_ratio': "options['stop_ratio']",
+    'tracker_host': 'torrent.get_tracker_host()',
+    'trackers': 'torrent.trackers',
+    'tracker_status': 'torrent.tracker_status',
+    'comment': "decode_bytes(torrent.torrent_info.comment()) "
+    "if torrent.has_metadata else ''",
+    'creator': "decode_bytes(torrent.torrent_info.creator()) "
+    "if torrent.has_metadata else ''",
+    'num_files': 'torrent.torrent_info.num_files() if torrent.has_metadata else 0',
+    'num_pieces': 'torrent.torrent_info.num_pieces() if torrent.has_metadata else 0',
+    'piece_length': 'torrent.torrent_info.piece_length() '
+    'if torrent.has_metadata else 0',
+    'private': 'torrent.torrent_info.priv() if torrent.has_metadata else False',
+    'total_size': 'torrent.torrent_info.total_size() if torrent.has_metadata else 0',
+    'eta': 'torrent.get_eta()',
+    'file_progress': 'torrent.get_file_progress()',
+    'files': 'torrent.get_files()',
+    'orig_files': 'torrent.get_orig_files()',
+    'peers': 'torrent.get_peers()',
+    'sum_peers': 'torrent.get_sum_peers()',
+    'name': 'torrent.get_name()',
+    'pieces': 'torrent._get_pieces_info()',
+    'pieces_packed': 'pack_pieces(torrent._get_piece_states())',
+}
+STATUS_EXPRESSIONS.update(LT_STATUS_EXPRESSIONS)
+
+STATUS_GETTER_CACHE_SIZE = 256
+
+TORRENT_GETTER_SOURCE = """def getter(torrent):
+    status = torrent.status
+    options = torrent.options
+    return %s
+"""
+LT_STATUS_GETTER_SOURCE = """def getter(status):
+    return %s
+"""
+
+
+def _compile_getter(source):
+    """Compiles the source of a getter function using the status helpers."""
+    namespace = {
+        'decode_bytes': decode_bytes,
+        'get_ratio': get_ratio,
+        'get_seeds_peers_ratio': get_seeds_peers_ratio,
+        'get_time_since_transfer': get_time_since_transfer,
+        'pack_pieces': pack_pieces,
+    }
+    exec(compile(source, '<status getter>', 'exec'), namespace)
+    return namespace['getter']
+
+
+def compile_status_getter(keys):
+    """Compiles a function getting the status of a torrent for keys in one pass.
+
+    Args:
+        keys (tuple of str): The status keys, from STATUS_EXPRESSIONS.
+
+    Returns:
+        func: The function returning the status dict of the torrent given to it.
+
+    Raises:
+        KeyError: A key is not a status key.
+
+    """
+    items = ', '.join('%r: (%s)' % (key, STATUS_EXPRESSIONS[key]) for key in keys)
+    return _compile_getter(TORRENT_GETTER_SOURCE % ('{%s}' % items))
+
+
+_status_getters = {}
+
+
+def get_status_getter(keys):
+    """Returns the compiled status getter for keys, cached per key tuple.
+
+    Args:
+        keys (list of str): The status keys, from STATUS_EXPRESSIONS.
+
+    Returns:
+        func: The function returning the status dict of the torrent given to it.
+
+    """
+    keys = tuple(keys)
+    try:
+        return _status_getters[keys]
+    except KeyError:
+        if len(_status_getters) >= STATUS_GETTER_CACHE_SIZE:
+            _status_getters.clear()
+        getter = _status_getters[keys] = compile_status_getter(keys)
+        return getter
+
+
+# The function getting the value of each status key from a torrent.
+STATUS_GETTERS = {
+    key: _compile_getter(TORRENT_GETTER_SOURCE % expression)
+    for key, expression in STATUS_EXPRESSIONS.items()
+}
+
+# The function getting the value of each status-only key from a libtorrent status.
+LT_STATUS_GETTERS = {
+    key: _compile_getter(LT_STATUS_GETTER_SOURCE % expression)
+    for key, expression in LT_STATUS_EXPRESSIONS.items()
+}
+
+OPTION_STATUS_KEYS = {
+    'auto_managed': ('auto_managed', 'is_auto_managed'),
+    'download_location': ('download_location', 'save_path'),
+    'move_completed': ('move_completed', 'move_on_completed'),
+    'move_completed_path': ('move_completed_path', 'move_on_completed_path'),
+    'prioritize_first_last_pieces': (
+        'prioritize_first_last',
+        'prioritize_first_last_pieces',
+    ),
+    'stop_at_ratio': ('stop_at_ratio', 'eta'),
+    'stop_ratio': ('stop_ratio', 'eta'),
+}
+
+# The torrent info keys only change when the metadata is received.
+METADATA_STATUS_KEYS = (
+    'comment',
+    'creator',
+    'name',
+    'num_files',
+    'num_pieces',
+    'piece_length',
+    'private',
+    'total_size',
+    'files',
+    'orig_files',
+)
+
+VERSIONED_STATUS_KEYS = frozenset(
+    list(LT_STATUS_GETTERS)
+    + [key for keys in OPTION_STATUS_KEYS.values() for key in keys]
+    + list(METADATA_STATUS_KEYS)
+    + [
+        'hash',
+        'max_connections',
+        'max_download_speed',
+        'max_upload_slots',
+        'max_upload_speed',
+        'message',
+        'owner',
+        'progress',
+        'remove_at_ratio',
+        'sequential_download',
+        'shared',
+        'state',
+        'tracker_host',
+        'tracker_status',
+        'trackers',
+    ]
+)
+
+PREV_STATUS_IDLE_TIMEOUT = 300
+
+# Maps whether a piece is completed and available from peers to its state.
+PIECE_STATES = {
+    (True, True): PIECE_COMPLETED,
+    (True, False): PIECE_COMPLETED,
+    (False, True): PIECE_AVAILABLE,
+    (False, False): PIECE_MISSING,
+}
+
+# The number of distinct option defaults and tracker lists shared between torrents.
+SHARED_CACHE_SIZE = 4096
+# The status of a tracker that has not reported yet, as listed by libtorrent.
+TRACKER_STATUS_DEFAULTS = {
+    'trackerid': '',
+    'fail_limit': 0,
+    'source': 0,
+    'verified': False,
+    'message': '',
+    'last_error': {'value': 0, 'category': ''},
+    'next_announce': None,
+    'min_announce': None,
+    'scrape_incomplete': -1,
+    'scrape_complete': -1,
+    'scrape_downloaded': -1,
+    'fails': 0,
+    'updating': False,
+    'start_sent': False,
+    'complete_sent': False,
+    'endpoints': [],
+    'send_stats': False,
+}
+# The number of peer client names and countries cached.
+PEER_NAME_CACHE_SIZE = 8192
+# The seconds the peer info is reused for, unless the status is updated before.
+PEER_INFO_MAX_AGE = 1.5
+_REMOVED = object()
+
+# The digests are stored in a signed C long array on every platform.
+DIGEST_MASK = (1 << (8 * array(str('l')).itemsize - 1)) - 1
+
+
+def get_status_digest(value):
+    """Returns a digest of a status value to detect its changes."""
+    return hash(repr(value)) & DIGEST_MASK
+
+
 def sanitize_filepath(filepath, folder=False):
     """Returns a sanitized filepath to pass to libtorrent rename_file().
 
@@ -127,6 +453,50 @@ def convert_lt_files(files):
     return filelist
 
 
+class FileTable(object):
+    """The files of a torrent, stored as columns.
+
+    Args:
+        files (list): The libtorrent torrent files.
+
+    Attributes:
+        paths (tuple of str): The decoded path of each file.
+        sizes (array): The size of each file.
+        offsets (array): The offset of each file in the torrent data.
+    """
+
+    __slots__ = ('paths', 'sizes', 'offsets')
+
+    def __init__(self, files=()):
+        paths = []
+        self.sizes = array(str('q'))
+        self.offsets = array(str('q'))
+        for _file in files:
+            try:
+                file_path = _file.path.decode('utf8')
+            except AttributeError:
+                file_path = _file.path
+            paths.append(file_path.replace('\\', '/'))
+            self.sizes.append(_file.size)
+            self.offsets.append(_file.offset)
+        self.paths = tuple(paths)
+
+    def __len__(self):
+        return len(self.paths)
+
+    def to_list(self):
+        """Returns the files in the format of convert_lt_files."""
+        return [
+            {'index': index, 'path': path, 'size': size, 'offset': offset}
+            for index, (path, size, offset) in enumerate(
+                zip(self.paths, self.sizes, self.offsets)
+            )
+        ]
+
+
+EMPTY_FILE_TABLE = FileTable()
+
+
 class TorrentOptions(dict):
     """TorrentOptions create a dict of the torrent options.
 
@@ -191,6 +561,111 @@ def __init__(self):
         self['seed_mode'] = False
 
 
+_shared_options = {}
+
+
+def get_shared_options(options):
+    """Returns a dict equal to options, shared by every caller with the same options.
+
+    The returned dict must not be modified.
+
+    Args:
+        options (dict): The torrent options, see TorrentOptions class for valid keys.
+
+    Returns:
+        dict: The shared copy of options.
+
+    """
+    key = repr(sorted(options.items()))
+    try:
+        return _shared_options[key]
+    except KeyError:
+        if len(_shared_options) >= SHARED_CACHE_SIZE:
+            _shared_options.clear()
+        shared = _shared_options[key] = dict(options)
+        return shared
+
+
+class SharedTorrentOptions(MutableMapping):
+    """The torrent options, only storing the values differing from shared defaults.
+
+    The mutable default values are copied into the overrides when read so the
+    shared defaults are never modified.
+
+    Args:
+        defaults (dict): The default options, see get_shared_options.
+
+    """
+
+    __slots__ = ('defaults', 'overrides')
+
+    def __init__(self, defaults):
+        self.defaults = defaults
+        self.overrides = {}
+
+    def __getitem__(self, key):
+        try:
+            value = self.overrides[key]
+        except KeyError:
+            value = self.defaults[key]
+            if isinstance(value, (dict, list)):
+                value = self.overrides[key] = type(value)(value)
+            return value
+        if value is _REMOVED:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        default = self.defaults.get(key, _REMOVED)
+        if type(default) is type(value) and default == value:
+            self.overrides.pop(key, None)
+        else:
+            self.overrides[key] = value
+
+    def __delitem__(self, key):
+        self[key]
+        if key in self.defaults:
+            self.overrides[key] = _REMOVED
+        else:
+            del self.overrides[key]
+
+    def __iter__(self):
+        overrides = self.overrides
+        for key in self.defaults:
+            if overrides.get(key) is not _REMOVED:
+                yield key
+        for key in [key for key in overrides if key not in self.defaults]:
+            yield key
+
+    def __len__(self):
+        return sum(1 for dummy in self)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+_tracker_entries = {}
+
+
+def intern_trackers(trackers):
+    """Returns the url and tier pairs of trackers, shared by torrents with the same.
+
+    Args:
+        trackers (list of dict): The trackers with url and tier keys.
+
+    Returns:
+        tuple: The (url, tier) tuple of each tracker.
+
+    """
+    if len(_tracker_entries) >= SHARED_CACHE_SIZE:
+        _tracker_entries.clear()
+    entries = tuple(
+        _tracker_entries.setdefault(entry, entry)
+        for entry in ((tracker['url'], tracker['tier']) for tracker in trackers)
+    )
+    return _tracker_entries.setdefault(entries, entries)
+
+
 class TorrentError(object):
     def __init__(self, error_message, was_paused=False, restart_to_resume=False):
         self.error_message = error_message
@@ -198,6 +673,239 @@ def __init__(self, error_message, was_paused=False, restart_to_resume=False):
         self.restart_to_resume = restart_to_resume
 
 
+class PrevStatus(object):
+    """The compact status of a torrent last sent to a session.
+
+    The values are not kept: the versioned keys are diffed against the change
+    versions of the torrent and the untracked keys against a digest of their value.
+
+    Args:
+        keys (tuple of str): The keys sent to the session.
+        untracked_keys (tuple of str): The keys not in VERSIONED_STATUS_KEYS.
+        watermark (int): The status_version of the torrent when sent.
+        digests (array): The digest of the value of each untracked key.
+
+    """
+
+    __slots__ = ('keys', 'untracked_keys', 'watermark', 'digests', 'size')
+
+    def __init__(self, keys, untracked_keys, watermark, digests):
+        self.keys = keys
+        self.untracked_keys = untracked_keys
+        self.watermark = watermark
+        self.digests = digests
+        self.size = 0
+
+
+class SessionPrevStatus(object):
+    """The previous status of the torrents diffed by a session, in LRU order."""
+
+    __slots__ = ('torrents', 'memory', 'last_used')
+
+    def __init__(self):
+        self.torrents = OrderedDict()
+        self.memory = 0
+        self.last_used = time.time()
+
+
+class PrevStatusCache(object):
+    """The previous status of the torrents for each session diffing them.
+
+    Each session may use up to memory_limit bytes, past which the torrents it
+    diffed least recently are evicted and sent in full on their next diff.
+    Sessions are kept in the order they last diffed, so the idle ones are evicted
+    first by cleanup.
+
+    Args:
+        memory_limit (int): The memory budget of each session in bytes.
+
+    """
+
+    def __init__(self, memory_limit):
+        self.memory_limit = memory_limit
+        self.sessions = OrderedDict()
+        self.memory = 0
+        self.evictions = 0
+
+    def get(self, session_id, torrent_id):
+        """Returns the previous status of a torrent for a session.
+
+        Args:
+            session_id (int): The session ID.
+            torrent_id (str): The torrent ID.
+
+        Returns:
+            PrevStatus: The previous status or None if not diffed before.
+
+        """
+        session = self.sessions.get(session_id)
+        if session is None:
+            return None
+        session.last_used = time.time()
+        if next(reversed(self.sessions)) != session_id:
+            self.sessions[session_id] = self.sessions.pop(session_id)
+        try:
+            prev_status = session.torrents.pop(torrent_id)
+        except KeyError:
+            return None
+        session.torrents[torrent_id] = prev_status
+        return prev_status
+
+    def store(self, session_id, torrent_id, prev_status):
+        """Stores the previous status of a torrent for a session.
+
+        Args:
+            session_id (int): The session ID.
+            torrent_id (str): The torrent ID.
+            prev_status (PrevStatus): The status sent to the session.
+
+        """
+        session = self.sessions.get(session_id)
+        if session is None:
+            session = self.sessions[session_id] = SessionPrevStatus()
+        old_status = session.torrents.pop(torrent_id, None)
+        if old_status is not None:
+            session.memory -= old_status.size
+            self.memory -= old_status.size
+        # The keys are shared by the torrents of a request so are not counted.
+        prev_status.size = sys.getsizeof(prev_status) + sys.getsizeof(
+            prev_status.digests
+        )
+        session.torrents[torrent_id] = prev_status
+        session.memory += prev_status.size
+        self.memory += prev_status.size
+        self.evict(session)
+
+    def evict(self, session):
+        """Evicts the least recently diffed torrents of a session over budget."""
+        while session.memory > self.memory_limit and session.torrents:
+            __, evicted = session.torrents.popitem(last=False)
+            session.memory -= evicted.size
+            self.memory -= evicted.size
+            self.evictions += 1
+
+    def set_memory_limit(self, memory_limit):
+        """Sets the memory budget of each session, evicting past it."""
+        self.memory_limit = memory_limit
+        for session in self.sessions.values():
+            self.evict(session)
+
+    def remove_torrent(self, torrent_id):
+        """Removes the previous status of a torrent for all sessions."""
+        for session in self.sessions.values():
+            prev_status = session.torrents.pop(torrent_id, None)
+            if prev_status is not None:
+                session.memory -= prev_status.size
+                self.memory -= prev_status.size
+
+    def remove_session(self, session_id):
+        """Removes the previous status of all torrents for a session."""
+        session = self.sessions.pop(session_id, None)
+        if session is not None:
+            self.memory -= session.memory
+
+    def cleanup(self, is_session_valid, idle_timeout=PREV_STATUS_IDLE_TIMEOUT):
+        """Removes the sessions no longer valid or idle for too long.
+
+        Args:
+            is_session_valid (func): Returns if a session ID is still valid.
+            idle_timeout (int): Seconds after which a session is idle.
+
+        """
+        idle_since = time.time() - idle_timeout
+        for session_id, session in list(self.sessions.items()):
+            if session.last_used < idle_since or not is_session_valid(session_id):
+                self.remove_session(session_id)
+
+    def get_memory_status(self):
+        """Returns the memory use of the previous status for session status."""
+        return {
+            'prev_status_memory': self.memory,
+            'prev_status_sessions': len(self.sessions),
+            'prev_status_evictions': self.evictions,
+        }
+
+
+class PeerNameCache(object):
+    """The decoded client names and countries of peers, shared by the torrents.
+
+    Both are kept in least recently used order and bounded to size entries.
+
+    Args:
+        size (int): The number of client names and of countries to keep.
+
+    Attributes:
+        clients (OrderedDict): The client name of each raw client string.
+        countries (OrderedDict): The country code of each peer ip.
+        geoip: The GeoIP database the countries were looked up in.
+    """
+
+    __slots__ = ('size', 'clients', 'countries', 'geoip')
+
+    def __init__(self, size):
+        self.size = size
+        self.clients = OrderedDict()
+        self.countries = OrderedDict()
+        self.geoip = None
+
+    def _get(self, cache, key, func):
+        try:
+            value = cache.pop(key)
+        except KeyError:
+            value = func(key)
+            if len(cache) >= self.size:
+                cache.popitem(last=False)
+        cache[key] = value
+        return value
+
+    def get_client(self, peer):
+        """Returns the decoded client name of a libtorrent peer_info."""
+        try:
+            client = peer.client
+        except UnicodeDecodeError:
+            # libtorrent on Py3 can raise UnicodeDecodeError for peer_info.client
+            return 'unknown'
+        return self._get(self.clients, client, decode_peer_client)
+
+    def get_country(self, geoip, ip):
+        """Returns the country code of a peer ip, empty if unknown.
+
+        Args:
+            geoip: The GeoIP database, None if it is not available.
+            ip (str): The peer ip.
+
+        """
+        if geoip is None:
+            return ''
+        if geoip is not self.geoip:
+            self.countries.clear()
+            self.geoip = geoip
+        return self._get(
+            self.countries,
+            ip,
+            lambda ip: sanitize_country(geoip.country_code_by_addr(ip)),
+        )
+
+
+def decode_peer_client(client):
+    """Decodes the client name reported by a peer."""
+    try:
+        return decode_bytes(client)
+    except UnicodeDecodeError:
+        return 'unknown'
+
+
+def sanitize_country(country):
+    """Replaces the non-letters of a GeoIP country code with spaces."""
+    try:
+        return ''.join([char if char.isalpha() else ' ' for char in country])
+    except TypeError:
+        return ''
+
+
+_peer_names = PeerNameCache(PEER_NAME_CACHE_SIZE)
+
+
 class Torrent(object):
     """Torrent holds information about torrents added to the libtorrent session.
 
@@ -213,12 +921,15 @@ class Torrent(object):
         handle: Holds the libtorrent torrent handle
         magnet (str): The magnet URI used to add this torrent (if available).
         status: Holds status info so that we don"t need to keep getting it from libtorrent.
+        peer_info (list): The libtorrent peer info fetched since the last status update.
+        peer_info_time (float): The time the peer info was fetched.
         torrent_info: store the torrent info.
         has_metadata (bool): True if the metadata for the torrent is available, False otherwise.
-        status_funcs (dict): The function mappings to get torrent status
-        prev_status (dict): Previous status dicts returned for this torrent. We use this to return
-            dicts that only contain changes from the previous.
-            {session_id: status_dict, ...}
+        prev_status (PrevStatusCache): The status last returned to each session for
+            the torrents, shared with the TorrentManager. We use this to return dicts
+            that only contain changes from the previous.
+        status_version (int): Incremented on each recorded change of the status keys.
+        key_versions (dict): The status_version of the last change of each status key.
         waiting_on_folder_rename (list of dict): A list of Deferreds for file indexes we're waiting for file_rename
             alerts on. This is so we can send one folder_renamed signal instead of multiple file_renamed signals.
             [{index: Deferred, ...}, ...]
@@ -227,7 +938,11 @@ class Torrent(object):
         is_finished (bool): Keep track if torrent is finished to prevent some weird things on state load.
         statusmsg (str): Status message holds error/extra info about the torrent.
         state (str): The torrent's state
-        trackers (list of dict): The torrent's trackers
+        trackers (list of dict): The torrent's trackers, with their last reported status.
+        tracker_entries (tuple): The (url, tier) pair of each tracker, shared by the
+            torrents with the same trackers.
+        tracker_messages (dict): The last reported status of each tracker url, None
+            until a tracker reports.
         tracker_status (str): Status message of currently connected tracker
         tracker_host (str): Hostname of the currently connected tracker
         forcing_recheck (bool): Keep track if we're forcing a recheck of the torrent
@@ -236,6 +951,39 @@ class Torrent(object):
         forced_error (TorrentError): Keep track if we have forced this torrent to be in Error state.
     """
 
+    __slots__ = (
+        'torrent_id',
+        'config',
+        'rpcserver',
+        'handle',
+        'magnet',
+        'status',
+        'torrent_info',
+        'has_metadata',
+        'status_version',
+        'key_versions',
+        'versioned_status',
+        'options',
+        'file_table',
+        'orig_file_table',
+        'peer_info',
+        'peer_info_time',
+        'tracker_entries',
+        'tracker_messages',
+        'is_finished',
+        'filename',
+        'forced_error',
+        'statusmsg',
+        'state',
+        'moving_storage_dest_path',
+        'tracker_status',
+        'tracker_host',
+        'forcing_recheck',
+        'forcing_recheck_paused',
+        'prev_status',
+        'waiting_on_folder_rename',
+    )
+
     def __init__(self, handle, options, state=None, filename=None, magnet=None):
         self.torrent_id = str(handle.info_hash())
         if log.isEnabledFor(logging.DEBUG):
@@ -249,11 +997,18 @@ def __init__(self, handle, options, state=None, filename=None, magnet=None):
 
         self.magnet = magnet
         self.status = self.handle.status()
+        self.peer_info = None
+        self.peer_info_time = 0
 
         self.torrent_info = self.handle.get_torrent_info()
         self.has_metadata = self.status.has_metadata
+        self.file_table = None
+        self.orig_file_table = None
 
-        self.options = TorrentOptions()
+        self.status_version = 0
+        self.key_versions = {}
+
+        self.options = SharedTorrentOptions(get_shared_options(TorrentOptions()))
         self.options.update(options)
 
         # Load values from state if we have it
@@ -274,12 +1029,11 @@ def __init__(self, handle, options, state=None, filename=None, magnet=None):
         self.tracker_host = None
         self.forcing_recheck = False
         self.forcing_recheck_paused = False
-        self.status_funcs = None
-        self.prev_status = {}
+        self.prev_status = component.get('TorrentManager').prev_status
         self.waiting_on_folder_rename = []
 
         self.update_status(self.handle.status())
-        self._create_status_funcs()
+        self.versioned_status = self.status
         self.set_options(self.options)
         self.update_state()
 
@@ -290,6 +1044,8 @@ def on_metadata_received(self):
         """Process the metadata received alert for this torrent"""
         self.has_metadata = True
         self.torrent_info = self.handle.get_torrent_info()
+        self.file_table = self.orig_file_table = None
+        self.mark_changed(METADATA_STATUS_KEYS)
         if self.options['prioritize_first_last_pieces']:
             self.set_prioritize_first_last_pieces(True)
         self.write_torrentfile()
@@ -304,8 +1060,9 @@ def set_options(self, options):
 
         # Skip set_prioritize_first_last if set_file_priorities is in options as it also calls the method.
         if 'file_priorities' in options and 'prioritize_first_last_pieces' in options:
-            self.options['prioritize_first_last_pieces'] = options.pop(
-                'prioritize_first_last_pieces'
+            self._set_option(
+                'prioritize_first_last_pieces',
+                options.pop('prioritize_first_last_pieces'),
             )
 
         for key, value in options.items():
@@ -315,7 +1072,24 @@ def set_options(self, options):
                     options_set_func(value)
                 else:
                     # Update config options that do not have funcs
-                    self.options[key] = value
+                    self._set_option(key, value)
+
+    def _set_option(self, key, value):
+        """Sets a torrent option, recording the change of its status keys."""
+        old_value = self.options.get(key)
+        self.options[key] = value
+        if old_value != value:
+            self.mark_changed(OPTION_STATUS_KEYS.get(key, (key,)))
+            if key == 'owner':
+                component.get('TorrentManager').update_owner_index(
+                    self.torrent_id, old_value
+                )
+            elif key == 'shared':
+                component.get('TorrentManager').update_owner_index(
+                    self.torrent_id, self.options['owner']
+                )
+            elif key in ('stop_at_ratio', 'stop_ratio', 'remove_at_ratio'):
+                component.get('TorrentManager').schedule_ratio_check(self.torrent_id)
 
     def get_options(self):
         """Get the torrent options.
@@ -323,7 +1097,7 @@ def get_options(self):
         Returns:
             dict: the torrent options.
         """
-        return self.options
+        return dict(self.options)
 
     def set_max_connections(self, max_connections):
         """Sets maximum number of connections this torrent will open.
@@ -341,7 +1115,7 @@ def set_max_connections(self, max_connections):
         elif max_connections == 1:
             max_connections = 2
 
-        self.options['max_connections'] = max_connections
+        self._set_option('max_connections', max_connections)
         self.handle.set_max_connections(max_connections)
 
     def set_max_upload_slots(self, max_slots):
@@ -350,7 +1124,7 @@ def set_max_upload_slots(self, max_slots):
         Args:
             max_slots (int): Maximum upload slots
         """
-        self.options['max_upload_slots'] = max_slots
+        self._set_option('max_upload_slots', max_slots)
         self.handle.set_max_uploads(max_slots)
 
     def set_max_upload_speed(self, m_up_speed):
@@ -359,7 +1133,7 @@ def set_max_upload_speed(self, m_up_speed):
         Args:
             m_up_speed (float): Maximum upload speed in KiB/s.
         """
-        self.options['max_upload_speed'] = m_up_speed
+        self._set_option('max_upload_speed', m_up_speed)
         if m_up_speed < 0:
             value = -1
         else:
@@ -372,7 +1146,7 @@ def set_max_download_speed(self, m_down_speed):
         Args:
             m_up_speed (float): Maximum download speed in KiB/s.
         """
-        self.options['max_download_speed'] = m_down_speed
+        self._set_option('max_download_speed', m_down_speed)
         if m_down_speed < 0:
             value = -1
         else:
@@ -394,7 +1168,7 @@ def set_prioritize_first_last_pieces(self, prioritize):
         if not self.has_metadata:
             return
 
-        self.options['prioritize_first_last_pieces'] = prioritize
+        self._set_option('prioritize_first_last_pieces', prioritize)
         if not prioritize:
             # If we are turning off this option, call set_file_priorities to
             # reset all the piece priorities
@@ -434,7 +1208,7 @@ def set_sequential_download(self, set_sequencial):
         Args:
             set_sequencial (bool): Enable sequencial downloading.
         """
-        self.options['sequential_download'] = set_sequencial
+        self._set_option('sequential_download', set_sequencial)
         self.handle.set_sequential_download(set_sequencial)
 
     def set_auto_managed(self, auto_managed):
@@ -443,7 +1217,7 @@ def set_auto_managed(self, auto_managed):
         Args:
             auto_managed (bool): Enable auto managed.
         """
-        self.options['auto_managed'] = auto_managed
+        self._set_option('auto_managed', auto_managed)
         if not (self.status.paused and not self.status.auto_managed):
             self.handle.auto_managed(auto_managed)
             self.update_state()
@@ -454,7 +1228,7 @@ def set_super_seeding(self, super_seeding):
         Args:
             super_seeding (bool): Enable super seeding.
         """
-        self.options['super_seeding'] = super_seeding
+        self._set_option('super_seeding', super_seeding)
         self.handle.super_seeding(super_seeding)
 
     def set_stop_ratio(self, stop_ratio):
@@ -463,7 +1237,7 @@ def set_stop_ratio(self, stop_ratio):
         Args:
             stop_ratio (float): The seeding ratio.
         """
-        self.options['stop_ratio'] = stop_ratio
+        self._set_option('stop_ratio', stop_ratio)
 
     def set_stop_at_ratio(self, stop_at_ratio):
         """Stop the torrent when it has reached stop_ratio.
@@ -471,7 +1245,7 @@ def set_stop_at_ratio(self, stop_at_ratio):
         Args:
             stop_at_ratio (bool): Stop the torrent.
         """
-        self.options['stop_at_ratio'] = stop_at_ratio
+        self._set_option('stop_at_ratio', stop_at_ratio)
 
     def set_remove_at_ratio(self, remove_at_ratio):
         """Remove the torrent when it has reached the stop_ratio.
@@ -479,7 +1253,7 @@ def set_remove_at_ratio(self, remove_at_ratio):
         Args:
             remove_at_ratio (bool): Remove the torrent.
         """
-        self.options['remove_at_ratio'] = remove_at_ratio
+        self._set_option('remove_at_ratio', remove_at_ratio)
 
     def set_move_completed(self, move_completed):
         """Set whether to move the torrent when downloading has finished.
@@ -488,7 +1262,7 @@ def set_move_completed(self, move_completed):
             move_completed (bool): Move the torrent.
 
         """
-        self.options['move_completed'] = move_completed
+        self._set_option('move_completed', move_completed)
 
     def set_move_completed_path(self, move_completed_path):
         """Set the path to move torrent to when downloading has finished.
@@ -496,7 +1270,7 @@ def set_move_completed_path(self, move_completed_path):
         Args:
             move_completed_path (str): The move path.
         """
-        self.options['move_completed_path'] = move_completed_path
+        self._set_option('move_completed_path', move_completed_path)
 
     def set_file_priorities(self, file_priorities):
         """Sets the file priotities.
@@ -512,7 +1286,7 @@ def set_file_priorities(self, file_priorities):
                 'Setting %s file priorities to: %s', self.torrent_id, file_priorities
             )
 
-        if file_priorities and len(file_priorities) == len(self.get_files()):
+        if file_priorities and len(file_priorities) == len(self.get_file_table()):
             self.handle.prioritize_files(file_priorities)
         else:
             log.debug('Unable to set new file priorities.')
@@ -528,7 +1302,7 @@ def set_file_priorities(self, file_priorities):
                     break
 
         # Store the priorities.
-        self.options['file_priorities'] = file_priorities
+        self._set_option('file_priorities', file_priorities)
 
         # Set the first/last priorities if needed.
         if self.options['prioritize_first_last_pieces']:
@@ -541,7 +1315,7 @@ def set_save_path(self, download_location):
 
     def set_download_location(self, download_location):
         """The location for downloading torrent data."""
-        self.options['download_location'] = download_location
+        self._set_option('download_location', download_location)
 
     def set_owner(self, account):
         """Sets the owner of this torrent.
@@ -555,10 +1329,22 @@ def set_owner(self, account):
         """
 
         if self.rpcserver.get_session_auth_level() == AUTH_LEVEL_ADMIN:
-            self.options['owner'] = account
+            self._set_option('owner', account)
 
     # End Options methods #
 
+    @property
+    def trackers(self):
+        """list of dict: The torrent's trackers, with their last reported status."""
+        messages = self.tracker_messages or {}
+        trackers = []
+        for url, tier in self.tracker_entries:
+            tracker = dict(messages.get(url, TRACKER_STATUS_DEFAULTS))
+            tracker['url'] = url
+            tracker['tier'] = tier
+            trackers.append(tracker)
+        return trackers
+
     def set_trackers(self, trackers=None):
         """Sets the trackers for this torrent.
 
@@ -566,8 +1352,10 @@ def set_trackers(self, trackers=None):
             trackers (list of dicts): A list of trackers.
         """
         if trackers is None:
-            self.trackers = [tracker for tracker in self.handle.trackers()]
+            self.tracker_entries = intern_trackers(self.handle.trackers())
+            self.tracker_messages = None
             self.tracker_host = None
+            self.mark_changed(('trackers', 'tracker_host'))
             return
 
         if log.isEnabledFor(logging.DEBUG):
@@ -587,13 +1375,15 @@ def set_trackers(self, trackers=None):
             for tracker in self.handle.trackers():
                 log.debug(' [tier %s]: %s', tracker['tier'], tracker['url'])
         # Set the tracker list in the torrent object
-        self.trackers = self.handle.trackers()
+        self.tracker_entries = intern_trackers(self.handle.trackers())
+        self.tracker_messages = None
         if len(trackers) > 0:
             # Force a re-announce if there is at least 1 tracker
             # replace_trackers(tracker_list) func will reannounce new trackers list
             # self.force_reannounce()
             pass
         self.tracker_host = None
+        self.mark_changed(('trackers', 'tracker_host'))
 
     def set_tracker_status(self, status, tracker_url):
         """Sets the tracker status.
@@ -609,20 +1399,23 @@ def set_tracker_status(self, status, tracker_url):
         self.update_status(self.handle.status())
         for tracker in self.handle.trackers():
             if tracker_url == tracker['url']:
-                for current_tracker in self.trackers:
-                    if tracker_url == current_tracker['url']:
-                        current_tracker.update(tracker)
-                        current_tracker['message'] = status
-                        if status == 'Announce OK':
-                            current_tracker['scrape_complete'] = self.status.num_complete
-                            current_tracker['scrape_incomplete'] = self.status.num_incomplete
-                        break
+                # Only the trackers that reported keep their status.
+                if self.tracker_messages is None:
+                    self.tracker_messages = {}
+                del tracker['url'], tracker['tier']
+                tracker['message'] = status
+                if status == 'Announce OK':
+                    tracker['scrape_complete'] = self.status.num_complete
+                    tracker['scrape_incomplete'] = self.status.num_incomplete
+                self.tracker_messages[tracker_url] = tracker
                 break
 
         self.tracker_host = None
+        self.mark_changed(('trackers', 'tracker_host'))
 
         if self.tracker_status != status:
             self.tracker_status = status
+            self.mark_changed(('tracker_status',))
             component.get('EventManager').emit(
                 TorrentTrackerStatusEvent(self.torrent_id, self.tracker_status)
             )
@@ -670,6 +1463,8 @@ def update_state(self):
             self.state = LT_TORRENT_STATE_MAP.get(str(status.state), str(status.state))
 
         if self.state != old_state:
+            self.mark_changed(('state', 'progress', 'eta'))
+            component.get('TorrentManager').schedule_ratio_check(self.torrent_id)
             component.get('EventManager').emit(
                 TorrentStateChangedEvent(self.torrent_id, self.state)
             )
@@ -699,6 +1494,8 @@ def set_status_message(self, message=None):
         """
         if not message:
             message = 'OK'
+        if self.statusmsg != message:
+            self.mark_changed(('message',))
         self.statusmsg = message
 
     def force_error_state(self, message, restart_to_resume=True):
@@ -766,10 +1563,7 @@ def get_ratio(self):
             float: The ratio or -1.0 (for infinity).
 
         """
-        if self.status.total_done > 0:
-            return self.status.all_time_upload / self.status.total_done
-        else:
-            return -1.0
+        return get_ratio(self.status)
 
     def get_files(self):
         """Get the files this torrent contains.
@@ -778,11 +1572,7 @@ def get_files(self):
             list of dict: The files.
 
         """
-        if not self.has_metadata:
-            return []
-
-        files = self.torrent_info.files()
-        return convert_lt_files(files)
+        return self.get_file_table().to_list()
 
     def get_orig_files(self):
         """Get the original filenames of files in this torrent.
@@ -791,11 +1581,33 @@ def get_orig_files(self):
             list of dict: The files with original filenames.
 
         """
-        if not self.has_metadata:
-            return []
+        return self.get_file_table(orig=True).to_list()
+
+    def get_file_table(self, orig=False):
+        """Get the files of this torrent as columns, cached until they are renamed.
+
+        Args:
+            orig (bool): Get the original filenames of the files.
 
-        files = self.torrent_info.orig_files()
-        return convert_lt_files(files)
+        Returns:
+            FileTable: The files, empty until the metadata is received.
+
+        """
+        if not self.has_metadata:
+            return EMPTY_FILE_TABLE
+        if orig:
+            if self.orig_file_table is None:
+                self.orig_file_table = FileTable(self.torrent_info.orig_files())
+            return self.orig_file_table
+        if self.file_table is None:
+            self.file_table = FileTable(self.torrent_info.files())
+        return self.file_table
+
+    def on_file_renamed(self):
+        """Drops the cached files after libtorrent renamed one of them."""
+        self.file_table = None
+        # The name of the torrent is the top-level folder of its files.
+        self.mark_changed(('files', 'name'))
 
     def get_peers(self):
         """Get the peers for this torrent.
@@ -819,32 +1631,15 @@ def get_peers(self):
                 }
         """
         ret = []
-        peers = self.handle.get_peer_info()
-        for peer in peers:
+        geoip = component.get('Core').geoip_instance
+        for peer in self.get_peer_info():
 
             # We do not want to report peers that are half-connected
             if peer.flags & peer.connecting or peer.flags & peer.handshake:
                 continue
 
-            try:
-                client = decode_bytes(peer.client)
-            except UnicodeDecodeError:
-                # libtorrent on Py3 can raise UnicodeDecodeError for peer_info.client
-                client = 'unknown'
-
-            try:
-                country = component.get('Core').geoip_instance.country_code_by_addr(
-                    peer.ip[0]
-                )
-            except AttributeError:
-                country = ''
-            else:
-                try:
-                    country = ''.join(
-                        [char if char.isalpha() else ' ' for char in country]
-                    )
-                except TypeError:
-                    country = ''
+            client = _peer_names.get_client(peer)
+            country = _peer_names.get_country(geoip, peer.ip[0])
             flags = ''
             flags = {
                 peer.flags & 65536 > 0: 'I2P',
@@ -870,6 +1665,22 @@ def get_peers(self):
             )
         return ret
 
+    def get_peer_info(self):
+        """Get the libtorrent peer info, fetched once per status update.
+
+        The peer info is fetched again once older than PEER_INFO_MAX_AGE, in case the
+        status of the torrent is not updated.
+
+        Returns:
+            list: The libtorrent peer_info of each peer.
+
+        """
+        now = time.time()
+        if self.peer_info is None or now - self.peer_info_time >= PEER_INFO_MAX_AGE:
+            self.peer_info = self.handle.get_peer_info()
+            self.peer_info_time = now
+        return self.peer_info
+
     def get_sum_peers(self):
         """Get the calculated number of dht, pex, lsd peers for this torrent.
 
@@ -879,7 +1690,7 @@ def get_sum_peers(self):
         """
         ret = []
         dht_peers = dht_seeds = pex_peers = pex_seeds = lsd_peers = lsd_seeds = 0
-        for peer in self.handle.get_peer_info():
+        for peer in self.get_peer_info():
             if peer.source & peer.dht:
                 if peer.flags & peer.seed:
                     dht_seeds += 1
@@ -935,9 +1746,9 @@ def get_file_progress(self):
         if not self.has_metadata:
             return []
         return [
-            progress / _file.size if _file.size else 0.0
-            for progress, _file in zip(
-                self.handle.file_progress(), self.torrent_info.files()
+            progress / size if size else 0.0
+            for progress, size in zip(
+                self.handle.file_progress(), self.get_file_table().sizes
             )
         ]
 
@@ -953,8 +1764,8 @@ def get_tracker_host(self):
             return self.tracker_host
 
         tracker = self.status.current_tracker
-        if not tracker and self.trackers:
-            tracker = self.trackers[0]['url']
+        if not tracker and self.tracker_entries:
+            tracker = self.tracker_entries[0][0]
 
         if tracker:
             url = urlparse(tracker.replace('udp://', 'http://'))
@@ -1027,7 +1838,7 @@ def get_size(files, path):
         elif self.state == 'Moving':
             # Check if torrent has downloaded any data yet.
             if self.status.total_done:
-                torrent_files = [f['path'] for f in self.get_files()]
+                torrent_files = self.get_file_table().paths
                 dest_path_size = get_size(torrent_files, self.moving_storage_dest_path)
                 progress = dest_path_size / self.status.total_done * 100
             else:
@@ -1039,11 +1850,7 @@ def get_size(files, path):
 
     def get_time_since_transfer(self):
         """The time since either upload/download from peers"""
-        time_since = (self.status.time_since_download, self.status.time_since_upload)
-        try:
-            return min(x for x in time_since if x != -1)
-        except ValueError:
-            return -1
+        return get_time_since_transfer(self.status)
 
     def get_status(self, keys, diff=False, update=False, all_keys=False):
         """Returns the status of the torrent based on the keys provided
@@ -1062,32 +1869,117 @@ def get_status(self, keys, diff=False, update=False, all_keys=False):
             self.update_status(self.handle.status())
 
         if all_keys:
-            keys = list(self.status_funcs)
+            keys = list(STATUS_EXPRESSIONS)
 
-        status_dict = {}
+        if diff:
+            return self.get_status_diff(keys)
 
-        for key in keys:
-            status_dict[key] = self.status_funcs[key]()
+        return get_status_getter(keys)(self)
 
-        if diff:
-            session_id = self.rpcserver.get_session_id()
-            if session_id in self.prev_status:
-                # We have a previous status dict, so lets make a diff
-                status_diff = {}
-                for key, value in status_dict.items():
-                    if key in self.prev_status[session_id]:
-                        if value != self.prev_status[session_id][key]:
-                            status_diff[key] = value
-                    else:
-                        status_diff[key] = value
+    def get_status_diff(self, keys, untracked_keys=None):
+        """Returns the changes of the status since the last diff for the session.
 
-                self.prev_status[session_id] = status_dict
-                return status_diff
+        Only the keys changed since the watermark of the session, the keys new to
+        the session and the keys without a change version are computed, so the diff
+        of an idle torrent costs next to nothing.
 
-            self.prev_status[session_id] = status_dict
-            return status_dict
+        Args:
+            keys (list of str): The keys to get the status on.
+            untracked_keys (list of str, optional): The keys not in
+                VERSIONED_STATUS_KEYS, given when diffing many torrents for the same
+                keys. Defaults to the ones found in keys.
 
-        return status_dict
+        Returns:
+            dict: The status keys that have changed and their values.
+        """
+        session_id = self.rpcserver.get_session_id()
+        if self.status is not self.versioned_status:
+            self.update_status_versions()
+
+        keys = tuple(keys)
+        if untracked_keys is None:
+            untracked_keys = [key for key in keys if key not in VERSIONED_STATUS_KEYS]
+        untracked_keys = tuple(untracked_keys)
+        prev_status = self.prev_status.get(session_id, self.torrent_id)
+        if prev_status is None:
+            status_diff = get_status_getter(keys)(self)
+            digests = array(
+                str('l'),
+                [get_status_digest(status_diff[key]) for key in untracked_keys],
+            )
+            self.prev_status.store(
+                session_id,
+                self.torrent_id,
+                PrevStatus(keys, untracked_keys, self.status_version, digests),
+            )
+            return status_diff
+
+        if keys is prev_status.keys or keys == prev_status.keys:
+            new_keys = ()
+        else:
+            # The new untracked keys are sent by their missing digest.
+            new_keys = set(keys).difference(prev_status.keys, untracked_keys)
+        watermark = prev_status.watermark
+        if watermark == self.status_version:
+            changed = new_keys
+        else:
+            key_versions = self.key_versions
+            changed = [
+                key
+                for key in keys
+                if key in new_keys or key_versions.get(key, 0) > watermark
+            ]
+        status_diff = {key: STATUS_GETTERS[key](self) for key in changed}
+
+        if self.state == 'Moving' and 'progress' in keys:
+            # The moving progress is read from the destination files.
+            status_diff['progress'] = self.get_progress()
+
+        digests = prev_status.digests
+        if untracked_keys != prev_status.untracked_keys:
+            prev_digests = dict(zip(prev_status.untracked_keys, digests))
+            digests = array(
+                str('l'), [prev_digests.get(key, -1) for key in untracked_keys]
+            )
+        for index, key in enumerate(untracked_keys):
+            value = STATUS_GETTERS[key](self)
+            digest = get_status_digest(value)
+            if digest != digests[index]:
+                status_diff[key] = value
+                digests[index] = digest
+
+        prev_status.keys = keys
+        prev_status.untracked_keys = untracked_keys
+        prev_status.watermark = self.status_version
+        if digests is not prev_status.digests:
+            prev_status.digests = digests
+            self.prev_status.store(session_id, self.torrent_id, prev_status)
+        return status_diff
+
+    def mark_changed(self, keys):
+        """Records a change of the values of status keys for the session diffs.
+
+        Args:
+            keys (list of str): The status keys that have changed.
+        """
+        self.status_version += 1
+        for key in keys:
+            self.key_versions[key] = self.status_version
+
+    def update_status_versions(self):
+        """Records the status keys changed by the libtorrent status update."""
+        old_status = self.versioned_status
+        status = self.versioned_status = self.status
+        changed = [
+            key
+            for key, getter in LT_STATUS_GETTERS.items()
+            if getter(status) != getter(old_status)
+        ]
+        if changed or status.progress != old_status.progress:
+            changed.extend(('eta', 'progress'))
+            if 'tracker' in changed:
+                changed.append('tracker_host')
+            self.mark_changed(changed)
 
     def update_status(self, status):
         """Updates the cached status.
@@ -1096,119 +1988,7 @@ def update_status(self, status):
             status (libtorrent.torrent_status): a libtorrent torrent status
         """
         self.status = status
-
-    def _create_status_funcs(self):
-        """Creates the functions for getting torrent status"""
-        self.status_funcs = {
-            'active_time': lambda: self.status.active_time,
-            'seeding_time': lambda: self.status.seeding_time,
-            'finished_time': lambda: self.status.finished_time,
-            'all_time_download': lambda: self.status.all_time_download,
-            'storage_mode': lambda: self.status.storage_mode.name.split('_')[
-                2
-            ],  # sparse or allocate
-            'distributed_copies': lambda: max(0.0, self.status.distributed_copies),
-            'download_payload_rate': lambda: self.status.download_payload_rate,
-            'file_priorities': self.get_file_priorities,
-            'hash': lambda: self.torrent_id,
-            'auto_managed': lambda: self.options['auto_managed'],
-            'is_auto_managed': lambda: self.options['auto_managed'],
-            'is_finished': lambda: self.is_finished,
-            'max_connections': lambda: self.options['max_connections'],
-            'max_download_speed': lambda: self.options['max_download_speed'],
-            'max_upload_slots': lambda: self.options['max_upload_slots'],
-            'max_upload_speed': lambda: self.options['max_upload_speed'],
-            'message': lambda: self.statusmsg,
-            'move_on_completed_path': lambda: self.options[
-                'move_completed_path'
-            ],  # Deprecated: move_completed_path
-            'move_on_completed': lambda: self.options[
-                'move_completed'
-            ],  # Deprecated: Use move_completed
-            'move_completed_path': lambda: self.options['move_completed_path'],
-            'move_completed': lambda: self.options['move_completed'],
-            'next_announce': lambda: self.status.next_announce.seconds,
-            'num_peers': lambda: self.status.num_peers - self.status.num_seeds,
-            'num_seeds': lambda: self.status.num_seeds,
-            'owner': lambda: self.options['owner'],
-            'paused': lambda: self.status.paused,
-            'prioritize_first_last': lambda: self.options[
-                'prioritize_first_last_pieces'
-            ],
-            # Deprecated: Use prioritize_first_last_pieces
-            'prioritize_first_last_pieces': lambda: self.options[
-                'prioritize_first_last_pieces'
-            ],
-            'sequential_download': lambda: self.options['sequential_download'],
-            'progress': self.get_progress,
-            'shared': lambda: self.options['shared'],
-            'remove_at_ratio': lambda: self.options['remove_at_ratio'],
-            'save_path': lambda: self.options[
-                'download_location'
-            ],  # Deprecated: Use download_location
-            'download_location': lambda: self.options['download_location'],
-            'seeds_peers_ratio': lambda: -1.0
-            if self.status.num_incomplete == 0
-            else (  # Use -1.0 to signify infinity
-                self.status.num_complete / self.status.num_incomplete
-            ),
-            'seed_rank': lambda: self.status.seed_rank,
-            'state': lambda: self.state,
-            'stop_at_ratio': lambda: self.options['stop_at_ratio'],
-            'stop_ratio': lambda: self.options['stop_ratio'],
-            'time_added': lambda: self.status.added_time,
-            'total_done': lambda: self.status.total_done,
-            'total_payload_download': lambda: self.status.total_payload_download,
-            'total_payload_upload': lambda: self.status.total_payload_upload,
-            'total_peers': lambda: self.status.num_incomplete,
-            'total_seeds': lambda: self.status.num_complete,
-            'total_uploaded': lambda: self.status.all_time_upload,
-            'total_wanted': lambda: self.status.total_wanted,
-            'total_remaining': lambda: self.status.total_wanted
-            - self.status.total_wanted_done,
-            'tracker': lambda: self.status.current_tracker,
-            'tracker_host': self.get_tracker_host,
-            'trackers': lambda: self.trackers,
-            'tracker_status': lambda: self.tracker_status,
-            'upload_payload_rate': lambda: self.status.upload_payload_rate,
-            'comment': lambda: decode_bytes(self.torrent_info.comment())
-            if self.has_metadata
-            else '',
-            'creator': lambda: decode_bytes(self.torrent_info.creator())
-            if self.has_metadata
-            else '',
-            'num_files': lambda: self.torrent_info.num_files()
-            if self.has_metadata
-            else 0,
-            'num_pieces': lambda: self.torrent_info.num_pieces()
-            if self.has_metadata
-            else 0,
-            'piece_length': lambda: self.torrent_info.piece_length()
-            if self.has_metadata
-            else 0,
-            'private': lambda: self.torrent_info.priv() if self.has_metadata else False,
-            'total_size': lambda: self.torrent_info.total_size()
-            if self.has_metadata
-            else 0,
-            'eta': self.get_eta,
-            'file_progress': self.get_file_progress,
-            'files': self.get_files,
-            'orig_files': self.get_orig_files,
-            'is_seed': lambda: self.status.is_seeding,
-            'peers': self.get_peers,
-            'sum_peers': self.get_sum_peers,
-            'queue': lambda: self.status.queue_position,
-            'ratio': self.get_ratio,
-            'completed_time': lambda: self.status.completed_time,
-            'last_seen_complete': lambda: self.status.last_seen_complete,
-            'name': self.get_name,
-            'pieces': self._get_pieces_info,
-            'seed_mode': lambda: self.status.seed_mode,
-            'super_seeding': lambda: self.status.super_seeding,
-            'time_since_download': lambda: self.status.time_since_download,
-            'time_since_upload': lambda: self.status.time_since_upload,
-            'time_since_transfer': self.get_time_since_transfer,
-        }
+        self.peer_info = None
 
     def pause(self):
         """Pause this torrent.
@@ -1470,17 +2250,17 @@ def on_file_rename_complete(dummy_result, wait_dict, index):
 
         wait_on_folder = {}
         self.waiting_on_folder_rename.append(wait_on_folder)
-        for _file in self.get_files():
-            if _file['path'].startswith(folder):
+        for index, path in enumerate(self.get_file_table().paths):
+            if path.startswith(folder):
                 # Keep track of filerenames we're waiting on
-                wait_on_folder[_file['index']] = Deferred().addBoth(
-                    on_file_rename_complete, wait_on_folder, _file['index']
+                wait_on_folder[index] = Deferred().addBoth(
+                    on_file_rename_complete, wait_on_folder, index
                 )
-                new_path = _file['path'].replace(folder, new_folder, 1)
+                new_path = path.replace(folder, new_folder, 1)
                 try:
-                    self.handle.rename_file(_file['index'], new_path.encode('utf8'))
+                    self.handle.rename_file(index, new_path.encode('utf8'))
                 except (UnicodeDecodeError, TypeError):
-                    self.handle.rename_file(_file['index'], new_path)
+                    self.handle.rename_file(index, new_path)
 
         def on_folder_rename_complete(dummy_result, torrent, folder, new_folder):
             """Folder rename complete"""
@@ -1530,40 +2310,29 @@ def remove_empty_folders(self, folder):
         except OSError as ex:
             log.debug('Cannot Remove Folder: %s', ex)
 
-    def cleanup_prev_status(self):
-        """Checks the validity of the keys in the prev_status dict.
+    def _get_piece_states(self):
+        """Get the state of each piece of this torrent.
 
-        If the key is no longer valid, the dict will be deleted.
-        """
-        # Dict will be modified so iterate over generated list
-        for key in list(self.prev_status):
-            if not self.rpcserver.is_session_valid(key):
-                del self.prev_status[key]
+        Returns:
+            bytearray: The PIECE_* state of each piece, None if the torrent is
+                seeding or has no metadata.
 
-    def _get_pieces_info(self):
-        """Get the pieces for this torrent."""
+        """
         if not self.has_metadata or self.status.is_seeding:
-            pieces = None
-        else:
-            pieces = []
-            for piece, avail_piece in zip(
-                self.status.pieces, self.handle.piece_availability()
-            ):
-                if piece:
-                    pieces.append(3)  # Completed.
-                elif avail_piece:
-                    pieces.append(
-                        1
-                    )  # Available, just not downloaded nor being downloaded.
-                else:
-                    pieces.append(
-                        0
-                    )  # Missing, no known peer with piece, or not asked for yet.
+            return None
 
-            for peer_info in self.handle.get_peer_info():
-                if peer_info.downloading_piece_index >= 0:
-                    pieces[
-                        peer_info.downloading_piece_index
-                    ] = 2  # Being downloaded from peer.
+        states = bytearray(
+            map(
+                PIECE_STATES.__getitem__,
+                zip(self.status.pieces, map(bool, self.handle.piece_availability())),
+            )
+        )
+        for peer_info in self.get_peer_info():
+            if peer_info.downloading_piece_index >= 0:
+                states[peer_info.downloading_piece_index] = PIECE_DOWNLOADING
+        return states
 
-        return pieces
+    def _get_pieces_info(self):
+        """Get the pieces for this torrent."""
+        states = self._get_piece_states()
+        return None if states is None else list(states)
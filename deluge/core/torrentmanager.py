@@ -10,12 +10,16 @@
 """TorrentManager handles Torrent objects"""
 from __future__ import unicode_literals
 
-import datetime
+import heapq
 import logging
+import mmap
 import operator
 import os
+import re
+import struct
 import time
-from collections import namedtuple
+import zlib
+from collections import OrderedDict, deque, namedtuple
 from tempfile import gettempdir
 
 import six.moves.cPickle as pickle  # noqa: N813
@@ -28,11 +32,22 @@
 from deluge.common import PY2, archive_files, decode_bytes, get_magnet_info, is_magnet
 from deluge.configmanager import ConfigManager, get_config_dir
 from deluge.core.authmanager import AUTH_LEVEL_ADMIN
-from deluge.core.torrent import Torrent, TorrentOptions, sanitize_filepath
+from deluge.core.torrent import (
+    LT_STATUS_GETTERS,
+    STATUS_EXPRESSIONS,
+    VERSIONED_STATUS_KEYS,
+    PrevStatusCache,
+    Torrent,
+    TorrentOptions,
+    get_ratio,
+    get_status_getter,
+    sanitize_filepath,
+)
 from deluge.error import AddTorrentError, InvalidTorrentError
 from deluge.event import (
     ExternalIPEvent,
     PreTorrentRemovedEvent,
+    SessionLoadingEvent,
     SessionStartedEvent,
     TorrentAddedEvent,
     TorrentFileCompletedEvent,
@@ -51,6 +66,84 @@
     | lt.add_torrent_params_flags_t.flag_apply_ip_filter
 )
 
+# Bounds of the seconds between the ratio checks of a seeding torrent, the
+# lower one being the update interval.
+RATIO_CHECK_MIN_DELAY = 5
+RATIO_CHECK_MAX_DELAY = 60
+
+# The torrent states appended to the torrents.state journal, beyond the number of
+# torrents, before the journal is compacted into the torrents.state snapshot.
+STATE_JOURNAL_COMPACT_MIN = 1000
+
+# The header of a resume data store record: the torrent_id, the length of the
+# bencoded resume data, 0 for a removed torrent, and the CRC32 of both.
+RESUME_RECORD = struct.Struct(str('!40sII'))
+# The records in the resume data store, beyond the number of torrents, before the
+# store is compacted.
+RESUME_STORE_COMPACT_MIN = 1000
+
+# The torrents of the session state whose torrent files are read by a thread at a
+# time on startup, and the number of batches read ahead of the batch being added.
+STARTUP_BATCH_SIZE = 200
+STARTUP_READ_THREADS = 4
+# The seconds since the last transfer of a seed for it to be loaded before the idle
+# torrents on startup.
+STARTUP_RECENT_ACTIVITY = 24 * 60 * 60
+# The startup tiers, loaded one after the other.
+(
+    STARTUP_TIER_DOWNLOADS,
+    STARTUP_TIER_ACTIVE_SEEDS,
+    STARTUP_TIER_IDLE,
+) = range(3)
+
+# The last upload and download times in bencoded resume data.
+RESUME_DATA_LAST_ACTIVE = re.compile(br'(?:11:last_upload|13:last_download)i(\d+)e')
+
+# The header of the state index: its magic, version and number of records.
+STATE_INDEX_HEADER = struct.Struct(str('!4sHI'))
+STATE_INDEX_MAGIC = b'DLSI'
+STATE_INDEX_VERSION = 1
+# A state index record: the torrent_id, the queue position, the flags and the
+# offset and length in the string table of the name, save path and owner.
+STATE_INDEX_RECORD = struct.Struct(str('!40siBIIIIII'))
+STATE_INDEX_PAUSED = 1
+STATE_INDEX_FINISHED = 2
+STATE_INDEX_SHARED = 4
+
+# The status keys of the torrents of the session state not loaded yet, from their
+# TorrentState.
+PENDING_STATUS_GETTERS = {
+    'hash': operator.attrgetter('torrent_id'),
+    'name': lambda t_state: t_state.name or t_state.torrent_id,
+    'state': lambda t_state: 'Paused' if t_state.paused else 'Queued',
+    'queue': operator.attrgetter('queue'),
+    'is_finished': operator.attrgetter('is_finished'),
+    'paused': operator.attrgetter('paused'),
+    'save_path': operator.attrgetter('save_path'),
+    'download_location': operator.attrgetter('save_path'),
+    'owner': lambda t_state: t_state.owner or '',
+    'shared': operator.attrgetter('shared'),
+    'auto_managed': operator.attrgetter('auto_managed'),
+    'is_auto_managed': operator.attrgetter('auto_managed'),
+    'max_connections': operator.attrgetter('max_connections'),
+    'max_upload_slots': operator.attrgetter('max_upload_slots'),
+    'max_upload_speed': operator.attrgetter('max_upload_speed'),
+    'max_download_speed': operator.attrgetter('max_download_speed'),
+    'prioritize_first_last': operator.attrgetter('prioritize_first_last'),
+    'prioritize_first_last_pieces': operator.attrgetter('prioritize_first_last'),
+    'sequential_download': operator.attrgetter('sequential_download'),
+    'super_seeding': operator.attrgetter('super_seeding'),
+    'file_priorities': operator.attrgetter('file_priorities'),
+    'stop_at_ratio': operator.attrgetter('stop_at_ratio'),
+    'stop_ratio': operator.attrgetter('stop_ratio'),
+    'remove_at_ratio': operator.attrgetter('remove_at_ratio'),
+    'move_completed': operator.attrgetter('move_completed'),
+    'move_on_completed': operator.attrgetter('move_completed'),
+    'move_completed_path': operator.attrgetter('move_completed_path'),
+    'move_on_completed_path': operator.attrgetter('move_completed_path'),
+    'trackers': operator.attrgetter('trackers'),
+}
+
 
 class TorrentState:  # pylint: disable=old-style-class
     """Create a torrent state.
@@ -122,6 +215,442 @@ def __ne__(self, other):
         return not self == other
 
 
+class StatusSnapshot(object):
+    """A columnar snapshot of the torrent status keys in LT_STATUS_GETTERS.
+
+    Each key that has been requested has a column holding its value for every
+    torrent, indexed by the slot of the torrent. The row of a torrent is filled
+    again when its libtorrent status has been replaced, i.e. after a
+    state_update_alert, so status replies and filters for many torrents and
+    clients are sliced from the columns instead of being computed by the status
+    functions of every torrent on every request.
+
+    Args:
+        torrents (dict): The torrents of the TorrentManager.
+
+    """
+
+    def __init__(self, torrents):
+        self.torrents = torrents
+        # The slot of each torrent_id in the columns
+        self.slots = {}
+        self.free_slots = []
+        # The libtorrent status each row was filled from, by slot
+        self.statuses = []
+        # The column of each key
+        self.columns = {}
+
+    def add_keys(self, keys):
+        """Adds the columns of the keys not in the snapshot yet.
+
+        Args:
+            keys (list of str): The keys from LT_STATUS_GETTERS.
+
+        """
+        for key in keys:
+            if key not in self.columns:
+                getter = LT_STATUS_GETTERS[key]
+                self.columns[key] = [
+                    None if status is None else getter(status)
+                    for status in self.statuses
+                ]
+
+    def get_slot(self, torrent_id):
+        """Returns the slot of a torrent, filling its row if the status changed.
+
+        Args:
+            torrent_id (str): The torrent ID.
+
+        Returns:
+            int: The index of the torrent in the columns.
+
+        """
+        status = self.torrents[torrent_id].status
+        try:
+            slot = self.slots[torrent_id]
+        except KeyError:
+            if self.free_slots:
+                slot = self.free_slots.pop()
+            else:
+                slot = len(self.statuses)
+                self.statuses.append(None)
+                for column in self.columns.values():
+                    column.append(None)
+            self.slots[torrent_id] = slot
+
+        if self.statuses[slot] is not status:
+            self.statuses[slot] = status
+            for key, column in self.columns.items():
+                column[slot] = LT_STATUS_GETTERS[key](status)
+        return slot
+
+    def update(self, torrent_ids):
+        """Fills the rows of the torrents whose status changed."""
+        for torrent_id in torrent_ids:
+            self.get_slot(torrent_id)
+
+    def remove(self, torrent_id):
+        """Frees the slot of a removed torrent."""
+        slot = self.slots.pop(torrent_id, None)
+        if slot is not None:
+            self.statuses[slot] = None
+            self.free_slots.append(slot)
+
+    def get_status(self, torrent_id, keys):
+        """Returns the status of a torrent for keys with a column.
+
+        Args:
+            torrent_id (str): The torrent ID.
+            keys (list of str): The keys from LT_STATUS_GETTERS.
+
+        Returns:
+            dict: The status keys and their values.
+
+        """
+        slot = self.get_slot(torrent_id)
+        columns = self.columns
+        return {key: columns[key][slot] for key in keys}
+
+    def get_values(self, key, torrent_ids):
+        """Returns the values of a key for the torrents.
+
+        Args:
+            key (str): The key from LT_STATUS_GETTERS.
+            torrent_ids (list of str): The torrent IDs.
+
+        Returns:
+            list: The value for each torrent.
+
+        """
+        self.add_keys([key])
+        column = self.columns[key]
+        return [column[self.get_slot(torrent_id)] for torrent_id in torrent_ids]
+
+
+class ResumeDataStore(object):
+    """An append-only file of the bencoded resume data of the torrents.
+
+    Only the resume data of the changed torrents is appended, as records with a
+    checksum so a record torn by a crash is discarded on load. The latest record of
+    a torrent wins and the store is compacted, rewritten without the outdated
+    records, once they outnumber the torrents. The previous store is kept as a
+    backup when compacting.
+
+    Args:
+        filepath (str): The path of the store file.
+
+    """
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        # The number of records in the file
+        self.records = 0
+
+    @staticmethod
+    def pack_record(torrent_id, resume_data):
+        """Returns the record of the resume data of a torrent, or its removal if None."""
+        key = torrent_id.encode('ascii')
+        resume_data = resume_data or b''
+        checksum = zlib.crc32(key + resume_data) & 0xFFFFFFFF
+        return RESUME_RECORD.pack(key, len(resume_data), checksum) + resume_data
+
+    def load(self):
+        """Read the resume data of the torrents from the store.
+
+        An incomplete or corrupt record, and those after it, are truncated.
+
+        Returns:
+            dict: The bencoded resume data of each torrent_id, None if there is no
+                store or backup.
+
+        """
+        for filepath in (self.filepath, self.filepath + '.bak'):
+            try:
+                with open(filepath, 'rb') as _file:
+                    data = _file.read()
+            except IOError:
+                continue
+            if filepath != self.filepath:
+                log.warning('Loading the resume data backup: %s', filepath)
+            break
+        else:
+            return None
+
+        resume_data = {}
+        self.records = 0
+        offset = 0
+        while offset + RESUME_RECORD.size <= len(data):
+            key, length, checksum = RESUME_RECORD.unpack_from(data, offset)
+            start = offset + RESUME_RECORD.size
+            value = data[start : start + length]
+            if len(value) != length or zlib.crc32(key + value) & 0xFFFFFFFF != checksum:
+                break
+            if length:
+                resume_data[key.decode('ascii')] = value
+            else:
+                resume_data.pop(key.decode('ascii'), None)
+            self.records += 1
+            offset = start + length
+
+        if offset != len(data):
+            log.warning('Truncating the incomplete end of %s', filepath)
+            try:
+                with open(filepath, 'r+b') as _file:
+                    _file.truncate(offset)
+            except IOError as ex:
+                log.error('Unable to truncate %s: %s', filepath, ex)
+        return resume_data
+
+    def append(self, changes):
+        """Append the resume data of the changed torrents to the store.
+
+        A failed write is truncated so that the records appended after it are not
+        discarded along with it on load.
+
+        Args:
+            changes (dict): The bencoded resume data of each changed torrent_id,
+                None for the removed torrents.
+
+        """
+        with open(self.filepath, 'ab', 0) as _file:
+            _file.seek(0, os.SEEK_END)
+            size = _file.tell()
+            try:
+                _file.write(
+                    b''.join(
+                        self.pack_record(torrent_id, resume_data)
+                        for torrent_id, resume_data in changes.items()
+                    )
+                )
+                _file.flush()
+                os.fsync(_file.fileno())
+            except (IOError, OSError):
+                _file.truncate(size)
+                raise
+        self.records += len(changes)
+
+    def compact(self, resume_data):
+        """Rewrite the store with only the current resume data of the torrents.
+
+        Args:
+            resume_data (dict): The bencoded resume data of each torrent_id.
+
+        """
+        filepath_tmp = self.filepath + '.tmp'
+        with open(filepath_tmp, 'wb', 0) as _file:
+            for torrent_id, data in resume_data.items():
+                _file.write(self.pack_record(torrent_id, data))
+            _file.flush()
+            os.fsync(_file.fileno())
+        filepath_bak = self.filepath + '.bak'
+        if os.path.isfile(self.filepath):
+            if os.path.isfile(filepath_bak):
+                os.remove(filepath_bak)
+            os.rename(self.filepath, filepath_bak)
+        os.rename(filepath_tmp, self.filepath)
+        # Sync the rename operations for the directory
+        if hasattr(os, 'O_DIRECTORY'):
+            dirfd = os.open(os.path.dirname(self.filepath), os.O_DIRECTORY)
+            os.fsync(dirfd)
+            os.close(dirfd)
+        self.records = len(resume_data)
+
+    def needs_compacting(self, torrents):
+        """Returns True if the store is missing or mostly outdated records.
+
+        Args:
+            torrents (int): The number of torrents with resume data.
+
+        """
+        return (
+            not os.path.isfile(self.filepath)
+            or self.records > torrents + RESUME_STORE_COMPACT_MIN
+        )
+
+
+class StateIndex(object):
+    """A memory-mapped index of the torrents of the session state.
+
+    The index is written with the state snapshot and on shutdown so the torrents are
+    listed on startup while the state is unpickled. It has a fixed width record for
+    each torrent, sorted by torrent_id to be searched in place, followed by the
+    table of the UTF-8 strings of the records.
+
+    Args:
+        filepath (str): The path of the index file.
+
+    """
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.mapping = None
+        # The number of records
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, torrent_id):
+        return self._find(torrent_id) is not None
+
+    def write(self, records):
+        """Write the index of the torrents.
+
+        Args:
+            records (list of tuple): The torrent_id, name, save_path, queue, owner,
+                paused, is_finished and shared of each torrent.
+
+        """
+        packed = []
+        strings = []
+        offset = 0
+        for record in sorted(records):
+            torrent_id, name, save_path, queue, owner, paused, finished, shared = record
+            fields = []
+            for string in (name, save_path, owner):
+                data = (string or '').encode('utf8')
+                strings.append(data)
+                fields.extend((offset, len(data)))
+                offset += len(data)
+            flags = (
+                (paused and STATE_INDEX_PAUSED)
+                | (finished and STATE_INDEX_FINISHED)
+                | (shared and STATE_INDEX_SHARED)
+            )
+            packed.append(
+                STATE_INDEX_RECORD.pack(
+                    torrent_id.encode('ascii'), queue, flags, *fields
+                )
+            )
+
+        filepath_tmp = self.filepath + '.tmp'
+        with open(filepath_tmp, 'wb') as _file:
+            _file.write(
+                STATE_INDEX_HEADER.pack(
+                    STATE_INDEX_MAGIC, STATE_INDEX_VERSION, len(packed)
+                )
+            )
+            _file.write(b''.join(packed))
+            _file.write(b''.join(strings))
+        if os.path.isfile(self.filepath):
+            os.remove(self.filepath)
+        os.rename(filepath_tmp, self.filepath)
+
+    def open(self, min_mtime=0):
+        """Map the index file into memory.
+
+        Args:
+            min_mtime (float): The index is ignored if modified before this time.
+
+        Returns:
+            bool: True if the index is mapped.
+
+        """
+        self.close()
+        try:
+            if os.path.getmtime(self.filepath) < min_mtime:
+                log.info('Ignoring the outdated state index: %s', self.filepath)
+                return False
+            with open(self.filepath, 'rb') as _file:
+                mapping = mmap.mmap(_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (IOError, OSError, ValueError):
+            return False
+
+        try:
+            magic, version, count = STATE_INDEX_HEADER.unpack_from(mapping)
+        except struct.error:
+            magic = None
+        size = STATE_INDEX_HEADER.size + count * STATE_INDEX_RECORD.size
+        if magic != STATE_INDEX_MAGIC or version != STATE_INDEX_VERSION:
+            log.warning('Ignoring the invalid state index: %s', self.filepath)
+            mapping.close()
+            return False
+        if size > len(mapping):
+            log.warning('Ignoring the truncated state index: %s', self.filepath)
+            mapping.close()
+            return False
+        self.mapping = mapping
+        self.count = count
+        return True
+
+    def close(self):
+        """Unmap the index file."""
+        if self.mapping is not None:
+            self.mapping.close()
+        self.mapping = None
+        self.count = 0
+
+    def _find(self, torrent_id):
+        """Returns the offset of the record of a torrent, None if not found."""
+        try:
+            key = torrent_id.encode('ascii')
+        except (AttributeError, UnicodeError):
+            return None
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            offset = STATE_INDEX_HEADER.size + middle * STATE_INDEX_RECORD.size
+            middle_key = self.mapping[offset : offset + 40]
+            if middle_key < key:
+                low = middle + 1
+            elif middle_key > key:
+                high = middle
+            else:
+                return offset
+        return None
+
+    def get_torrent_ids(self):
+        """Returns the list of the torrent_ids in the index."""
+        offsets = range(
+            STATE_INDEX_HEADER.size,
+            STATE_INDEX_HEADER.size + self.count * STATE_INDEX_RECORD.size,
+            STATE_INDEX_RECORD.size,
+        )
+        return [
+            self.mapping[offset : offset + 40].decode('ascii') for offset in offsets
+        ]
+
+    def get_status(self, torrent_id, keys):
+        """Returns the status of a torrent from its record.
+
+        Args:
+            torrent_id (str): The torrent_id.
+            keys (list of str): The status keys, all the indexed keys if empty. The
+                keys not in the index are left out.
+
+        Returns:
+            dict: The status keys and their values.
+
+        Raises:
+            KeyError: If the torrent is not in the index.
+
+        """
+        offset = self._find(torrent_id)
+        if offset is None:
+            raise KeyError(torrent_id)
+        record = STATE_INDEX_RECORD.unpack_from(self.mapping, offset)
+        queue, flags = record[1:3]
+        strings = STATE_INDEX_HEADER.size + self.count * STATE_INDEX_RECORD.size
+        name, save_path, owner = [
+            self.mapping[strings + start : strings + start + length].decode('utf8')
+            for start, length in zip(record[3::2], record[4::2])
+        ]
+        paused = bool(flags & STATE_INDEX_PAUSED)
+        status = {
+            'hash': torrent_id,
+            'name': name or torrent_id,
+            'state': 'Paused' if paused else 'Queued',
+            'queue': queue,
+            'is_finished': bool(flags & STATE_INDEX_FINISHED),
+            'paused': paused,
+            'save_path': save_path,
+            'download_location': save_path,
+            'owner': owner,
+            'shared': bool(flags & STATE_INDEX_SHARED),
+        }
+        return {key: status[key] for key in keys or status if key in status}
+
+
 class TorrentManager(component.Component):
     """TorrentManager contains a list of torrents in the current libtorrent session.
 
@@ -154,6 +683,13 @@ def __init__(self):
 
         # Create the torrents dict { torrent_id: Torrent }
         self.torrents = {}
+        # The torrent_ids of each owner { owner: set(torrent_id) } and the shared ones
+        self.owner_torrents = {}
+        self.shared_torrents = set()
+        # The due time of the ratio check of each torrent { torrent_id: due }
+        # and the heap of the (due, torrent_id) checks, with stale entries skipped.
+        self.ratio_checks = {}
+        self.ratio_check_heap = []
         self.queued_torrents = set()
         self.is_saving_state = False
         self.save_resume_data_file_lock = defer.DeferredLock()
@@ -169,13 +705,39 @@ def __init__(self):
 
         # Keeps track of resume data
         self.resume_data = {}
+        # The torrent_ids whose resume data changed since it was stored
+        self.resume_data_dirty = set()
+        self.resume_store = ResumeDataStore(
+            os.path.join(self.state_dir, 'torrents.fastresume.store')
+        )
 
         self.torrents_status_requests = []
         self.status_dict = {}
+        self.status_snapshot = StatusSnapshot(self.torrents)
+        self.prev_status = PrevStatusCache(self.config['prev_status_memory_limit'])
         self.last_state_update_alert_ts = 0
 
-        # Keep the previous saved state
-        self.prev_saved_state = None
+        # The states of the torrents not added to the session yet on startup
+        # { torrent_id: TorrentState }
+        self.torrents_pending_load = {}
+        # Fires when the state is unpickled on startup, in a thread
+        self.state_read = None
+        # Lists the torrents on startup until the state is unpickled
+        self.state_index = StateIndex(
+            os.path.join(self.state_dir, 'torrents.state.index')
+        )
+        self.startup_status = {
+            'total': 0,
+            'loaded': 0,
+            'downloads': 0,
+            'downloads_duration': None,
+            'duration': None,
+        }
+
+        # Keep the previous saved state of each torrent { torrent_id: TorrentState }
+        self.prev_saved_state = {}
+        # The number of torrent states in the journal of the state snapshot
+        self.state_journal_length = 0
 
         # Register set functions
         set_config_keys = [
@@ -236,13 +798,16 @@ def start(self):
             os.utime(self.temp_file, None)
 
         # Try to load the state from file
-        self.load_state()
+        self.load_state().addErrback(self.on_load_state_failed)
 
         # Save the state periodically
         self.save_state_timer.start(200, False)
         self.save_resume_data_timer.start(190, False)
         self.prev_status_cleanup_loop.start(10)
 
+    def on_load_state_failed(self, failure):
+        log.error('Failed to load the torrents state: %s', failure.getTraceback())
+
     @defer.inlineCallbacks
     def stop(self):
         # Stop timers
@@ -255,8 +820,13 @@ def stop(self):
         if self.prev_status_cleanup_loop.running:
             self.prev_status_cleanup_loop.stop()
 
+        # Wait for the state to be read to not save over it
+        if self.state_read and not self.state_read.called:
+            yield self.state_read
+
         # Save state on shutdown
         yield self.save_state()
+        self._save_state_index()
 
         self.session.pause()
 
@@ -266,28 +836,82 @@ def stop(self):
             os.remove(self.temp_file)
 
     def update(self):
-        for torrent_id, torrent in self.torrents.items():
-            # XXX: Should the state check be those that _can_ be stopped at ratio
-            if torrent.options['stop_at_ratio'] and torrent.state not in (
-                'Checking',
-                'Allocating',
-                'Paused',
-                'Queued',
-            ):
-                # If the global setting is set, but the per-torrent isn't...
-                # Just skip to the next torrent.
-                # This is so that a user can turn-off the stop at ratio option on a per-torrent basis
-                if not torrent.options['stop_at_ratio']:
-                    continue
-                if (
-                    torrent.get_ratio() >= torrent.options['stop_ratio']
-                    and torrent.is_finished
-                ):
-                    if torrent.options['remove_at_ratio']:
-                        self.remove(torrent_id)
-                        break
-                    if not torrent.handle.status().paused:
-                        torrent.pause()
+        """Checks the ratio of the torrents whose ratio check is due."""
+        now = time.time()
+        while self.ratio_check_heap and self.ratio_check_heap[0][0] <= now:
+            due, torrent_id = heapq.heappop(self.ratio_check_heap)
+            if self.ratio_checks.get(torrent_id) != due:
+                # Rescheduled or removed since it was pushed.
+                continue
+            del self.ratio_checks[torrent_id]
+            delay = self.check_ratio(torrent_id)
+            if delay is not None:
+                self.schedule_ratio_check(torrent_id, delay)
+
+    def schedule_ratio_check(self, torrent_id, delay=0):
+        """Schedules a check of the ratio of a torrent by update.
+
+        A check scheduled earlier for the torrent is kept.
+
+        Args:
+            torrent_id (str): The torrent_id.
+            delay (float): Seconds until the check is due.
+
+        """
+        due = time.time() + delay
+        scheduled = self.ratio_checks.get(torrent_id)
+        if scheduled is None or due < scheduled:
+            self.ratio_checks[torrent_id] = due
+            heapq.heappush(self.ratio_check_heap, (due, torrent_id))
+
+    def check_ratio(self, torrent_id):
+        """Stops or removes the torrent if it reached its stop ratio.
+
+        Args:
+            torrent_id (str): The torrent_id.
+
+        Returns:
+            float: Seconds until the ratio should be checked again, None if the next
+                check is scheduled by a change of the torrent.
+
+        """
+        try:
+            torrent = self.torrents[torrent_id]
+        except KeyError:
+            # The torrent is checked once it is loaded, removed torrents are dropped.
+            if torrent_id in self.torrents_pending_load:
+                return RATIO_CHECK_MIN_DELAY
+            return None
+        # A change of the ratio options schedules a new check.
+        if not torrent.options['stop_at_ratio']:
+            return None
+        # XXX: Should the state check be those that _can_ be stopped at ratio
+        if not torrent.is_finished or torrent.state in (
+            'Checking',
+            'Allocating',
+            'Paused',
+            'Queued',
+        ):
+            return RATIO_CHECK_MAX_DELAY
+
+        # The status is kept up to date by the torrent status updates.
+        status = torrent.status
+        stop_ratio = torrent.options['stop_ratio']
+        if get_ratio(status) >= stop_ratio:
+            if torrent.options['remove_at_ratio']:
+                self.remove(torrent_id)
+            elif not status.paused:
+                torrent.pause()
+            return None
+
+        # Check again halfway to the predicted time the ratio is reached.
+        if status.upload_payload_rate <= 0:
+            return RATIO_CHECK_MAX_DELAY
+        remaining = stop_ratio * status.total_done - status.all_time_upload
+        return min(
+            max(remaining / status.upload_payload_rate / 2, RATIO_CHECK_MIN_DELAY),
+            RATIO_CHECK_MAX_DELAY,
+        )
 
     def __getitem__(self, torrent_id):
         """Return the Torrent with torrent_id.
@@ -308,16 +932,97 @@ def get_torrent_list(self):
             list: A list of torrent_ids.
 
         """
-        torrent_ids = list(self.torrents)
+        if component.get('RPCServer').get_session_auth_level() == AUTH_LEVEL_ADMIN:
+            return list(self.torrents)
+
+        current_user = component.get('RPCServer').get_session_user()
+        owned = self.owner_torrents.get(current_user)
+        if not owned:
+            return list(self.shared_torrents)
+        return list(owned.union(self.shared_torrents))
+
+    def get_pending_list(self):
+        """Creates a list of the torrent_ids not loaded yet on startup, owned by
+        current user and any marked shared.
+
+        Returns:
+            list: A list of torrent_ids.
+
+        """
+        if not self.torrents_pending_load and self.state_index:
+            # The state is not unpickled yet.
+            torrent_ids = self.state_index.get_torrent_ids()
+        else:
+            torrent_ids = list(self.torrents_pending_load)
         if component.get('RPCServer').get_session_auth_level() == AUTH_LEVEL_ADMIN:
             return torrent_ids
 
         current_user = component.get('RPCServer').get_session_user()
-        for torrent_id in torrent_ids[:]:
-            torrent_status = self.torrents[torrent_id].get_status(['owner', 'shared'])
-            if torrent_status['owner'] != current_user and not torrent_status['shared']:
-                torrent_ids.pop(torrent_ids.index(torrent_id))
-        return torrent_ids
+        owned_ids = []
+        for torrent_id in torrent_ids:
+            status = self.get_pending_status(torrent_id, ['owner', 'shared'])
+            if status['shared'] or status['owner'] == current_user:
+                owned_ids.append(torrent_id)
+        return owned_ids
+
+    def is_pending(self, torrent_id):
+        """Returns True if the torrent is in the session state but not loaded yet."""
+        return torrent_id not in self.torrents and (
+            torrent_id in self.torrents_pending_load or torrent_id in self.state_index
+        )
+
+    def get_pending_status(self, torrent_id, keys):
+        """Returns the status of a torrent not loaded yet from its state.
+
+        Args:
+            torrent_id (str): The torrent_id.
+            keys (list of str): The status keys, all the PENDING_STATUS_GETTERS keys
+                if empty. The keys not in PENDING_STATUS_GETTERS, or in the state
+                index until the state is unpickled, are left out.
+
+        Returns:
+            dict: The status keys and their values.
+
+        Raises:
+            KeyError: If the torrent is not waiting to be loaded.
+
+        """
+        try:
+            t_state = self.torrents_pending_load[torrent_id]
+        except KeyError:
+            return self.state_index.get_status(torrent_id, keys)
+        return {
+            key: PENDING_STATUS_GETTERS[key](t_state)
+            for key in keys or PENDING_STATUS_GETTERS
+            if key in PENDING_STATUS_GETTERS
+        }
+
+    def update_owner_index(self, torrent_id, old_owner=None):
+        """Updates the owner and shared indexes from the options of a torrent.
+
+        Args:
+            torrent_id (str): The torrent_id of a torrent in the session.
+            old_owner (str, optional): The previous owner of the torrent.
+
+        """
+        try:
+            options = self.torrents[torrent_id].options
+        except KeyError:
+            # The torrent is still being created.
+            return
+        self._remove_from_owner_index(torrent_id, old_owner)
+        self.owner_torrents.setdefault(options['owner'], set()).add(torrent_id)
+        if options['shared']:
+            self.shared_torrents.add(torrent_id)
+        else:
+            self.shared_torrents.discard(torrent_id)
+
+    def _remove_from_owner_index(self, torrent_id, owner):
+        owned = self.owner_torrents.get(owner)
+        if owned is not None:
+            owned.discard(torrent_id)
+            if not owned:
+                del self.owner_torrents[owner]
 
     def get_torrent_info_from_file(self, filepath):
         """Retrieves torrent_info from the file specified.
@@ -638,6 +1343,8 @@ def _add_torrent_obj(
         # Create a Torrent object and add to the dictionary.
         torrent = Torrent(handle, options, state, filename, magnet)
         self.torrents[torrent.torrent_id] = torrent
+        self.update_owner_index(torrent.torrent_id)
+        self.schedule_ratio_check(torrent.torrent_id)
 
         # Resume AlertManager if paused for adding torrent to libtorrent.
         component.resume('AlertManager')
@@ -736,7 +1443,8 @@ def remove(self, torrent_id, remove_data=False, save_state=True):
             return False
 
         # Remove fastresume data if it is exists
-        self.resume_data.pop(torrent_id, None)
+        if self.resume_data.pop(torrent_id, None):
+            self.resume_data_dirty.add(torrent_id)
 
         # Remove the .torrent file in the state and copy location, if user requested.
         delete_copies = (
@@ -755,7 +1463,12 @@ def remove(self, torrent_id, remove_data=False, save_state=True):
                 )
 
         # Remove the torrent from deluge's session
+        self._remove_from_owner_index(torrent_id, torrent.options['owner'])
+        self.shared_torrents.discard(torrent_id)
+        self.ratio_checks.pop(torrent_id, None)
         del self.torrents[torrent_id]
+        self.status_snapshot.remove(torrent_id)
+        self.prev_status.remove_torrent(torrent_id)
 
         if save_state:
             self.save_state()
@@ -822,74 +1535,343 @@ def open_state(self):
                 log.info('Successfully loaded %s', filepath)
                 break
 
-        return state if state else TorrentManagerState()
+        state = state if state else TorrentManagerState()
+        self.state_journal_length = self.replay_state_journal(state)
+        return state
+
+    def replay_state_journal(self, state):
+        """Replay the torrents.state.journal changes over a TorrentManager state.
+
+        An incomplete change at the end of the journal, left by a crash while it was
+        appended, is truncated.
+
+        Args:
+            state (TorrentManagerState): The state loaded from the snapshot, updated
+                in place.
+
+        Returns:
+            int: The number of torrent states in the journal.
+
+        """
+        filepath = os.path.join(self.state_dir, 'torrents.state.journal')
+        changes = []
+        try:
+            with open(filepath, 'rb') as _file:
+                end = 0
+                while True:
+                    try:
+                        if PY2:
+                            changes.append(pickle.load(_file))
+                        else:
+                            changes.append(pickle.load(_file, encoding='utf8'))
+                    except (EOFError, pickle.UnpicklingError):
+                        break
+                    end = _file.tell()
+                truncate = end != os.fstat(_file.fileno()).st_size
+        except IOError:
+            return 0
+
+        if truncate:
+            log.warning('Truncating the incomplete end of %s', filepath)
+            try:
+                with open(filepath, 'r+b') as _file:
+                    _file.truncate(end)
+            except IOError as ex:
+                log.error('Unable to truncate %s: %s', filepath, ex)
+
+        t_states = OrderedDict(
+            (t_state.torrent_id, t_state) for t_state in state.torrents
+        )
+        for change in changes:
+            for torrent_id, t_state in change.items():
+                if t_state is None:
+                    t_states.pop(torrent_id, None)
+                else:
+                    t_states[torrent_id] = t_state
+        state.torrents = list(t_states.values())
+        log.info('Replayed %d changes from %s', len(changes), filepath)
+        return sum(len(change) for change in changes)
+
+    def _read_torrent_infos(self, t_states):
+        """Read the torrent files of torrent states, in a thread on startup.
+
+        Args:
+            t_states (list of TorrentState): The torrent states.
+
+        Returns:
+            list of lt.torrent_info: The torrent_info of each state, None if its
+                torrent file is missing or invalid.
+
+        """
+        return [
+            self.get_torrent_info_from_file(
+                os.path.join(self.state_dir, t_state.torrent_id + '.torrent')
+            )
+            for t_state in t_states
+        ]
+
+    def _add_state_torrent(self, t_state, torrent_info, resume_data):
+        """Add a torrent of the session state to the session.
+
+        Args:
+            t_state (TorrentState): The torrent state.
+            torrent_info (lt.torrent_info): The torrent_info read from its torrent file.
+            resume_data (bytes): The bencoded resume data of the torrent.
+
+        Returns:
+            Deferred: Fires when the torrent is added, None if it is not added.
+
+        """
+        # Populate the options dict from state
+        options = TorrentOptions()
+        for option in options:
+            try:
+                options[option] = getattr(t_state, option)
+            except AttributeError:
+                pass
+        # Manually update unmatched attributes
+        options['download_location'] = t_state.save_path
+        options['pre_allocate_storage'] = t_state.storage_mode == 'allocate'
+        options['prioritize_first_last_pieces'] = t_state.prioritize_first_last
+        options['add_paused'] = t_state.paused
+
+        def on_loaded(result):
+            self.torrents_pending_load.pop(t_state.torrent_id, None)
+            return result
+
+        try:
+            d = self.add_async(
+                torrent_info=torrent_info,
+                state=t_state,
+                options=options,
+                save_state=False,
+                magnet=t_state.magnet,
+                resume_data=resume_data,
+            )
+        except AddTorrentError as ex:
+            log.warning(
+                'Error when adding torrent "%s" to session: %s', t_state.torrent_id, ex
+            )
+            on_loaded(None)
+            return None
+        return d.addBoth(on_loaded)
 
+    @defer.inlineCallbacks
     def load_state(self):
         """Load all the torrents from TorrentManager state into session.
 
+        The torrents are loaded in tiers: the downloading and queued torrents in queue
+        order, then the seeds with a transfer in the last STARTUP_RECENT_ACTIVITY
+        seconds, then the idle torrents. Each tier starts once the previous one is
+        added, and the lower tiers are read one batch ahead in the background.
+
+        The torrent files are read by threads in batches, at most
+        STARTUP_READ_THREADS batches ahead of the ones added to the session, with at
+        most two batches waiting to be added, so the reactor keeps serving requests
+        while loading. Until they are added, the torrents are reported from their
+        state by get_pending_status.
+
+        Returns:
+            Deferred: Fires when all the torrents are added.
+
         Emits:
+            SessionLoadingEvent: Emitted after each batch of torrents is added.
             SessionStartedEvent: Emitted after all torrents are added to the session.
 
         """
-        start = datetime.datetime.now()
-        state = self.open_state()
-        state = self.fixup_state(state)
+        start = time.time()
+        if self.open_state_index():
+            # The torrents are listed from the index while the state is unpickled.
+            self.state_read = threads.deferToThread(
+                lambda: self.fixup_state(self.open_state())
+            )
+        else:
+            self.state_read = defer.succeed(self.fixup_state(self.open_state()))
+        state = yield self.state_read
+        self.prev_saved_state = {
+            t_state.torrent_id: t_state for t_state in state.torrents
+        }
+        self.torrents_pending_load = dict(self.prev_saved_state)
+        self.state_index.close()
+        if self._component_state in ('Stopping', 'Stopped'):
+            return
 
         # Reorder the state.torrents list to add torrents in the correct queue order.
         state.torrents.sort(
             key=operator.attrgetter('queue'), reverse=self.config['queue_new_to_top']
         )
         resume_data = self.load_resume_data_file()
-
-        deferreds = []
+        recent = time.time() - STARTUP_RECENT_ACTIVITY
+        tiers = ([], [], [])
         for t_state in state.torrents:
-            # Populate the options dict from state
-            options = TorrentOptions()
-            for option in options:
-                try:
-                    options[option] = getattr(t_state, option)
-                except AttributeError:
-                    pass
-            # Manually update unmatched attributes
-            options['download_location'] = t_state.save_path
-            options['pre_allocate_storage'] = t_state.storage_mode == 'allocate'
-            options['prioritize_first_last_pieces'] = t_state.prioritize_first_last
-            options['add_paused'] = t_state.paused
-
-            magnet = t_state.magnet
-            torrent_info = self.get_torrent_info_from_file(
-                os.path.join(self.state_dir, t_state.torrent_id + '.torrent')
+            tiers[self.get_startup_tier(t_state, resume_data, recent)].append(t_state)
+
+        total = len(state.torrents)
+        self.startup_status = {
+            'total': total,
+            'loaded': 0,
+            'downloads': len(tiers[STARTUP_TIER_DOWNLOADS]),
+            'downloads_duration': None,
+            'duration': None,
+        }
+        for tier, t_states in enumerate(tiers):
+            read_ahead = STARTUP_READ_THREADS if tier == STARTUP_TIER_DOWNLOADS else 1
+            loaded = yield self._load_state_tier(start, t_states, resume_data, read_ahead)
+            if not loaded:
+                log.info('Stopped loading torrents after %d', len(self.torrents))
+                return
+
+        duration = time.time() - start
+        self.startup_status['duration'] = duration
+        log.info('Finished loading %d torrents in %.3f seconds', total, duration)
+        component.get('EventManager').emit(SessionStartedEvent())
+
+    @staticmethod
+    def get_startup_tier(t_state, resume_data, recent):
+        """Returns the startup tier of a torrent of the session state.
+
+        Args:
+            t_state (TorrentState): The state of the torrent.
+            resume_data (dict): The bencoded resume data of each torrent_id.
+            recent (float): The time of the oldest transfer of an active seed.
+
+        Returns:
+            int: The STARTUP_TIER_* the torrent is loaded in.
+
+        """
+        if t_state.paused:
+            return STARTUP_TIER_IDLE
+        if not t_state.is_finished:
+            return STARTUP_TIER_DOWNLOADS
+        # The resume data is searched instead of decoded, as only the seeds need it.
+        last_active = [
+            int(match)
+            for match in RESUME_DATA_LAST_ACTIVE.findall(
+                resume_data.get(t_state.torrent_id) or b''
             )
+        ]
+        if last_active and max(last_active) >= recent:
+            return STARTUP_TIER_ACTIVE_SEEDS
+        return STARTUP_TIER_IDLE
 
-            try:
-                d = self.add_async(
-                    torrent_info=torrent_info,
-                    state=t_state,
-                    options=options,
-                    save_state=False,
-                    magnet=magnet,
-                    resume_data=resume_data.get(t_state.torrent_id),
+    @defer.inlineCallbacks
+    def _load_state_tier(self, start, t_states, resume_data, read_ahead):
+        """Add a startup tier of the session state torrents in batches.
+
+        Args:
+            start (float): The time the session state started loading.
+            t_states (list of TorrentState): The torrents of the tier.
+            resume_data (dict): The bencoded resume data of each torrent_id.
+            read_ahead (int): The number of batches read ahead of the added ones.
+
+        Returns:
+            Deferred: Fires with True once the tier is added, False if the
+                TorrentManager stopped before.
+
+        """
+        batches = (
+            t_states[index : index + STARTUP_BATCH_SIZE]
+            for index in range(0, len(t_states), STARTUP_BATCH_SIZE)
+        )
+        reads = deque()
+
+        def read_next_batch():
+            batch = next(batches, None)
+            if batch:
+                reads.append(
+                    (batch, threads.deferToThread(self._read_torrent_infos, batch))
                 )
-            except AddTorrentError as ex:
-                log.warning(
-                    'Error when adding torrent "%s" to session: %s',
-                    t_state.torrent_id,
-                    ex,
+
+        for dummy_index in range(read_ahead):
+            read_next_batch()
+
+        added = []
+        while reads:
+            batch, read = reads.popleft()
+            torrent_infos = yield read
+            # Read the next batch in place of the one consumed.
+            read_next_batch()
+            if self._component_state in ('Stopping', 'Stopped'):
+                defer.returnValue(False)
+            deferreds = [
+                self._add_state_torrent(
+                    t_state, torrent_info, resume_data.get(t_state.torrent_id)
                 )
-            else:
-                deferreds.append(d)
+                for t_state, torrent_info in zip(batch, torrent_infos)
+            ]
+            added.append(
+                (len(batch), DeferredList([d for d in deferreds if d is not None]))
+            )
+            # Wait for the previous batch while this one is being added.
+            if len(added) > 1:
+                yield self._on_state_batch_added(start, *added.pop(0))
+        for batch_size, deferred_list in added:
+            yield self._on_state_batch_added(start, batch_size, deferred_list)
+        defer.returnValue(True)
 
-        deferred_list = DeferredList(deferreds, consumeErrors=False)
+    def open_state_index(self):
+        """Map the state index if it is newer than the state files.
 
-        def on_complete(result):
-            log.info(
-                'Finished loading %d torrents in %s',
-                len(state.torrents),
-                str(datetime.datetime.now() - start),
+        Returns:
+            bool: True if the index is mapped.
+
+        """
+        mtimes = [0]
+        for filename in ('torrents.state', 'torrents.state.journal'):
+            filepath = os.path.join(self.state_dir, filename)
+            if os.path.isfile(filepath):
+                mtimes.append(os.path.getmtime(filepath))
+        if not self.state_index.open(max(mtimes)):
+            return False
+        log.info(
+            'Listing %d torrents from %s until the state is loaded',
+            len(self.state_index),
+            self.state_index.filepath,
+        )
+        return True
+
+    def _save_state_index(self):
+        """Write the state index of the saved torrent states."""
+        records = []
+        for t_state in list(self.prev_saved_state.values()):
+            torrent = self.torrents.get(t_state.torrent_id)
+            records.append(
+                (
+                    t_state.torrent_id,
+                    torrent.get_name() if torrent else t_state.name,
+                    t_state.save_path,
+                    t_state.queue,
+                    t_state.owner,
+                    t_state.paused,
+                    t_state.is_finished,
+                    t_state.shared,
+                )
             )
-            component.get('EventManager').emit(SessionStartedEvent())
+        try:
+            self.state_index.write(records)
+        except (IOError, OSError) as ex:
+            log.error('Unable to save %s: %s', self.state_index.filepath, ex)
 
-        deferred_list.addCallback(on_complete)
+    @defer.inlineCallbacks
+    def _on_state_batch_added(self, start, batch_size, deferred_list):
+        """Wait for a batch of the session state torrents and report the progress."""
+        yield deferred_list
+        status = self.startup_status
+        status['loaded'] += batch_size
+        if status['downloads_duration'] is None and (
+            status['loaded'] >= status['downloads']
+        ):
+            status['downloads_duration'] = time.time() - start
+            log.info(
+                'Loaded %d unfinished torrents in %.3f seconds',
+                status['downloads'],
+                status['downloads_duration'],
+            )
+        component.get('EventManager').emit(
+            SessionLoadingEvent(
+                self.startup_status['loaded'], self.startup_status['total']
+            )
+        )
 
     def create_state(self):
         """Create a state of all the torrents in TorrentManager.
@@ -913,7 +1895,7 @@ def create_state(self):
             torrent_state = TorrentState(
                 torrent.torrent_id,
                 torrent.filename,
-                torrent.trackers,
+                [{'url': url, 'tier': tier} for url, tier in torrent.tracker_entries],
                 torrent.get_status(['storage_mode'])['storage_mode'],
                 paused,
                 torrent.options['download_location'],
@@ -948,7 +1930,7 @@ def save_state(self):
             If a save task is already running, this call is ignored.
 
         """
-        if self.is_saving_state:
+        if self.is_saving_state or not (self.state_read and self.state_read.called):
             return defer.succeed(None)
         self.is_saving_state = True
         d = threads.deferToThread(self._save_state)
@@ -962,17 +1944,92 @@ def on_state_saved(arg):
         return d
 
     def _save_state(self):
-        """Save the state of the TorrentManager to the torrents.state file."""
+        """Save the state of the TorrentManager to the torrents.state files.
+
+        The torrent states changed since the previous save are appended to the
+        torrents.state.journal file, which is compacted into the torrents.state
+        snapshot once it holds more states than there are torrents.
+
+        """
         state = self.create_state()
+        t_states = {t_state.torrent_id: t_state for t_state in state.torrents}
+        changes = {
+            torrent_id: t_state
+            for torrent_id, t_state in t_states.items()
+            if self.prev_saved_state.get(torrent_id) != t_state
+        }
+        for torrent_id in self.prev_saved_state:
+            if torrent_id not in t_states:
+                if torrent_id in self.torrents_pending_load:
+                    # Not loaded on startup yet
+                    t_states[torrent_id] = self.prev_saved_state[torrent_id]
+                else:
+                    changes[torrent_id] = None
 
         # If the state hasn't changed, no need to save it
-        if self.prev_saved_state == state:
+        if not changes:
             return
 
+        # The changes are journaled before compacting so that replaying the journal
+        # over the new snapshot is harmless if the journal is not truncated.
+        if not self._append_state_journal(changes):
+            return
+        self.prev_saved_state = t_states
+        self.state_journal_length += len(changes)
+
+        # The snapshot would miss the torrents not loaded yet.
+        if self.torrents_pending_load:
+            return
+        max_length = len(t_states) + STATE_JOURNAL_COMPACT_MIN
+        filepath = os.path.join(self.state_dir, 'torrents.state')
+        if self.state_journal_length > max_length or not os.path.isfile(filepath):
+            self._save_state_snapshot(state)
+
+    def _append_state_journal(self, changes):
+        """Append torrent state changes to the torrents.state.journal file.
+
+        A failed write is truncated so that the changes appended after it are not
+        discarded along with it when the journal is replayed.
+
+        Args:
+            changes (dict): The TorrentState of each changed torrent_id, None for
+                the removed torrents.
+
+        Returns:
+            bool: True if the changes are saved.
+
+        """
+        filepath = os.path.join(self.state_dir, 'torrents.state.journal')
+        try:
+            log.debug('Appending %d changes to: %s', len(changes), filepath)
+            data = pickle.dumps(changes, protocol=2)
+            with open(filepath, 'ab', 0) as _file:
+                _file.seek(0, os.SEEK_END)
+                size = _file.tell()
+                try:
+                    _file.write(data)
+                    _file.flush()
+                    os.fsync(_file.fileno())
+                except (OSError, IOError):
+                    _file.truncate(size)
+                    raise
+        except (OSError, IOError, pickle.PicklingError) as ex:
+            log.error('Unable to save %s: %s', filepath, ex)
+            return False
+        return True
+
+    def _save_state_snapshot(self, state):
+        """Save a state to the torrents.state file and empty the journal.
+
+        Args:
+            state (TorrentManagerState): The TorrentManager state.
+
+        """
         filename = 'torrents.state'
         filepath = os.path.join(self.state_dir, filename)
         filepath_bak = filepath + '.bak'
         filepath_tmp = filepath + '.tmp'
+        filepath_journal = filepath + '.journal'
 
         try:
             log.debug('Creating the temporary file: %s', filepath_tmp)
@@ -997,12 +2054,21 @@ def _save_state(self):
         try:
             log.debug('Saving %s to: %s', filename, filepath)
             os.rename(filepath_tmp, filepath)
-            self.prev_saved_state = state
         except OSError as ex:
             log.error('Failed to set new state file %s: %s', filepath, ex)
             if os.path.isfile(filepath_bak):
                 log.info('Restoring backup of state from: %s', filepath_bak)
                 os.rename(filepath_bak, filepath)
+            return
+
+        try:
+            log.debug('Emptying the journal: %s', filepath_journal)
+            with open(filepath_journal, 'wb', 0) as _file:
+                os.fsync(_file.fileno())
+            self.state_journal_length = 0
+        except OSError as ex:
+            log.error('Unable to empty %s: %s', filepath_journal, ex)
+        self._save_state_index()
 
     def save_resume_data(self, torrent_ids=None, flush_disk_cache=False):
         """Saves torrents resume data.
@@ -1056,10 +2122,18 @@ def on_all_resume_data_finished(dummy_result):
     def load_resume_data_file(self):
         """Load the resume data from file for all torrents.
 
+        The torrents.fastresume file of older versions is loaded if there is no
+        resume data store yet.
+
         Returns:
             dict: A dict of torrents and their resume_data.
 
         """
+        resume_data = self.resume_store.load()
+        if resume_data is not None:
+            log.info('Successfully loaded resume data: %s', self.resume_store.filepath)
+            return resume_data
+
         filename = 'torrents.fastresume'
         filepath = os.path.join(self.state_dir, filename)
         filepath_bak = filepath + '.bak'
@@ -1090,6 +2164,9 @@ def load_resume_data_file(self):
     def save_resume_data_file(self, queue_task=False):
         """Save resume data to file in a separate thread to avoid blocking main thread.
 
+        Only the resume data changed since the previous save is written, unless the
+        resume data store is compacted.
+
         Args:
             queue_task (bool): If True and a save task is already running then queue
                 this save task to run next. Default is to not queue save tasks.
@@ -1103,9 +2180,23 @@ def save_resume_data_file(self, queue_task=False):
             return defer.succeed(None)
 
         def on_lock_aquired():
-            d = threads.deferToThread(self._save_resume_data_file)
+            changes = {
+                torrent_id: self.resume_data.get(torrent_id)
+                for torrent_id in self.resume_data_dirty
+            }
+            self.resume_data_dirty.clear()
+            resume_data = None
+            # The torrents not loaded yet have no resume data to compact with.
+            if not self.torrents_pending_load and self.resume_store.needs_compacting(
+                len(self.resume_data)
+            ):
+                resume_data = dict(self.resume_data)
+            d = threads.deferToThread(self._save_resume_data_file, changes, resume_data)
 
             def on_resume_data_file_saved(arg):
+                if not arg:
+                    # Save the changes again on the next save
+                    self.resume_data_dirty.update(changes)
                 if self.save_resume_data_timer.running:
                     self.save_resume_data_timer.reset()
                 return arg
@@ -1115,51 +2206,34 @@ def on_resume_data_file_saved(arg):
 
         return self.save_resume_data_file_lock.run(on_lock_aquired)
 
-    def _save_resume_data_file(self):
-        """Saves the resume data file with the contents of self.resume_data"""
-        if not self.resume_data:
-            return True
+    def _save_resume_data_file(self, changes, resume_data=None):
+        """Saves the changed resume data to the resume data store.
 
-        filename = 'torrents.fastresume'
-        filepath = os.path.join(self.state_dir, filename)
-        filepath_bak = filepath + '.bak'
-        filepath_tmp = filepath + '.tmp'
+        Args:
+            changes (dict): The bencoded resume data of each changed torrent_id, None
+                for the removed torrents.
+            resume_data (dict, optional): The resume data of all the torrents to
+                compact the store with instead of appending the changes.
 
-        try:
-            log.debug('Creating the temporary file: %s', filepath_tmp)
-            with open(filepath_tmp, 'wb', 0) as _file:
-                _file.write(lt.bencode(self.resume_data))
-                _file.flush()
-                os.fsync(_file.fileno())
-        except (OSError, EOFError) as ex:
-            log.error('Unable to save %s: %s', filename, ex)
-            return False
+        Returns:
+            bool: True if the resume data is saved.
 
-        try:
-            log.debug('Creating backup of %s at: %s', filename, filepath_bak)
-            if os.path.isfile(filepath_bak):
-                os.remove(filepath_bak)
-            if os.path.isfile(filepath):
-                os.rename(filepath, filepath_bak)
-        except OSError as ex:
-            log.error('Unable to backup %s to %s: %s', filepath, filepath_bak, ex)
-            return False
+        """
+        if resume_data is None and not changes:
+            return True
 
+        filepath = self.resume_store.filepath
         try:
-            log.debug('Saving %s to: %s', filename, filepath)
-            os.rename(filepath_tmp, filepath)
-        except OSError as ex:
-            log.error('Failed to set new file %s: %s', filepath, ex)
-            if os.path.isfile(filepath_bak):
-                log.info('Restoring backup from: %s', filepath_bak)
-                os.rename(filepath_bak, filepath)
-        else:
-            # Sync the rename operations for the directory
-            if hasattr(os, 'O_DIRECTORY'):
-                dirfd = os.open(os.path.dirname(filepath), os.O_DIRECTORY)
-                os.fsync(dirfd)
-                os.close(dirfd)
-            return True
+            if resume_data is None:
+                log.debug('Appending %d changes to: %s', len(changes), filepath)
+                self.resume_store.append(changes)
+            else:
+                log.debug('Compacting the resume data: %s', filepath)
+                self.resume_store.compact(resume_data)
+        except (IOError, OSError) as ex:
+            log.error('Unable to save %s: %s', filepath, ex)
+            return False
+        return True
 
     def archive_state(self, message):
         log.warning(message)
@@ -1167,6 +2241,9 @@ def archive_state(self, message):
         for filename in ('torrents.fastresume', 'torrents.state'):
             filepath = os.path.join(self.state_dir, filename)
             arc_filepaths.extend([filepath, filepath + '.bak'])
+        arc_filepaths.append(os.path.join(self.state_dir, 'torrents.state.journal'))
+        arc_filepaths.append(self.state_index.filepath)
+        arc_filepaths.append(self.resume_store.filepath)
 
         archive_files('state', arc_filepaths, message=message)
 
@@ -1211,9 +2288,8 @@ def queue_bottom(self, torrent_id):
         return True
 
     def cleanup_torrents_prev_status(self):
-        """Run cleanup_prev_status for each registered torrent"""
-        for torrent in self.torrents.values():
-            torrent.cleanup_prev_status()
+        """Remove the previous status of invalid and idle sessions"""
+        self.prev_status.cleanup(component.get('RPCServer').is_session_valid)
 
     def on_set_max_connections_per_torrent(self, key, value):
         """Sets the per-torrent connection limit"""
@@ -1299,6 +2375,7 @@ def on_alert_torrent_finished(self, alert):
                 component.get('EventManager').emit(TorrentFinishedEvent(torrent_id))
         else:
             torrent.is_finished = True
+        self.schedule_ratio_check(torrent_id)
 
         # Torrent is no longer part of the queue
         try:
@@ -1410,6 +2487,7 @@ def on_alert_storage_moved(self, alert):
         if torrent_id in self.waiting_on_finish_moving:
             self.waiting_on_finish_moving.remove(torrent_id)
             torrent.is_finished = True
+            self.schedule_ratio_check(torrent_id)
             component.get('EventManager').emit(TorrentFinishedEvent(torrent_id))
 
     def on_alert_storage_moved_failed(self, alert):
@@ -1428,6 +2506,7 @@ def on_alert_storage_moved_failed(self, alert):
         if torrent_id in self.waiting_on_finish_moving:
             self.waiting_on_finish_moving.remove(torrent_id)
             torrent.is_finished = True
+            self.schedule_ratio_check(torrent_id)
             component.get('EventManager').emit(TorrentFinishedEvent(torrent_id))
 
     def on_alert_torrent_resumed(self, alert):
@@ -1468,6 +2547,7 @@ def on_alert_save_resume_data(self, alert):
         if torrent_id in self.torrents:
             # libtorrent add_torrent expects bencoded resume_data.
             self.resume_data[torrent_id] = lt.bencode(alert.resume_data)
+            self.resume_data_dirty.add(torrent_id)
 
         if torrent_id in self.waiting_on_resume_data:
             self.waiting_on_resume_data[torrent_id].callback(None)
@@ -1520,6 +2600,7 @@ def on_alert_file_renamed(self, alert):
 
         new_name = decode_bytes(alert.name)
         log.debug('index: %s name: %s', alert.index, new_name)
+        torrent.on_file_renamed()
 
         # We need to see if this file index is in a waiting_on_folder dict
         for wait_on_folder in torrent.waiting_on_folder_rename:
@@ -1589,6 +2670,7 @@ def on_alert_state_update(self, alert):
         """
         self.last_state_update_alert_ts = time.time()
 
+        updated = []
         for t_status in alert.status:
             try:
                 torrent_id = str(t_status.info_hash)
@@ -1596,6 +2678,8 @@ def on_alert_state_update(self, alert):
                 continue
             if torrent_id in self.torrents:
                 self.torrents[torrent_id].update_status(t_status)
+                updated.append(torrent_id)
+        self.status_snapshot.update(updated)
 
         self.handle_torrents_status_callback(self.torrents_status_requests.pop())
 
@@ -1647,7 +2731,7 @@ def separate_keys(self, keys, torrent_ids):
         if self.torrents:
             for torrent_id in torrent_ids:
                 if torrent_id in self.torrents:
-                    status_keys = list(self.torrents[torrent_id].status_funcs)
+                    status_keys = list(STATUS_EXPRESSIONS)
                     leftover_keys = list(set(keys) - set(status_keys))
                     torrent_keys = list(set(keys) - set(leftover_keys))
                     return torrent_keys, leftover_keys
@@ -1658,17 +2742,45 @@ def handle_torrents_status_callback(self, status_request):
         d, torrent_ids, keys, diff = status_request
         status_dict = {}.fromkeys(torrent_ids)
         torrent_keys, plugin_keys = self.separate_keys(keys, torrent_ids)
+        if not keys:
+            for torrent_id in torrent_ids:
+                if torrent_id in self.torrents:
+                    torrent_keys = list(STATUS_EXPRESSIONS)
+                    break
+
+        if diff:
+            # Each torrent only computes the keys changed since the last diff
+            # of the session.
+            torrent_keys = tuple(torrent_keys)
+            untracked_keys = [
+                key for key in torrent_keys if key not in VERSIONED_STATUS_KEYS
+            ]
+        else:
+            # The keys depending only on the libtorrent status are sliced from the
+            # snapshot, the others are computed by each torrent.
+            snapshot_keys = [key for key in torrent_keys if key in LT_STATUS_GETTERS]
+            get_status = get_status_getter(
+                [key for key in torrent_keys if key not in LT_STATUS_GETTERS]
+            )
+            self.status_snapshot.add_keys(snapshot_keys)
 
         # Get the torrent status for each torrent_id
         for torrent_id in torrent_ids:
             if torrent_id not in self.torrents:
+                if self.is_pending(torrent_id):
+                    status_dict[torrent_id] = self.get_pending_status(torrent_id, keys)
+                    continue
                 # The torrent_id does not exist in the dict.
                 # Could be the clients cache (sessionproxy) isn't up to speed.
                 del status_dict[torrent_id]
-            else:
-                status_dict[torrent_id] = self.torrents[torrent_id].get_status(
-                    torrent_keys, diff, all_keys=not keys
+            elif diff:
+                status_dict[torrent_id] = self.torrents[torrent_id].get_status_diff(
+                    torrent_keys, untracked_keys
                 )
+            else:
+                status = self.status_snapshot.get_status(torrent_id, snapshot_keys)
+                status.update(get_status(self.torrents[torrent_id]))
+                status_dict[torrent_id] = status
         self.status_dict = status_dict
         d.callback((status_dict, plugin_keys))
 
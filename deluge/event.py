@@ -111,6 +111,20 @@ def __init__(self, torrent_id, state):
         self._args = [torrent_id, state]
 
 
+class TorrentsStateChangedEvent(DelugeEvent):
+    """
+    Emitted with the torrents that changed state during the event coalescing
+    window, to the clients interested in it instead of TorrentStateChangedEvent.
+    """
+
+    def __init__(self, states):
+        """
+        :param states: the new state with the torrent_id as key
+        :type states: dict
+        """
+        self._args = [states]
+
+
 class TorrentTrackerStatusEvent(DelugeEvent):
     """
     Emitted when a torrents tracker status changes.
@@ -245,6 +259,21 @@ def __init__(self, new_release):
         self._args = [new_release]
 
 
+class SessionLoadingEvent(DelugeEvent):
+    """
+    Emitted while the torrents of the session state are added on startup.
+    """
+
+    def __init__(self, loaded, total):
+        """
+        :param loaded: the number of torrents loaded so far
+        :type loaded: int
+        :param total: the number of torrents in the session state
+        :type total: int
+        """
+        self._args = [loaded, total]
+
+
 class SessionStartedEvent(DelugeEvent):
     """
     Emitted when a session has started.  This typically only happens once when
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2009 Damien Churchill <damoxc@gmail.com>
+#
+# This file is part of Deluge and is licensed under GNU General Public License 3.0, or later, with
+# the additional special exception to link portions of this program with the OpenSSL library.
+# See LICENSE for more details.
+#
+
+from __future__ import unicode_literals
+
+from deluge.plugins.init import PluginInitBase
+
+
+class CorePlugin(PluginInitBase):
+    def __init__(self, plugin_name):
+        from .core import Core as _pluginCls
+
+        self._plugin_cls = _pluginCls
+        super(CorePlugin, self).__init__(plugin_name)
+
+
+class GtkUIPlugin(PluginInitBase):
+    def __init__(self, plugin_name):
+        from .gtkui import GtkUI as _pluginCls
+
+        self._plugin_cls = _pluginCls
+        super(GtkUIPlugin, self).__init__(plugin_name)
+
+
+class WebUIPlugin(PluginInitBase):
+    def __init__(self, plugin_name):
+        from .webui import WebUI as _pluginCls
+
+        self._plugin_cls = _pluginCls
+        super(WebUIPlugin, self).__init__(plugin_name)
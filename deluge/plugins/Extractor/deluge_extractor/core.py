@@ -126,24 +126,23 @@ def _on_torrent_finished(self, torrent_id):
         tid = component.get('TorrentManager').torrents[torrent_id]
         tid_status = tid.get_status(['download_location', 'name'])
 
-        files = tid.get_files()
-        for f in files:
-            file_root, file_ext = os.path.splitext(f['path'])
+        for path in tid.get_file_table().paths:
+            file_root, file_ext = os.path.splitext(path)
             file_ext_sec = os.path.splitext(file_root)[1]
             if file_ext_sec and file_ext_sec + file_ext in EXTRACT_COMMANDS:
                 file_ext = file_ext_sec + file_ext
             elif file_ext not in EXTRACT_COMMANDS or file_ext_sec == '.tar':
-                log.debug('Cannot extract file with unknown file type: %s', f['path'])
+                log.debug('Cannot extract file with unknown file type: %s', path)
                 continue
             elif file_ext == '.rar' and 'part' in file_ext_sec:
                 part_num = file_ext_sec.split('part')[1]
                 if part_num.isdigit() and int(part_num) != 1:
-                    log.debug('Skipping remaining multi-part rar files: %s', f['path'])
+                    log.debug('Skipping remaining multi-part rar files: %s', path)
                     continue
 
             cmd = EXTRACT_COMMANDS[file_ext]
             fpath = os.path.join(
-                tid_status['download_location'], os.path.normpath(f['path'])
+                tid_status['download_location'], os.path.normpath(path)
             )
             dest = os.path.normpath(self.config['extract_path'])
             if self.config['use_name_folder']:
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Deluge and is licensed under GNU General Public License 3.0, or later, with
+# the additional special exception to link portions of this program with the OpenSSL library.
+# See LICENSE for more details.
+#
+"""Benchmark the memory used by each Torrent object of the core.
+
+Torrents with a few files and the same public trackers are added to a
+libtorrent session, then the Python heap allocated while creating their Torrent
+objects is measured with tracemalloc. The memory held by libtorrent itself is
+not included.
+
+Usage::
+
+    python -m deluge.tests.benchmarks.bench_memory [--torrents 1000 10000]
+        [--output results.json]
+
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import argparse
+import gc
+import json
+import platform
+import shutil
+import sys
+import tempfile
+import tracemalloc
+
+import deluge.configmanager
+from deluge._libtorrent import lt
+from deluge.config import Config
+from deluge.core.core import Core
+from deluge.core.preferencesmanager import DEFAULT_PREFS
+from deluge.core.rpcserver import RPCServer
+from deluge.core.torrent import Torrent
+
+DEFAULT_TORRENTS = (1000, 10000)
+PIECE_SIZE = 16 * 1024
+TRACKERS = (
+    'udp://tracker.example.org:1337/announce',
+    'udp://tracker.example.com:6969/announce',
+    'http://tracker.example.net/announce',
+)
+
+
+def make_torrent_info(index, files=3):
+    """Returns the torrent_info of a torrent with files of one piece each."""
+    storage = lt.file_storage()
+    for file_index in range(files):
+        storage.add_file('torrent %d/file %d' % (index, file_index), PIECE_SIZE)
+    creator = lt.create_torrent(storage, PIECE_SIZE)
+    for piece in range(creator.num_pieces()):
+        creator.set_hash(piece, b'%020d' % (index * files + piece))
+    for tier, url in enumerate(TRACKERS):
+        creator.add_tracker(url, tier)
+    return lt.torrent_info(lt.bdecode(lt.bencode(creator.generate())))
+
+
+def add_handles(session, count, save_path):
+    """Adds count paused torrents to the session, returns their handles."""
+    handles = []
+    for index in range(count):
+        handles.append(
+            session.add_torrent(
+                {
+                    'ti': make_torrent_info(index),
+                    'save_path': save_path,
+                    'flags': lt.add_torrent_params_flags_t.flag_paused,
+                }
+            )
+        )
+    return handles
+
+
+def bench_memory(core, count, save_path):
+    """Returns the Python heap bytes per Torrent object of count torrents."""
+    handles = add_handles(core.session, count, save_path)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    torrents = [Torrent(handle, {}) for handle in handles]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del torrents
+    for handle in handles:
+        core.session.remove_torrent(handle)
+    return (after - before) / count
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--torrents',
+        nargs='+',
+        type=int,
+        default=DEFAULT_TORRENTS,
+        help='Torrent counts to create',
+    )
+    parser.add_argument('--output', help='Write the results as JSON to this file')
+    options = parser.parse_args(args)
+
+    config_dir = tempfile.mkdtemp(prefix='deluge-bench-')
+    try:
+        deluge.configmanager.set_config_dir(config_dir)
+        Config('core.conf', defaults=DEFAULT_PREFS, config_dir=config_dir).save()
+        RPCServer(listen=False)
+        core = Core()
+
+        results = {}
+        row = '{:<32} {:>14}'
+        print(row.format('benchmark', 'bytes/torrent'))
+        for count in options.torrents:
+            name = '%d/torrent_objects' % count
+            bytes_per_torrent = bench_memory(core, count, config_dir)
+            results[name] = {'torrents': count, 'bytes': bytes_per_torrent}
+            print(row.format(name, '%.0f' % bytes_per_torrent))
+    finally:
+        shutil.rmtree(config_dir, ignore_errors=True)
+
+    if options.output:
+        with open(options.output, 'w') as f:
+            json.dump(
+                {
+                    'python': platform.python_version(),
+                    'platform': platform.platform(),
+                    'results': results,
+                },
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Deluge and is licensed under GNU General Public License 3.0, or later, with
+# the additional special exception to link portions of this program with the OpenSSL library.
+# See LICENSE for more details.
+#
+"""Benchmark the per-poll cost of building torrent status replies.
+
+A poll builds the status of every torrent for the keys of the Web UI torrent
+grid. It is timed with the per-key status getters, with the compiled getter for
+the key tuple, and as diff replies while the torrents are idle and while a
+tenth of them change between polls.
+
+Usage::
+
+    python -m deluge.tests.benchmarks.bench_status [--torrents 10000] [--repeat 5]
+        [--output results.json]
+
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from datetime import timedelta
+
+from deluge.core.torrent import (
+    STATUS_GETTERS,
+    VERSIONED_STATUS_KEYS,
+    PrevStatusCache,
+    SharedTorrentOptions,
+    Torrent,
+    TorrentOptions,
+    get_shared_options,
+    get_status_getter,
+)
+
+DEFAULT_TORRENTS = (1000, 10000)
+# The keys polled by the torrent grid of the Web UI.
+GRID_KEYS = (
+    'queue',
+    'name',
+    'total_wanted',
+    'state',
+    'progress',
+    'num_seeds',
+    'total_seeds',
+    'num_peers',
+    'total_peers',
+    'download_payload_rate',
+    'upload_payload_rate',
+    'eta',
+    'ratio',
+    'distributed_copies',
+    'is_auto_managed',
+    'time_added',
+    'tracker_host',
+    'download_location',
+    'last_seen_complete',
+    'total_done',
+    'total_uploaded',
+    'max_download_speed',
+    'max_upload_speed',
+    'seeds_peers_ratio',
+    'total_remaining',
+    'completed_time',
+    'time_since_transfer',
+)
+STATES = ('Downloading', 'Seeding', 'Paused', 'Queued')
+
+
+class StorageMode(object):
+    name = 'storage_mode_sparse'
+
+
+class BenchStatus(object):
+    """Stands in for a libtorrent torrent_status with random values."""
+
+    def __init__(self, rng, queue_position):
+        total_wanted = rng.randint(1, 50) * 1024 ** 3
+        self.active_time = rng.randint(0, 10 ** 7)
+        self.added_time = rng.randint(10 ** 9, 2 * 10 ** 9)
+        self.all_time_download = rng.randint(0, total_wanted)
+        self.all_time_upload = rng.randint(0, 2 * total_wanted)
+        self.completed_time = rng.randint(0, 2 * 10 ** 9)
+        self.current_tracker = 'udp://tracker.example.org:1337/announce'
+        self.distributed_copies = rng.random() * 10
+        self.download_payload_rate = rng.randint(0, 10 ** 6)
+        self.finished_time = rng.randint(0, 10 ** 7)
+        self.is_seeding = rng.random() < 0.5
+        self.last_seen_complete = rng.randint(0, 2 * 10 ** 9)
+        self.next_announce = timedelta(seconds=rng.randint(0, 1800))
+        self.num_complete = rng.randint(0, 5000)
+        self.num_incomplete = rng.randint(0, 5000)
+        self.num_peers = rng.randint(0, 200)
+        self.num_seeds = rng.randint(0, self.num_peers)
+        self.paused = rng.random() < 0.2
+        self.progress = rng.random()
+        self.queue_position = queue_position
+        self.seed_mode = False
+        self.seed_rank = rng.randint(0, 10 ** 5)
+        self.seeding_time = rng.randint(0, 10 ** 7)
+        self.storage_mode = StorageMode()
+        self.super_seeding = False
+        self.time_since_download = rng.randint(-1, 10 ** 5)
+        self.time_since_upload = rng.randint(-1, 10 ** 5)
+        self.total_done = rng.randint(0, total_wanted)
+        self.total_payload_download = self.all_time_download
+        self.total_payload_upload = self.all_time_upload
+        self.total_wanted = total_wanted
+        self.total_wanted_done = self.total_done
+        self.upload_payload_rate = rng.randint(0, 10 ** 6)
+
+
+class BenchRPCServer(object):
+    def get_session_id(self):
+        return 1
+
+
+def make_torrents(rng, count, prev_status):
+    """Returns torrents built without libtorrent handles."""
+    torrents = []
+    rpcserver = BenchRPCServer()
+    for index in range(count):
+        torrent = Torrent.__new__(Torrent)
+        torrent.torrent_id = '%040x' % rng.getrandbits(160)
+        torrent.rpcserver = rpcserver
+        torrent.prev_status = prev_status
+        torrent.status = torrent.versioned_status = BenchStatus(rng, index)
+        torrent.status_version = 0
+        torrent.key_versions = {}
+        torrent.options = SharedTorrentOptions(get_shared_options(TorrentOptions()))
+        torrent.options['name'] = 'torrent %d' % index
+        torrent.state = rng.choice(STATES)
+        torrent.statusmsg = 'OK'
+        torrent.tracker_host = 'example.org'
+        torrent.is_finished = torrent.status.is_seeding
+        torrents.append(torrent)
+    return torrents
+
+
+def best_time(func, repeat):
+    """Returns the shortest time in seconds taken by func in `repeat` runs."""
+    best = None
+    for dummy in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench_polls(rng, count, repeat):
+    """Runs the poll benchmarks for count torrents, returns seconds per poll."""
+    prev_status = PrevStatusCache(2 ** 40)
+    torrents = make_torrents(rng, count, prev_status)
+
+    def poll_per_key():
+        for torrent in torrents:
+            {key: STATUS_GETTERS[key](torrent) for key in GRID_KEYS}
+
+    def poll_compiled():
+        get_status = get_status_getter(GRID_KEYS)
+        for torrent in torrents:
+            get_status(torrent)
+
+    # As the TorrentManager, find the untracked keys once per poll.
+    untracked_keys = [key for key in GRID_KEYS if key not in VERSIONED_STATUS_KEYS]
+
+    def poll_diff():
+        for torrent in torrents:
+            torrent.get_status_diff(GRID_KEYS, untracked_keys)
+
+    active = torrents[: count // 10]
+
+    def poll_diff_active():
+        for torrent in active:
+            torrent.status = BenchStatus(rng, torrent.status.queue_position)
+        poll_diff()
+
+    # The first diff sends the full status of every torrent.
+    poll_diff()
+    return {
+        'per_key': best_time(poll_per_key, repeat),
+        'compiled': best_time(poll_compiled, repeat),
+        'diff_idle': best_time(poll_diff, repeat),
+        'diff_10pct_active': best_time(poll_diff_active, repeat),
+    }
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--torrents',
+        nargs='+',
+        type=int,
+        default=DEFAULT_TORRENTS,
+        help='Torrent counts to poll',
+    )
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per benchmark')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed of statuses')
+    parser.add_argument('--output', help='Write the results as JSON to this file')
+    options = parser.parse_args(args)
+
+    results = {}
+    row = '{:<32} {:>10} {:>12}'
+    print(row.format('benchmark', 'ms/poll', 'us/torrent'))
+    for count in options.torrents:
+        rng = random.Random(options.seed)
+        for name, seconds in sorted(bench_polls(rng, count, options.repeat).items()):
+            name = '%d/%s' % (count, name)
+            results[name] = {'torrents': count, 'seconds': seconds}
+            print(
+                row.format(
+                    name, '%.2f' % (seconds * 1000), '%.2f' % (seconds * 1e6 / count)
+                )
+            )
+
+    if options.output:
+        with open(options.output, 'w') as f:
+            json.dump(
+                {
+                    'python': platform.python_version(),
+                    'platform': platform.platform(),
+                    'seed': options.seed,
+                    'results': results,
+                },
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Deluge and is licensed under GNU General Public License 3.0, or later, with
+# the additional special exception to link portions of this program with the OpenSSL library.
+# See LICENSE for more details.
+#
+"""Benchmark the DelugeTransferProtocol receive path.
+
+Messages of increasing size are fed to the protocol in random sized chunks,
+as they would arrive from the network, and the throughput and peak memory
+are reported for the current implementation and the previous bytes based
+implementation.
+
+Usage::
+
+    python -m deluge.tests.benchmarks.bench_transfer [--sizes 1024 1048576] [--seed 1]
+
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import argparse
+import os
+import random
+import struct
+import time
+import tracemalloc
+
+from deluge.transfer import (
+    MESSAGE_HEADER_FORMAT,
+    MESSAGE_HEADER_SIZE,
+    PROTOCOL_VERSION_LEGACY,
+    DelugeTransferProtocol,
+)
+
+KIB = 1024
+MIB = 1024 * KIB
+DEFAULT_SIZES = (KIB, 64 * KIB, MIB, 10 * MIB, 50 * MIB)
+# Twisted reads at most 64 KiB from a socket in one go.
+MAX_CHUNK_SIZE = 64 * KIB
+
+
+class BenchTransferProtocol(DelugeTransferProtocol):
+    """Receives messages without decoding them so only the framing is measured."""
+
+    def __init__(self):
+        super(BenchTransferProtocol, self).__init__()
+        self.messages = 0
+
+    def _handle_complete_message(self, data):
+        self.messages += 1
+
+
+class LegacyBenchTransferProtocol(BenchTransferProtocol):
+    """The receive path as it was, appending to and slicing an immutable bytes buffer."""
+
+    def __init__(self):
+        super(LegacyBenchTransferProtocol, self).__init__()
+        self._buffer = b''
+
+    def dataReceived(self, data):  # NOQA: N802
+        self._buffer += data
+        self._bytes_received += len(data)
+
+        while len(self._buffer) >= MESSAGE_HEADER_SIZE:
+            if self._message_length == 0:
+                header = self._buffer[:MESSAGE_HEADER_SIZE]
+                dummy_version, self._message_length = struct.unpack(
+                    MESSAGE_HEADER_FORMAT, header
+                )
+                self._buffer = self._buffer[MESSAGE_HEADER_SIZE:]
+            if len(self._buffer) >= self._message_length:
+                self._handle_complete_message(self._buffer[: self._message_length])
+                self._buffer = self._buffer[self._message_length :]
+                self._message_length = 0
+            else:
+                break
+
+
+def make_message(size):
+    """Create a framed message with an incompressible body of `size` bytes."""
+    body = os.urandom(size)
+    return struct.pack(MESSAGE_HEADER_FORMAT, PROTOCOL_VERSION_LEGACY, len(body)) + body
+
+
+def split_chunks(data, rng):
+    """Split data into chunks of random size, as received from a socket."""
+    chunks = []
+    offset = 0
+    while offset < len(data):
+        size = rng.randint(1, MAX_CHUNK_SIZE)
+        chunks.append(data[offset : offset + size])
+        offset += size
+    return chunks
+
+
+def run(protocol_cls, chunks):
+    """Feed the chunks to a new protocol instance.
+
+    :returns: the elapsed time in seconds and the peak traced memory in bytes.
+    :rtype: tuple
+
+    """
+    protocol = protocol_cls()
+    tracemalloc.start()
+    start = time.perf_counter()
+    for chunk in chunks:
+        protocol.dataReceived(chunk)
+    elapsed = time.perf_counter() - start
+    dummy_current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert protocol.messages == 1, 'Message was not received'
+    return elapsed, peak
+
+
+def format_size(size):
+    if size >= MIB:
+        return '%d MiB' % (size // MIB)
+    return '%d KiB' % (size // KIB)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--sizes',
+        nargs='+',
+        type=int,
+        default=DEFAULT_SIZES,
+        help='Message body sizes in bytes',
+    )
+    parser.add_argument('--seed', type=int, default=1, help='Random seed for chunking')
+    options = parser.parse_args(args)
+
+    rng = random.Random(options.seed)
+    row = '{:>8} {:>8} {:>14} {:>14} {:>12} {:>12}'
+    print(
+        row.format(
+            'size', 'chunks', 'before MiB/s', 'after MiB/s', 'before peak', 'after peak'
+        )
+    )
+    for size in options.sizes:
+        message = make_message(size)
+        chunks = split_chunks(message, rng)
+        del message
+        results = [
+            run(cls, chunks)
+            for cls in (LegacyBenchTransferProtocol, BenchTransferProtocol)
+        ]
+        throughputs = [
+            '%.1f' % (size / MIB / max(elapsed, 1e-9))
+            for elapsed, dummy_peak in results
+        ]
+        peaks = [format_size(peak) for dummy_elapsed, peak in results]
+        print(row.format(format_size(size), len(chunks), *(throughputs + peaks)))
+
+
+if __name__ == '__main__':
+    main()
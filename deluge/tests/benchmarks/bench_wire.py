@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Deluge and is licensed under GNU General Public License 3.0, or later, with
+# the additional special exception to link portions of this program with the OpenSSL library.
+# See LICENSE for more details.
+#
+"""Benchmark the RPC wire format with realistic payloads.
+
+The payloads are torrent status dicts, peer lists, file lists and event
+floods. Each one is timed through rencode, the sending side of
+DelugeTransferProtocol with the protocol options in use and the receiving
+side, from network sized chunks to decoded messages.
+
+The results can be written as JSON and compared with a previous run, the
+exit status is 1 if the throughput of any benchmark regressed by more than
+the tolerance.
+
+Usage::
+
+    python -m deluge.tests.benchmarks.bench_wire [--output results.json]
+        [--baseline baseline.json] [--tolerance 0.2] [--torrents 100 1000]
+
+A corpus of malformed messages derived from the payloads, for fuzzing the
+receive path, can be written with ``--write-corpus <dir>``.
+
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+import rencode
+
+from deluge.tests.common import (
+    TRANSFER_PROTOCOL_OPTIONS,
+    fuzz_corpus,
+    make_event_flood,
+    random_torrent_id,
+)
+from deluge.transfer import DelugeTransferProtocol
+
+RPC_RESPONSE = 1
+
+DEFAULT_TORRENTS = (100, 1000, 10000, 50000)
+DEFAULT_TOLERANCE = 0.2
+# Twisted reads at most 64 KiB from a socket in one go.
+CHUNK_SIZE = 64 * 1024
+MIB = 1024 * 1024
+
+STATES = ('Downloading', 'Seeding', 'Paused', 'Queued', 'Checking', 'Error')
+CLIENTS = ('Deluge 2.0.3', 'qBittorrent 4.2.5', 'Transmission 3.0', 'uTorrent 3.5.5')
+COUNTRIES = ('US', 'DE', 'FR', 'GB', 'NL', 'SE', 'JP', 'BR', '  ')
+
+
+def make_torrents_status(rng, count):
+    """The torrent status dicts as requested by the web UI torrent list."""
+    status = {}
+    for index in range(count):
+        total_wanted = rng.randint(1, 50 * 1024) * MIB
+        progress = rng.choice((100.0, rng.uniform(0, 100)))
+        status[random_torrent_id(rng)] = {
+            'queue': index,
+            'name': 'Torrent.Name.%d.%s' % (index, rng.choice(('mkv', 'iso', 'zip'))),
+            'total_wanted': total_wanted,
+            'state': rng.choice(STATES),
+            'progress': progress,
+            'num_seeds': rng.randint(0, 50),
+            'total_seeds': rng.randint(0, 5000),
+            'num_peers': rng.randint(0, 50),
+            'total_peers': rng.randint(0, 5000),
+            'download_payload_rate': rng.randint(0, 10 * MIB),
+            'upload_payload_rate': rng.randint(0, 10 * MIB),
+            'eta': rng.randint(0, 86400),
+            'ratio': rng.uniform(0, 10),
+            'distributed_copies': rng.uniform(0, 100),
+            'is_auto_managed': rng.random() < 0.9,
+            'time_added': 1500000000 + index,
+            'tracker_host': 'tracker%d.example.org' % rng.randint(0, 20),
+            'download_location': '/srv/downloads/%d' % rng.randint(0, 5),
+            'total_done': int(total_wanted * progress / 100),
+            'total_uploaded': rng.randint(0, total_wanted * 3),
+            'max_download_speed': -1,
+            'max_upload_speed': -1,
+            'seeds_peers_ratio': rng.uniform(0, 10),
+        }
+    return status
+
+
+def make_peers(rng, count):
+    """The peer list of a torrent as returned by get_peers."""
+    return [
+        {
+            'client': rng.choice(CLIENTS),
+            'country': rng.choice(COUNTRIES),
+            'down_speed': rng.randint(0, MIB),
+            'ip': '%d.%d.%d.%d:%d'
+            % (
+                rng.randint(1, 223),
+                rng.randint(0, 255),
+                rng.randint(0, 255),
+                rng.randint(1, 254),
+                rng.randint(1024, 65535),
+            ),
+            'progress': rng.random(),
+            'seed': rng.random() < 0.3,
+            'up_speed': rng.randint(0, MIB),
+        }
+        for dummy in range(count)
+    ]
+
+
+def make_files(rng, count):
+    """The file list status keys of a torrent."""
+    files = []
+    offset = 0
+    for index in range(count):
+        size = rng.randint(1, 4 * 1024) * 1024
+        files.append(
+            {
+                'index': index,
+                'path': 'Torrent.Name/Disc %d/Track %04d.flac' % (index // 100, index),
+                'size': size,
+                'offset': offset,
+            }
+        )
+        offset += size
+    return {
+        'files': files,
+        'file_progress': [rng.random() for dummy in range(count)],
+        'file_priorities': [rng.choice((0, 1, 4, 7)) for dummy in range(count)],
+    }
+
+
+def make_cases(seed, torrent_counts):
+    """The payloads to benchmark.
+
+    Each payload is generated from the seed and its name so that it does not
+    depend on the other payloads selected.
+
+    :returns: the name and the list of messages of each case.
+    :rtype: list
+
+    """
+    payloads = [
+        ('status-%d' % count, make_torrents_status, count) for count in torrent_counts
+    ]
+    payloads += [
+        ('peers-200', make_peers, 200),
+        ('files-5000', make_files, 5000),
+        ('events-5000', make_event_flood, 5000),
+    ]
+    cases = []
+    for name, make_payload, count in payloads:
+        payload = make_payload(random.Random('%s-%s' % (seed, name)), count)
+        if name.startswith('events'):
+            cases.append((name, payload))
+        else:
+            cases.append((name, [(RPC_RESPONSE, 1, payload)]))
+    return cases
+
+
+class SinkTransport(object):
+    """A transport keeping what is written."""
+
+    def __init__(self):
+        self.data = []
+
+    def write(self, data):
+        self.data.append(data)
+
+    def value(self):
+        return b''.join(self.data)
+
+
+class BenchTransferProtocol(DelugeTransferProtocol):
+    """Counts the decoded messages it receives."""
+
+    def __init__(self):
+        super(BenchTransferProtocol, self).__init__()
+        self.messages = 0
+        self.transport = SinkTransport()
+
+    def message_received(self, message):
+        self.messages += 1
+
+
+def best_time(func, repeat):
+    """Returns the shortest time in seconds taken by func in `repeat` runs."""
+    best = None
+    for dummy in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def split_chunks(data):
+    return [data[i : i + CHUNK_SIZE] for i in range(0, len(data), CHUNK_SIZE)]
+
+
+def bench_case(messages, repeat):
+    """Runs the benchmarks of a case.
+
+    :returns: the result of each benchmark with its name as key.
+    :rtype: dict
+
+    """
+    results = {}
+    encoded = [rencode.dumps(message) for message in messages]
+    size = sum(len(body) for body in encoded)
+
+    def add(name, seconds):
+        results[name] = {
+            'bytes': size,
+            'messages': len(messages),
+            'seconds': seconds,
+            'mib_per_s': size / MIB / max(seconds, 1e-9),
+        }
+
+    add(
+        'rencode-dumps', best_time(lambda: [rencode.dumps(m) for m in messages], repeat)
+    )
+    add(
+        'rencode-loads',
+        best_time(
+            lambda: [rencode.loads(body, decode_utf8=True) for body in encoded], repeat
+        ),
+    )
+
+    for name, options in TRANSFER_PROTOCOL_OPTIONS:
+        sender = BenchTransferProtocol()
+        sender.set_protocol_options(**options)
+
+        def send():
+            sender.transport = SinkTransport()
+            for message in messages:
+                sender.transfer_message(message)
+
+        add('send-' + name, best_time(send, repeat))
+        chunks = split_chunks(sender.transport.value())
+
+        def receive():
+            receiver = BenchTransferProtocol()
+            for chunk in chunks:
+                receiver.dataReceived(chunk)
+            assert receiver.messages == len(messages), 'Messages were not received'
+
+        add('receive-' + name, best_time(receive, repeat))
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Finds the benchmarks slower than in the baseline by more than the tolerance.
+
+    :returns: the name, throughput and baseline throughput of the regressions.
+    :rtype: list
+
+    """
+    regressions = []
+    for name, result in sorted(results.items()):
+        if name not in baseline:
+            continue
+        expected = baseline[name]['mib_per_s']
+        if result['mib_per_s'] < expected * (1 - tolerance):
+            regressions.append((name, result['mib_per_s'], expected))
+    return regressions
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--torrents',
+        nargs='+',
+        type=int,
+        default=DEFAULT_TORRENTS,
+        help='Torrent counts of the status payloads',
+    )
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per benchmark')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed of payloads')
+    parser.add_argument('--output', help='Write the results as JSON to this file')
+    parser.add_argument('--baseline', help='JSON results to compare with')
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help='Allowed throughput regression as a fraction of the baseline',
+    )
+    parser.add_argument(
+        '--write-corpus', metavar='DIR', help='Write a fuzzing corpus to this directory'
+    )
+    options = parser.parse_args(args)
+
+    cases = make_cases(options.seed, options.torrents)
+
+    if options.write_corpus:
+        rng = random.Random(options.seed)
+        if not os.path.isdir(options.write_corpus):
+            os.makedirs(options.write_corpus)
+        messages = [messages[0] for dummy_name, messages in cases[:1] + cases[-3:]]
+        for index, data in enumerate(fuzz_corpus(rng, messages, 500)):
+            with open(
+                os.path.join(options.write_corpus, '%04d.bin' % index), 'wb'
+            ) as f:
+                f.write(data)
+        return 0
+
+    results = {}
+    row = '{:<32} {:>12} {:>10} {:>10}'
+    print(row.format('benchmark', 'bytes', 'ms', 'MiB/s'))
+    for case, messages in cases:
+        for name, result in sorted(bench_case(messages, options.repeat).items()):
+            name = '%s/%s' % (case, name)
+            results[name] = result
+            print(
+                row.format(
+                    name,
+                    result['bytes'],
+                    '%.2f' % (result['seconds'] * 1000),
+                    '%.1f' % result['mib_per_s'],
+                )
+            )
+
+    if options.output:
+        with open(options.output, 'w') as f:
+            json.dump(
+                {
+                    'python': platform.python_version(),
+                    'platform': platform.platform(),
+                    'seed': options.seed,
+                    'results': results,
+                },
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+
+    if options.baseline:
+        with open(options.baseline) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, options.tolerance)
+        for name, throughput, expected in regressions:
+            print(
+                'REGRESSION %s: %.1f MiB/s, baseline %.1f MiB/s'
+                % (name, throughput, expected)
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,6 +10,7 @@
 from __future__ import print_function, unicode_literals
 
 import os
+import struct
 import sys
 import tempfile
 import traceback
@@ -17,16 +18,32 @@
 from twisted.internet import defer, protocol, reactor
 from twisted.internet.defer import Deferred
 from twisted.internet.error import CannotListenError
+from twisted.test import proto_helpers
 from twisted.trial import unittest
 
 import deluge.configmanager
 import deluge.core.preferencesmanager
 import deluge.log
 from deluge.error import DelugeError
+from deluge.transfer import (
+    COMPRESSION_FAST,
+    COMPRESSION_NONE,
+    MESSAGE_HEADER_FORMAT,
+    PROTOCOL_VERSION,
+    PROTOCOL_VERSION_LEGACY,
+    DelugeTransferProtocol,
+)
 
 # This sets log level to critical, so use log.critical() to debug while running unit tests
 deluge.log.setup_logger('none')
 
+RPC_EVENT = 3
+TRANSFER_PROTOCOL_OPTIONS = (
+    ('v1', {'version': PROTOCOL_VERSION_LEGACY}),
+    ('v2-fast', {'version': PROTOCOL_VERSION, 'compression_level': COMPRESSION_FAST}),
+    ('v2-none', {'version': PROTOCOL_VERSION, 'compression_level': COMPRESSION_NONE}),
+)
+
 
 def disable_new_release_check():
     deluge.core.preferencesmanager.DEFAULT_PREFS['new_release_check'] = False
@@ -73,6 +90,64 @@ def callback(value):
     return watchdog
 
 
+def random_torrent_id(rng):
+    return '%040x' % rng.getrandbits(160)
+
+
+def make_event_flood(rng, count):
+    """The TorrentStateChangedEvents emitted when a session is resumed."""
+    return [
+        (
+            RPC_EVENT,
+            'TorrentStateChangedEvent',
+            [random_torrent_id(rng), 'Downloading'],
+        )
+        for dummy in range(count)
+    ]
+
+
+def fuzz_corpus(rng, messages, count):
+    """Creates malformed wire data from valid messages.
+
+    The data is valid frames, in both protocol versions, that are truncated,
+    have bytes flipped, a wrong version or length, or trailing garbage.
+
+    :returns: the wire data.
+    :rtype: list of bytes
+
+    """
+    frames = []
+    for message in messages:
+        for dummy_name, options in TRANSFER_PROTOCOL_OPTIONS:
+            sender = DelugeTransferProtocol()
+            sender.transport = proto_helpers.StringTransport()
+            sender.set_protocol_options(**options)
+            sender.transfer_message(message)
+            frames.append(sender.transport.value())
+
+    corpus = []
+    for dummy in range(count):
+        data = bytearray(rng.choice(frames))
+        mutation = rng.randint(0, 4)
+        if mutation == 0:
+            del data[rng.randint(0, len(data) - 1) :]
+        elif mutation == 1:
+            for dummy_flip in range(rng.randint(1, 8)):
+                data[rng.randint(0, len(data) - 1)] ^= 1 << rng.randint(0, 7)
+        elif mutation == 2:
+            data[0] = rng.randint(0, 255)
+        elif mutation == 3:
+            data[:5] = struct.pack(
+                MESSAGE_HEADER_FORMAT,
+                PROTOCOL_VERSION_LEGACY,
+                rng.randint(0, len(data)),
+            )
+        else:
+            data += bytearray(rng.getrandbits(8) for dummy_byte in range(16))
+        corpus.append(bytes(data))
+    return corpus
+
+
 class ReactorOverride(object):
     """Class used to patch reactor while running unit tests
     to avoid starting and stopping the twisted reactor
@@ -8,12 +8,23 @@
 from __future__ import unicode_literals
 
 from twisted.internet import defer
+from twisted.test import proto_helpers
+from twisted.trial import unittest
 
 import deluge.component as component
 from deluge import error
 from deluge.common import AUTH_LEVEL_NORMAL, get_localhost_auth, windows_check
 from deluge.core.authmanager import AUTH_LEVEL_ADMIN
-from deluge.ui.client import Client, DaemonSSLProxy, client
+from deluge.transfer import DelugeTransferProtocol
+from deluge.ui.client import (
+    RPC_RESPONSE,
+    RPC_RESPONSE_CHUNK,
+    Client,
+    DaemonSSLProxy,
+    DelugeRPCClientFactory,
+    DelugeRPCProtocol,
+    client,
+)
 
 from .basetest import BaseTestCase
 from .daemon_base import DaemonBase
@@ -202,3 +213,82 @@ def on_failure(failure):
 
         d.addCallbacks(self.fail, on_failure)
         return d
+
+
+class DelugeRPCProtocolTestCase(unittest.TestCase):
+    def setUp(self):  # NOQA: N803
+        self.daemon = DaemonSSLProxy()
+        self.daemon.connect_deferred = defer.Deferred()
+        self.protocol = DelugeRPCProtocol()
+        self.protocol.factory = DelugeRPCClientFactory(self.daemon, {})
+        self.transport = proto_helpers.StringTransport()
+        self.protocol.makeConnection(self.transport)
+
+    def tearDown(self):  # NOQA: N803
+        self.protocol.flush_requests()
+
+    def get_sent_messages(self):
+        messages = []
+        receiver = DelugeTransferProtocol()
+        receiver.message_received = messages.append
+        receiver.dataReceived(self.transport.value())
+        return messages
+
+    def test_response_chunks(self):
+        d = self.daemon.call('core.get_torrents_status', {}, [])
+        self.protocol.message_received((RPC_RESPONSE_CHUNK, 0, 0, False, {'a': 1}))
+        self.assertFalse(d.called)
+        self.protocol.message_received((RPC_RESPONSE_CHUNK, 0, 1, False, {'b': 2}))
+        self.assertFalse(d.called)
+        self.protocol.message_received((RPC_RESPONSE_CHUNK, 0, 2, True, {'c': 3}))
+        self.assertEqual(self.successResultOf(d), {'a': 1, 'b': 2, 'c': 3})
+
+    def test_response_chunks_out_of_sequence(self):
+        d = self.daemon.call('core.get_torrents_status', {}, [])
+        self.protocol.message_received((RPC_RESPONSE_CHUNK, 0, 0, False, {'a': 1}))
+        self.protocol.message_received((RPC_RESPONSE_CHUNK, 0, 2, True, {'c': 3}))
+        self.failureResultOf(d, error.DelugeError)
+        # The remaining chunks of the failed request are ignored.
+        self.protocol.message_received((RPC_RESPONSE_CHUNK, 0, 1, False, {'b': 2}))
+
+    def test_requests_sent_in_one_message(self):
+        self.daemon.call('core.get_config')
+        self.daemon.call('core.get_session_state')
+        self.assertEqual(self.transport.value(), b'')
+        self.protocol.flush_requests()
+        messages = self.get_sent_messages()
+        self.assertEqual(len(messages), 1)
+        self.assertEqual(
+            [call[:2] for call in messages[0]],
+            [(0, 'core.get_config'), (1, 'core.get_session_state')],
+        )
+
+    def test_batch(self):
+        with self.daemon.batch() as batch:
+            d1 = self.daemon.call('core.get_config')
+            d2 = self.daemon.call('core.get_session_state')
+            self.assertEqual(self.transport.value(), b'')
+        self.assertEqual(len(self.get_sent_messages()), 1)
+        self.assertEqual(batch.deferreds, [d1, d2])
+
+        self.protocol.message_received((RPC_RESPONSE, 0, {'key': 'value'}))
+        self.protocol.message_received((RPC_RESPONSE, 1, ['torrent_id']))
+        self.assertEqual(
+            self.successResultOf(batch.deferred),
+            [(True, {'key': 'value'}), (True, ['torrent_id'])],
+        )
+
+    def test_batch_failure(self):
+        with self.daemon.batch() as batch:
+            d = self.daemon.call('core.get_config')
+        d.errback(error.DelugeError('Failed'))
+        success, result = self.successResultOf(batch.deferred)[0]
+        self.assertFalse(success)
+        result.trap(error.DelugeError)
+        # The failure still reaches the errbacks added after the batch.
+        self.failureResultOf(d, error.DelugeError)
+
+    def test_batch_not_connected(self):
+        with Client().batch() as batch:
+            pass
+        self.assertEqual(self.successResultOf(batch.deferred), [])
@@ -7,6 +7,7 @@
 
 from __future__ import unicode_literals
 
+import base64
 import os
 import tarfile
 
@@ -28,6 +29,8 @@
     is_ipv6,
     is_magnet,
     is_url,
+    pack_pieces,
+    unpack_pieces,
     windows_check,
 )
 from deluge.i18n import setup_translation
@@ -160,6 +163,15 @@ def test_parse_human_size(self):
                 parsed, byte_size, 'Mismatch when converting: %s' % human_size
             )
 
+    def test_pack_pieces(self):
+        for states in ([], [3], [0, 1, 2, 3, 3, 2, 1], [1, 2] * 1001):
+            packed = pack_pieces(bytearray(states))
+            self.assertEqual(len(base64.b64decode(packed)), (len(states) + 3) // 4)
+            self.assertEqual(unpack_pieces(packed, len(states)), states)
+        self.assertEqual(pack_pieces(bytearray([1, 2, 3, 0, 3])), 'OQM=')
+        self.assertIsNone(pack_pieces(None))
+        self.assertIsNone(unpack_pieces(None, 5))
+
     def test_archive_files(self):
         arc_filelist = [
             get_test_data_file('test.torrent'),
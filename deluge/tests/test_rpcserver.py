@@ -9,13 +9,26 @@
 
 from __future__ import unicode_literals
 
+from mock import patch
+from twisted.internet.address import IPv4Address
+from twisted.internet.error import ConnectionDone
+from twisted.python.failure import Failure
+from twisted.test.proto_helpers import StringTransport
+
 import deluge.component as component
 import deluge.error
 from deluge.common import get_localhost_auth
 from deluge.core import rpcserver
 from deluge.core.authmanager import AuthManager
+from deluge.core.eventmanager import EventManager
 from deluge.core.rpcserver import DelugeRPCProtocol, RPCServer
 from deluge.log import setup_logger
+from deluge.transfer import (
+    COMPRESSION_NONE,
+    PROTOCOL_VERSION,
+    PROTOCOL_VERSION_LEGACY,
+    DelugeTransferProtocol,
+)
 
 from .basetest import BaseTestCase
 
@@ -29,6 +42,9 @@ class DelugeRPCProtocolTester(DelugeRPCProtocol):
     def transfer_message(self, data):
         self.messages.append(data)
 
+    def getPeer(self):  # NOQA: N802
+        return IPv4Address('TCP', '127.0.0.1', 58846)
+
 
 class RPCServerTestCase(BaseTestCase):
     def set_up(self):
@@ -64,6 +80,163 @@ def test_emit_event_for_session_id(self):
         self.assertEqual(msg[1], 'TorrentFolderRenamedEvent', str(msg))
         self.assertEqual(msg[2], data, str(msg))
 
+    def connect_session(self, session_id, interest):
+        protocol = DelugeRPCProtocol()
+        protocol.factory = self.factory
+        transport = StringTransport()
+        transport.sessionno = session_id
+        protocol.makeConnection(transport)
+        self.factory.authorized_sessions[session_id] = protocol.AuthLevel(
+            rpcserver.AUTH_LEVEL_ADMIN, 'localclient'
+        )
+        self.factory.session_protocols[session_id] = protocol
+        protocol.dispatch(self.request_id, 'daemon.set_event_interest', [interest], {})
+        transport.clear()
+        return transport
+
+    def decode_messages(self, transport):
+        messages = []
+        receiver = DelugeTransferProtocol()
+        receiver.message_received = messages.append
+        receiver.dataReceived(transport.value())
+        return messages
+
+    def test_emit_event_encoded_once(self):
+        from deluge.event import TorrentFolderRenamedEvent
+
+        transports = [
+            self.connect_session(1, ['TorrentFolderRenamedEvent']),
+            self.connect_session(2, ['TorrentFolderRenamedEvent']),
+            self.connect_session(3, []),
+        ]
+        self.assertEqual(
+            self.factory.event_sessions['TorrentFolderRenamedEvent'], {1, 2}
+        )
+        event = TorrentFolderRenamedEvent('12', 'new name', 'old name')
+        with patch.object(rpcserver.rencode, 'dumps', wraps=rpcserver.rencode.dumps):
+            self.rpcserver.emit_event(event)
+            self.assertEqual(rpcserver.rencode.dumps.call_count, 1)
+        self.assertTrue(transports[0].value())
+        self.assertEqual(transports[0].value(), transports[1].value())
+        self.assertEqual(transports[2].value(), b'')
+
+        EventManager()
+        self.factory.session_protocols[1].connectionLost(Failure(ConnectionDone()))
+        self.assertEqual(self.factory.event_sessions['TorrentFolderRenamedEvent'], {2})
+
+    def test_emit_coalesced_events(self):
+        from deluge.event import TorrentStateChangedEvent
+
+        eventmanager = EventManager()
+        eventmanager.set_coalesce_window(10)
+        legacy = self.connect_session(1, ['TorrentStateChangedEvent'])
+        batched = self.connect_session(
+            2, ['TorrentStateChangedEvent', 'TorrentsStateChangedEvent']
+        )
+
+        eventmanager.emit(TorrentStateChangedEvent('1', 'Paused'))
+        eventmanager.emit(TorrentStateChangedEvent('2', 'Paused'))
+        eventmanager.emit(TorrentStateChangedEvent('1', 'Seeding'))
+        self.assertEqual(
+            [msg[2] for msg in self.decode_messages(legacy)],
+            [('1', 'Paused'), ('2', 'Paused'), ('1', 'Seeding')],
+        )
+        self.assertEqual(batched.value(), b'')
+
+        eventmanager.flush_coalesced()
+        self.assertEqual(
+            self.decode_messages(batched),
+            [
+                (
+                    rpcserver.RPC_EVENT,
+                    'TorrentsStateChangedEvent',
+                    ({'1': 'Seeding', '2': 'Paused'},),
+                )
+            ],
+        )
+        self.assertEqual(len(self.decode_messages(legacy)), 3)
+        self.assertIsNone(eventmanager.coalesce_timer)
+
+    def test_emit_coalesced_events_removed_torrent(self):
+        from deluge.event import TorrentRemovedEvent, TorrentStateChangedEvent
+
+        eventmanager = EventManager()
+        eventmanager.set_coalesce_window(10)
+        batched = self.connect_session(
+            1, ['TorrentsStateChangedEvent', 'TorrentRemovedEvent']
+        )
+
+        eventmanager.emit(TorrentStateChangedEvent('1', 'Paused'))
+        eventmanager.emit(TorrentStateChangedEvent('2', 'Paused'))
+        eventmanager.emit(TorrentRemovedEvent('1'))
+        eventmanager.flush_coalesced()
+        self.assertEqual(
+            [msg[1:] for msg in self.decode_messages(batched)],
+            [
+                ('TorrentRemovedEvent', ('1',)),
+                ('TorrentsStateChangedEvent', ({'2': 'Paused'},)),
+            ],
+        )
+
+        # The batch is not emitted if only removed torrents were in it.
+        batched.clear()
+        eventmanager.emit(TorrentStateChangedEvent('2', 'Seeding'))
+        eventmanager.emit(TorrentRemovedEvent('2'))
+        eventmanager.flush_coalesced()
+        self.assertEqual(
+            [msg[1:] for msg in self.decode_messages(batched)],
+            [('TorrentRemovedEvent', ('2',))],
+        )
+
+    def test_emit_not_coalesced_without_interest(self):
+        from deluge.event import TorrentStateChangedEvent
+
+        eventmanager = EventManager()
+        eventmanager.set_coalesce_window(10)
+        legacy = self.connect_session(1, ['TorrentStateChangedEvent'])
+
+        eventmanager.emit(TorrentStateChangedEvent('1', 'Paused'))
+        self.assertEqual(len(self.decode_messages(legacy)), 1)
+        self.assertEqual(eventmanager.coalesced, {})
+        self.assertIsNone(eventmanager.coalesce_timer)
+
+    def test_send_buffer_backpressure(self):
+        from deluge.event import TorrentFolderRenamedEvent
+
+        transport = self.connect_session(1, ['TorrentFolderRenamedEvent'])
+        protocol = self.factory.session_protocols[1]
+        self.assertIs(transport.producer, protocol)
+        event = TorrentFolderRenamedEvent('12', 'new name', 'old name')
+
+        protocol.pauseProducing()
+        waiter = protocol.wait_for_send_buffer()
+        self.assertFalse(waiter.called)
+        self.patch(rpcserver, 'EVENT_DROP_WATERMARK', 0)
+        self.rpcserver.emit_event(event)
+        self.rpcserver.emit_event(event)
+        status = self.rpcserver.get_send_buffer_status()[1]
+        self.assertTrue(status['paused'])
+        self.assertGreater(status['buffered'], 0)
+        self.assertEqual(status['events_dropped'], 1)
+
+        protocol.resumeProducing()
+        self.assertTrue(waiter.called)
+        self.assertEqual(
+            protocol.get_send_buffer_status(),
+            {'paused': False, 'buffered': 0, 'events_dropped': 0},
+        )
+        self.rpcserver.emit_event(event)
+        self.assertEqual(len(self.decode_messages(transport)), 2)
+
+    def test_send_buffer_limit_disconnects(self):
+        transport = self.connect_session(1, [])
+        protocol = self.factory.session_protocols[1]
+        self.patch(rpcserver, 'SEND_BUFFER_LIMIT', 10)
+        protocol.pauseProducing()
+        protocol.sendData((rpcserver.RPC_RESPONSE, self.request_id, 'x' * 20))
+        self.assertTrue(transport.disconnecting)
+        self.assertEqual(transport.value(), b'')
+
     def test_invalid_client_login(self):
         self.protocol.dispatch(self.request_id, 'daemon.login', [1], {})
         msg = self.protocol.messages.pop()
@@ -111,3 +284,187 @@ def test_daemon_info(self):
         self.assertEqual(msg[0], rpcserver.RPC_RESPONSE, str(msg))
         self.assertEqual(msg[1], self.request_id, str(msg))
         self.assertEqual(msg[2], deluge.common.get_version(), str(msg))
+
+    def test_negotiate_protocol(self):
+        self.protocol.dispatch(
+            self.request_id, 'daemon.negotiate_protocol', [PROTOCOL_VERSION], {}
+        )
+        msg = self.protocol.messages.pop()
+        self.assertEqual(msg[0], rpcserver.RPC_RESPONSE, str(msg))
+        self.assertEqual(msg[1], self.request_id, str(msg))
+        self.assertEqual(msg[2]['version'], PROTOCOL_VERSION, str(msg))
+        self.assertEqual(msg[2]['compression_level'], COMPRESSION_NONE, str(msg))
+        self.assertEqual(self.protocol.get_protocol_options(), msg[2])
+
+    def test_negotiate_protocol_legacy_client(self):
+        self.protocol.dispatch(
+            self.request_id,
+            'daemon.negotiate_protocol',
+            [PROTOCOL_VERSION_LEGACY],
+            {},
+        )
+        msg = self.protocol.messages.pop()
+        self.assertEqual(msg[0], rpcserver.RPC_RESPONSE, str(msg))
+        self.assertEqual(msg[2], {'version': PROTOCOL_VERSION_LEGACY}, str(msg))
+        self.assertEqual(
+            self.protocol.get_protocol_options()['version'], PROTOCOL_VERSION_LEGACY
+        )
+
+    def test_send_response_chunked(self):
+        del self.protocol.messages[:]
+        result = {str(i): i for i in range(rpcserver.RESPONSE_CHUNK_ITEMS * 2 + 1)}
+        self.protocol.set_protocol_options(PROTOCOL_VERSION)
+
+        def on_sent(dummy):
+            self.assertEqual(len(self.protocol.messages), 3)
+            received = {}
+            for sequence, msg in enumerate(self.protocol.messages):
+                self.assertEqual(msg[0], rpcserver.RPC_RESPONSE_CHUNK, str(msg))
+                self.assertEqual(msg[1], self.request_id)
+                self.assertEqual(msg[2], sequence)
+                self.assertEqual(msg[3], sequence == 2)
+                received.update(msg[4])
+            self.assertEqual(received, result)
+
+        sent = dict(result)
+        d = self.protocol.send_response(self.request_id, sent)
+        # Changes to the result while the chunks are sent are ignored.
+        sent.clear()
+        return d.addCallback(on_sent)
+
+    def test_send_response_chunked_error(self):
+        del self.protocol.messages[:]
+        result = {str(i): i for i in range(rpcserver.RESPONSE_CHUNK_ITEMS * 2 + 1)}
+        self.protocol.set_protocol_options(PROTOCOL_VERSION)
+
+        def send_data(data):
+            if data[0] == rpcserver.RPC_RESPONSE_CHUNK and data[2]:
+                raise IOError('Send failed')
+            self.protocol.messages.append(data)
+
+        self.protocol.sendData = send_data
+
+        def on_sent(dummy):
+            msg = self.protocol.messages.pop()
+            self.assertEqual(msg[0], rpcserver.RPC_ERROR, str(msg))
+            self.assertEqual(msg[1], self.request_id)
+            self.assertEqual(msg[2], 'WrappedException')
+
+        d = self.protocol.send_response(self.request_id, result)
+        return d.addCallback(on_sent)
+
+    def test_send_response_legacy_not_chunked(self):
+        result = {str(i): i for i in range(rpcserver.RESPONSE_CHUNK_ITEMS * 2)}
+        self.assertEqual(self.protocol.send_response(self.request_id, result), 0)
+        msg = self.protocol.messages.pop()
+        self.assertEqual(msg[0], rpcserver.RPC_RESPONSE, str(msg))
+        self.assertEqual(msg[2], result)
+
+    def test_message_received_dispatch_queue(self):
+        del self.protocol.messages[:]
+        self.protocol.message_received(
+            (
+                (self.request_id, 'daemon.info', [], {}),
+                (self.request_id + 1, 'daemon.info', [], {}),
+            )
+        )
+        status = self.rpcserver.get_dispatch_queue_status()
+        self.assertEqual(status['queue_depth'], 2)
+        self.assertEqual(status['session_backlog'], {self.session_id: 2})
+
+        self.factory.dispatch_queue.dispatch()
+        self.assertEqual(
+            [msg[1] for msg in self.protocol.messages],
+            [self.request_id, self.request_id + 1],
+        )
+        self.assertEqual(self.rpcserver.get_dispatch_queue_status()['queue_depth'], 0)
+
+    def test_dispatch_queue_session_budget(self):
+        dispatched = []
+
+        class Session(object):
+            def __init__(self, session_id):
+                self.transport = self
+                self.sessionno = session_id
+
+            def dispatch(self, request_id, method, args, kwargs, request_size=0):
+                dispatched.append((self.sessionno, request_id))
+
+        queue = rpcserver.DispatchQueue(session_budget=2)
+        queue.put(Session(1), [(i, 'core.test', [], {}) for i in range(5)])
+        queue.put(Session(2), [(i, 'core.test', [], {}) for i in range(1)])
+
+        queue.dispatch()
+        self.assertEqual(dispatched, [(1, 0), (1, 1), (2, 0)])
+        self.assertEqual(queue.get_status()['session_backlog'], {1: 3})
+
+        queue.remove_session(1)
+        queue.dispatch()
+        self.assertEqual(queue.get_status()['queue_depth'], 0)
+        self.assertEqual(len(dispatched), 3)
+
+    def test_histogram(self):
+        histogram = rpcserver.Histogram((1, 10))
+        for value in (0, 1, 5, 20):
+            histogram.add(value)
+        other = rpcserver.Histogram((1, 10))
+        other.add(30)
+        histogram.merge(other)
+        self.assertEqual(
+            histogram.to_dict(),
+            {
+                'count': 5,
+                'total': 56,
+                'max': 30,
+                'buckets': [(1, 2), (10, 1), (None, 2)],
+            },
+        )
+
+    def test_rpc_stats(self):
+        self.factory.authorized_sessions[self.session_id] = self.protocol.AuthLevel(
+            rpcserver.AUTH_LEVEL_ADMIN, 'localclient'
+        )
+
+        class Stats(object):
+            @rpcserver.export
+            def ok(self):
+                return True
+
+            @rpcserver.export
+            def fail(self):
+                raise deluge.error.DelugeError()
+
+        self.rpcserver.register_object(Stats(), 'stats')
+        self.protocol.dispatch(self.request_id, 'stats.ok', [], {}, request_size=40)
+        self.protocol.dispatch(self.request_id, 'stats.fail', [], {}, request_size=20)
+
+        stats = self.rpcserver.get_rpc_stats()
+        method_stats = stats['methods']['stats.ok']
+        self.assertEqual(method_stats['calls'], 1)
+        self.assertEqual(method_stats['errors'], 0)
+        self.assertEqual(method_stats['wall_time']['count'], 1)
+        self.assertEqual(method_stats['request_bytes']['total'], 40)
+        self.assertEqual(method_stats['response_bytes']['count'], 1)
+        method_stats = stats['methods']['stats.fail']
+        self.assertEqual(method_stats['calls'], 1)
+        self.assertEqual(method_stats['errors'], 1)
+        self.assertEqual(stats['users']['localclient']['stats.ok']['calls'], 1)
+
+    def test_rpc_stats_not_authorized(self):
+        self.factory.authorized_sessions[self.session_id] = self.protocol.AuthLevel(
+            rpcserver.AUTH_LEVEL_DEFAULT, 'user'
+        )
+
+        class Stats(object):
+            @rpcserver.export(rpcserver.AUTH_LEVEL_ADMIN)
+            def admin(self):
+                return True
+
+        self.rpcserver.register_object(Stats(), 'stats')
+        self.protocol.dispatch(self.request_id, 'stats.admin', [], {}, request_size=40)
+
+        method_stats = self.rpcserver.get_rpc_stats()['methods']['stats.admin']
+        self.assertEqual(method_stats['calls'], 0)
+        self.assertEqual(method_stats['rejected'], 1)
+        self.assertEqual(method_stats['request_bytes']['count'], 0)
+        self.assertEqual(method_stats['wall_time']['count'], 0)
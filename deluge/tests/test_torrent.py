@@ -8,7 +8,9 @@
 from __future__ import print_function, unicode_literals
 
 import os
+import sys
 import time
+from array import array
 from base64 import b64encode
 
 import mock
@@ -20,10 +22,18 @@
 import deluge.core.torrent
 import deluge.tests.common as common
 from deluge._libtorrent import lt
-from deluge.common import utf8_encode_structure, windows_check
+from deluge.common import unpack_pieces, utf8_encode_structure, windows_check
 from deluge.core.core import Core
 from deluge.core.rpcserver import RPCServer
-from deluge.core.torrent import Torrent
+from deluge.core.torrent import (
+    PEER_INFO_MAX_AGE,
+    PeerNameCache,
+    PrevStatus,
+    PrevStatusCache,
+    Torrent,
+    TorrentOptions,
+    convert_lt_files,
+)
 from deluge.core.torrentmanager import TorrentManager, TorrentState
 
 from .basetest import BaseTestCase
@@ -325,6 +335,223 @@ def test_get_eta_downloading(self):
         self.assertEqual(result, 100)
         self.assertIsInstance(result, int)
 
+    def test_get_status_diff(self):
+        atp = self.get_torrent_atp('test_torrent.file.torrent')
+        handle = self.session.add_torrent(atp)
+        self.torrent = Torrent(handle, {})
+        keys = ['max_upload_speed', 'name', 'state', 'total_done']
+
+        status = self.torrent.get_status(keys, diff=True)
+        self.assertEqual(sorted(status), keys)
+
+        # Nothing is computed for the keys unchanged since the last diff.
+        getters = {
+            key: mock.Mock(side_effect=getter)
+            for key, getter in deluge.core.torrent.STATUS_GETTERS.items()
+        }
+        with mock.patch.dict(deluge.core.torrent.STATUS_GETTERS, getters):
+            self.assertEqual(self.torrent.get_status(keys, diff=True), {})
+            self.assertFalse(any(getter.called for getter in getters.values()))
+
+            self.torrent.set_max_upload_speed(100)
+            self.assertEqual(
+                self.torrent.get_status(keys, diff=True), {'max_upload_speed': 100}
+            )
+            called = [key for key, getter in getters.items() if getter.called]
+            self.assertEqual(called, ['max_upload_speed'])
+
+        # The changes are tracked from a new libtorrent status.
+        self.torrent.update_status(
+            mock.MagicMock(
+                total_done=42,
+                distributed_copies=0.0,
+                time_since_download=-1,
+                time_since_upload=-1,
+            )
+        )
+        self.assertEqual(self.torrent.get_status(keys, diff=True), {'total_done': 42})
+
+        # A key new to the session is always sent.
+        self.assertEqual(
+            self.torrent.get_status(keys + ['total_uploaded'], diff=True),
+            {'total_uploaded': self.torrent.status.all_time_upload},
+        )
+
+    def test_get_status(self):
+        atp = self.get_torrent_atp('test_torrent.file.torrent')
+        handle = self.session.add_torrent(atp)
+        self.torrent = Torrent(handle, {'max_upload_speed': 100})
+
+        keys = ['max_upload_speed', 'num_files', 'queue', 'total_wanted', 'name']
+        self.assertEqual(
+            self.torrent.get_status(keys),
+            {
+                'max_upload_speed': 100,
+                'num_files': 1,
+                'queue': handle.status().queue_position,
+                'total_wanted': handle.status().total_wanted,
+                'name': 'test_torrent.file',
+            },
+        )
+        # The compiled getter is reused for the same keys.
+        getter = deluge.core.torrent.get_status_getter(keys)
+        self.assertIs(deluge.core.torrent.get_status_getter(tuple(keys)), getter)
+        self.assertEqual(
+            sorted(self.torrent.get_status([], all_keys=True)),
+            sorted(deluge.core.torrent.STATUS_EXPRESSIONS),
+        )
+
+    def test_prev_status_cache(self):
+        def prev_status():
+            return PrevStatus(('name',), ('files',), 0, array(str('l'), [0]))
+
+        size = sys.getsizeof(prev_status()) + sys.getsizeof(array(str('l'), [0]))
+        cache = PrevStatusCache(2 * size)
+        for torrent_id in ('a', 'b', 'c'):
+            cache.store(1, torrent_id, prev_status())
+        # The least recently diffed torrent is evicted past the session budget.
+        self.assertIsNone(cache.get(1, 'a'))
+        self.assertIsNotNone(cache.get(1, 'b'))
+        cache.store(1, 'd', prev_status())
+        self.assertIsNone(cache.get(1, 'c'))
+        self.assertEqual(list(cache.sessions[1].torrents), ['b', 'd'])
+
+        cache.store(2, 'a', prev_status())
+        self.assertEqual(
+            cache.get_memory_status(),
+            {
+                'prev_status_memory': 3 * size,
+                'prev_status_sessions': 2,
+                'prev_status_evictions': 2,
+            },
+        )
+
+        cache.sessions[1].last_used -= 60
+        cache.cleanup(lambda session_id: True, idle_timeout=30)
+        self.assertEqual(list(cache.sessions), [2])
+        cache.cleanup(lambda session_id: False)
+        self.assertEqual(cache.get_memory_status()['prev_status_memory'], 0)
+
+    def test_shared_options(self):
+        atp = self.get_torrent_atp('dir_with_6_files.torrent')
+        torrent = Torrent(self.session.add_torrent(atp), {'max_connections': 5})
+        atp = self.get_torrent_atp('test_torrent.file.torrent')
+        torrent2 = Torrent(self.session.add_torrent(atp), {})
+
+        self.assertIs(torrent.options.defaults, torrent2.options.defaults)
+        options = TorrentOptions()
+        options['max_connections'] = 5
+        options['file_priorities'] = torrent.get_file_priorities()
+        self.assertEqual(torrent.get_options(), options)
+        torrent.set_max_connections(torrent2.options['max_connections'])
+        self.assertNotIn('max_connections', torrent.options.overrides)
+
+        # The mutable defaults are copied before they can be modified.
+        torrent2.options['mapped_files'][0] = 'renamed'
+        self.assertEqual(torrent.options.defaults['mapped_files'], {})
+
+        del torrent2.options['name']
+        self.assertNotIn('name', torrent2.options)
+        self.assertEqual(len(torrent2.options), len(TorrentOptions()) - 1)
+
+    def test_interned_trackers(self):
+        trackers = [{'url': 'http://tracker.example.org/announce', 'tier': 0}]
+        atp = self.get_torrent_atp('dir_with_6_files.torrent')
+        torrent = Torrent(self.session.add_torrent(atp), {})
+        torrent.set_trackers(trackers)
+        atp = self.get_torrent_atp('test_torrent.file.torrent')
+        torrent2 = Torrent(self.session.add_torrent(atp), {})
+        torrent2.set_trackers(trackers)
+
+        self.assertIs(torrent.tracker_entries, torrent2.tracker_entries)
+        torrent.set_tracker_status('Announce OK', trackers[0]['url'])
+        self.assertEqual(torrent.trackers[0]['message'], 'Announce OK')
+        self.assertEqual(torrent.trackers[0]['url'], trackers[0]['url'])
+        self.assertNotEqual(torrent2.trackers[0]['message'], 'Announce OK')
+        self.assertIsNone(torrent2.tracker_messages)
+
+        # The trackers are listed without asking libtorrent.
+        with mock.patch.object(torrent, 'handle') as handle:
+            self.assertEqual(torrent.trackers[0]['tier'], 0)
+            self.assertFalse(handle.trackers.called)
+
+    def test_file_table(self):
+        atp = self.get_torrent_atp('dir_with_6_files.torrent')
+        torrent = Torrent(self.session.add_torrent(atp), {})
+
+        file_table = torrent.get_file_table()
+        self.assertIs(torrent.get_file_table(), file_table)
+        self.assertEqual(len(file_table), torrent.torrent_info.num_files())
+        self.assertEqual(
+            torrent.get_files(), convert_lt_files(torrent.torrent_info.files())
+        )
+        self.assertEqual(
+            torrent.get_orig_files(),
+            convert_lt_files(torrent.torrent_info.orig_files()),
+        )
+
+        torrent.on_file_renamed()
+        self.assertIsNot(torrent.get_file_table(), file_table)
+        self.assertEqual(torrent.get_file_table().paths, file_table.paths)
+
+    def test_pieces_packed(self):
+        atp = self.get_torrent_atp('dir_with_6_files.torrent')
+        torrent = Torrent(self.session.add_torrent(atp), {})
+        status = torrent.get_status(['pieces', 'pieces_packed', 'num_pieces'])
+        self.assertEqual(len(status['pieces']), status['num_pieces'])
+        self.assertEqual(
+            unpack_pieces(status['pieces_packed'], status['num_pieces']),
+            status['pieces'],
+        )
+
+    def test_peer_name_cache(self):
+        cache = PeerNameCache(2)
+        geoip = mock.Mock()
+        geoip.country_code_by_addr.side_effect = lambda ip: {'1.1.1.1': 'A1'}.get(ip)
+
+        self.assertEqual(cache.get_country(geoip, '1.1.1.1'), 'A ')
+        self.assertEqual(cache.get_country(geoip, '1.1.1.1'), 'A ')
+        self.assertEqual(cache.get_country(geoip, '2.2.2.2'), '')
+        self.assertEqual(geoip.country_code_by_addr.call_count, 2)
+        self.assertEqual(cache.get_country(None, '1.1.1.1'), '')
+
+        # The least recently used entry is dropped first.
+        cache.get_country(geoip, '1.1.1.1')
+        cache.get_country(geoip, '3.3.3.3')
+        self.assertEqual(list(cache.countries), ['1.1.1.1', '3.3.3.3'])
+
+        # The countries are looked up again in a new GeoIP database.
+        geoip2 = mock.Mock()
+        geoip2.country_code_by_addr.return_value = 'B2'
+        self.assertEqual(cache.get_country(geoip2, '1.1.1.1'), 'B ')
+        self.assertEqual(list(cache.countries), ['1.1.1.1'])
+
+        peer = mock.Mock(client=b'Deluge 2.0')
+        self.assertEqual(cache.get_client(peer), 'Deluge 2.0')
+        peer = mock.Mock()
+        type(peer).client = mock.PropertyMock(
+            side_effect=UnicodeDecodeError('utf8', b'\xff', 0, 1, 'invalid')
+        )
+        self.assertEqual(cache.get_client(peer), 'unknown')
+
+    def test_get_peer_info(self):
+        atp = self.get_torrent_atp('test_torrent.file.torrent')
+        handle = self.session.add_torrent(atp)
+        torrent = Torrent(handle, {})
+        torrent.handle = mock.Mock()
+        torrent.handle.get_peer_info.return_value = []
+
+        torrent.get_peer_info()
+        torrent.get_peer_info()
+        self.assertEqual(torrent.handle.get_peer_info.call_count, 1)
+        # The peer info is fetched again on a status update or once outdated.
+        torrent.update_status(torrent.status)
+        torrent.get_peer_info()
+        self.assertEqual(torrent.handle.get_peer_info.call_count, 2)
+        torrent.peer_info_time -= PEER_INFO_MAX_AGE
+        torrent.get_peer_info()
+        self.assertEqual(torrent.handle.get_peer_info.call_count, 3)
+
     def test_get_name_unicode(self):
         """Test retrieving a unicode torrent name from libtorrent."""
         atp = self.get_torrent_atp('unicode_file.torrent')
@@ -7,8 +7,10 @@
 
 from __future__ import unicode_literals
 
+import operator
 import os
 import shutil
+import time
 import warnings
 from base64 import b64encode
 
@@ -17,8 +19,16 @@
 from twisted.internet import defer, task
 
 from deluge import component
+from deluge._libtorrent import lt
+from deluge.common import AUTH_LEVEL_NORMAL
 from deluge.core.core import Core
 from deluge.core.rpcserver import RPCServer
+from deluge.core.torrentmanager import (
+    RESUME_RECORD,
+    STATE_INDEX_HEADER,
+    StateIndex,
+    TorrentState,
+)
 from deluge.error import InvalidTorrentError
 
 from . import common
@@ -56,6 +66,46 @@ def test_remove_torrent(self):
         )
         self.assertTrue(self.tm.remove(torrent_id, False))
 
+    @defer.inlineCallbacks
+    def test_status_snapshot(self):
+        filename = common.get_test_data_file('test.torrent')
+        with open(filename, 'rb') as _file:
+            filedump = _file.read()
+        torrent_id = yield self.core.add_torrent_file_async(
+            filename, b64encode(filedump), {}
+        )
+        torrent = self.tm.torrents[torrent_id]
+        keys = ['name', 'total_wanted', 'ratio', 'num_peers', 'state']
+
+        d = defer.Deferred()
+        self.tm.handle_torrents_status_callback((d, [torrent_id], keys, False))
+        status_dict, plugin_keys = yield d
+        self.assertEqual(status_dict[torrent_id], torrent.get_status(keys))
+        self.assertEqual(
+            sorted(self.tm.status_snapshot.columns),
+            ['num_peers', 'ratio', 'total_wanted'],
+        )
+
+        # The row is filled again when the libtorrent status is replaced.
+        status = mock.MagicMock(total_wanted=42, total_done=0, num_peers=0, num_seeds=0)
+        torrent.update_status(status)
+        self.tm.status_snapshot.update([torrent_id])
+        self.assertEqual(
+            self.tm.status_snapshot.get_status(torrent_id, ['total_wanted']),
+            {'total_wanted': 42},
+        )
+        self.assertEqual(
+            self.core.filtermanager.filter_torrent_ids({'total_wanted': [42]}),
+            [torrent_id],
+        )
+        self.assertEqual(
+            self.core.filtermanager.filter_torrent_ids({'total_wanted': [0]}), []
+        )
+
+        torrent.update_status(torrent.handle.status())
+        self.assertTrue(self.tm.remove(torrent_id, False))
+        self.assertEqual(self.tm.status_snapshot.slots, {})
+
     def test_prefetch_metadata(self):
         from deluge._libtorrent import lt
 
@@ -111,6 +161,86 @@ def test_prefetch_metadata_timeout(self):
         expected = ('ab570cdd5a17ea1b61e970bb72047de141bce173', None)
         return d.addCallback(self.assertEqual, expected)
 
+    @defer.inlineCallbacks
+    def test_get_torrent_list_owner_index(self):
+        filename = common.get_test_data_file('test.torrent')
+        with open(filename, 'rb') as _file:
+            filedump = _file.read()
+        torrent_id = yield self.core.add_torrent_file_async(
+            filename, b64encode(filedump), {}
+        )
+        torrent = self.tm.torrents[torrent_id]
+        torrent.set_owner('user1')
+        self.assertEqual(self.tm.owner_torrents, {'user1': {torrent_id}})
+
+        with mock.patch.object(
+            self.rpcserver, 'get_session_auth_level', return_value=AUTH_LEVEL_NORMAL
+        ), mock.patch.object(self.rpcserver, 'get_session_user') as session_user:
+            session_user.return_value = 'user1'
+            self.assertEqual(self.tm.get_torrent_list(), [torrent_id])
+            session_user.return_value = 'user2'
+            self.assertEqual(self.tm.get_torrent_list(), [])
+            torrent.set_options({'shared': True})
+            self.assertEqual(self.tm.get_torrent_list(), [torrent_id])
+
+        self.tm.remove(torrent_id)
+        self.assertEqual(self.tm.owner_torrents, {})
+        self.assertEqual(self.tm.shared_torrents, set())
+
+    @defer.inlineCallbacks
+    def test_ratio_checks(self):
+        # The state changes of the paused torrents are emitted on shutdown.
+        component.get('EventManager').set_coalesce_window(0)
+        torrents = []
+        for filename in ('test.torrent', 'dir_with_6_files.torrent'):
+            filename = common.get_test_data_file(filename)
+            with open(filename, 'rb') as _file:
+                filedump = _file.read()
+            torrent_id = yield self.core.add_torrent_file_async(
+                filename, b64encode(filedump), {}
+            )
+            torrents.append(self.tm.torrents[torrent_id])
+        statuses = [
+            # The stop ratio is reached.
+            mock.MagicMock(total_done=100, all_time_upload=300, paused=False),
+            # Uploading the 150 bytes left to the stop ratio takes 15 seconds.
+            mock.MagicMock(total_done=100, all_time_upload=50, upload_payload_rate=10),
+        ]
+
+        for torrent, status in zip(torrents, statuses):
+            torrent.is_finished = True
+            torrent.state = 'Seeding'
+            torrent.set_options({'stop_at_ratio': True, 'stop_ratio': 2.0})
+            self.assertIn(torrent.torrent_id, self.tm.ratio_checks)
+            torrent.handle = mock.MagicMock(wraps=torrent.handle)
+            torrent.update_status(status)
+
+        with mock.patch('deluge.core.torrent.Torrent.pause') as pause:
+            self.tm.update()
+        pause.assert_called_once_with()
+        # The ratio is checked from the current status.
+        for torrent in torrents:
+            torrent.handle.status.assert_not_called()
+        self.assertEqual(list(self.tm.ratio_checks), [torrents[1].torrent_id])
+        # The next check is halfway to the predicted time.
+        delay = self.tm.ratio_checks[torrents[1].torrent_id] - time.time()
+        self.assertTrue(6.5 < delay <= 7.5)
+
+        for torrent in torrents:
+            torrent.handle = torrent.handle._mock_wraps
+            torrent.update_status(torrent.handle.status())
+
+    def test_ratio_check_pending_load(self):
+        torrent_id = 'a' * 40
+        self.tm.torrents_pending_load[torrent_id] = TorrentState(torrent_id=torrent_id)
+        self.tm.schedule_ratio_check(torrent_id)
+        self.tm.update()
+        # The torrent is checked again once it is loaded.
+        self.assertIn(torrent_id, self.tm.ratio_checks)
+        # A removed torrent is not checked again.
+        del self.tm.torrents_pending_load[torrent_id]
+        self.assertIsNone(self.tm.check_ratio(torrent_id))
+
     @pytest.mark.todo
     def test_remove_torrent_false(self):
         """Test when remove_torrent returns False"""
@@ -121,6 +251,241 @@ def test_remove_invalid_torrent(self):
             InvalidTorrentError, self.tm.remove, 'torrentidthatdoesntexist'
         )
 
+    @defer.inlineCallbacks
+    def test_save_state_journal(self):
+        filename = common.get_test_data_file('test.torrent')
+        with open(filename, 'rb') as _file:
+            filedump = _file.read()
+        torrent_id = yield self.core.add_torrent_file_async(
+            filename, b64encode(filedump), {}, save_state=False
+        )
+        state_file = os.path.join(self.config_dir, 'state', 'torrents.state')
+        journal_file = state_file + '.journal'
+
+        # The first save creates the snapshot.
+        self.tm._save_state()
+        self.assertTrue(os.path.isfile(state_file))
+        self.assertEqual(os.path.getsize(journal_file), 0)
+        snapshot_mtime = os.path.getmtime(state_file)
+
+        # The changes are appended to the journal and replayed on load.
+        self.tm.torrents[torrent_id].set_options({'stop_ratio': 3.0})
+        self.tm._save_state()
+        self.assertEqual(os.path.getmtime(state_file), snapshot_mtime)
+        self.assertEqual(self.tm.state_journal_length, 1)
+        state = self.tm.open_state()
+        self.assertEqual(len(state.torrents), 1)
+        self.assertEqual(state.torrents[0].stop_ratio, 3.0)
+
+        # An incomplete change at the end of the journal is truncated.
+        journal_size = os.path.getsize(journal_file)
+        with open(journal_file, 'ab') as _file:
+            _file.write(b'\x80\x02}q')
+        state = self.tm.open_state()
+        self.assertEqual(state.torrents[0].stop_ratio, 3.0)
+        self.assertEqual(os.path.getsize(journal_file), journal_size)
+
+        # A failed append is truncated so later changes are not discarded.
+        self.tm.torrents[torrent_id].set_options({'stop_ratio': 4.0})
+        with mock.patch('os.fsync', side_effect=OSError):
+            self.tm._save_state()
+        self.assertEqual(os.path.getsize(journal_file), journal_size)
+        self.tm._save_state()
+        self.assertEqual(self.tm.open_state().torrents[0].stop_ratio, 4.0)
+
+        self.tm.remove(torrent_id, save_state=False)
+        with mock.patch('deluge.core.torrentmanager.STATE_JOURNAL_COMPACT_MIN', 0):
+            self.tm._save_state()
+        self.assertEqual(os.path.getsize(journal_file), 0)
+        self.assertEqual(self.tm.open_state().torrents, [])
+
+    @defer.inlineCallbacks
+    def test_resume_data_store(self):
+        store = self.tm.resume_store
+        torrent_ids = ['a' * 40, 'b' * 40]
+        # Resume data of older versions is loaded until the store is saved.
+        legacy = {torrent_id.encode(): b'd1:ai1ee' for torrent_id in torrent_ids}
+        legacy_file = os.path.join(self.tm.state_dir, 'torrents.fastresume')
+        with open(legacy_file, 'wb') as _file:
+            _file.write(lt.bencode(legacy))
+        self.tm.resume_data = self.tm.load_resume_data_file()
+        self.assertEqual(sorted(self.tm.resume_data), torrent_ids)
+
+        # The first save compacts all the resume data into the store.
+        result = yield self.tm.save_resume_data_file()
+        self.assertTrue(result)
+        self.assertEqual(store.load(), self.tm.resume_data)
+
+        # Only the changed resume data is appended.
+        size = os.path.getsize(store.filepath)
+        self.tm.resume_data[torrent_ids[0]] = b'd1:ai2ee'
+        self.tm.resume_data_dirty.add(torrent_ids[0])
+        self.tm.resume_data.pop(torrent_ids[1])
+        self.tm.resume_data_dirty.add(torrent_ids[1])
+        yield self.tm.save_resume_data_file()
+        size += 2 * RESUME_RECORD.size + len(b'd1:ai2ee')
+        self.assertEqual(os.path.getsize(store.filepath), size)
+        self.assertEqual(store.records, 4)
+        self.assertEqual(store.load(), {torrent_ids[0]: b'd1:ai2ee'})
+
+        # A torn record at the end of the store is truncated.
+        with open(store.filepath, 'ab') as _file:
+            _file.write(store.pack_record('c' * 40, b'd1:ai3ee')[:-1])
+        self.assertEqual(self.tm.load_resume_data_file(), {torrent_ids[0]: b'd1:ai2ee'})
+        self.assertEqual(os.path.getsize(store.filepath), size)
+
+        # A failed append is truncated so later records are not discarded.
+        with mock.patch('os.fsync', side_effect=OSError):
+            self.assertRaises(OSError, store.append, {torrent_ids[1]: b'd1:ai4ee'})
+        self.assertEqual(os.path.getsize(store.filepath), size)
+
+        # The previous store is kept as a backup when compacting.
+        store.compact({torrent_ids[1]: b'd1:ai4ee'})
+        os.remove(store.filepath)
+        self.assertEqual(store.load(), {torrent_ids[0]: b'd1:ai2ee'})
+
+    @defer.inlineCallbacks
+    def test_load_state_batches(self):
+        # The state changes of the paused torrents are emitted on shutdown.
+        component.get('EventManager').set_coalesce_window(0)
+        torrent_ids = []
+        for filename, options in (
+            ('test.torrent', {}),
+            ('dir_with_6_files.torrent', {}),
+            ('unicode_filenames.torrent', {'add_paused': True}),
+        ):
+            filename = common.get_test_data_file(filename)
+            with open(filename, 'rb') as _file:
+                filedump = _file.read()
+            torrent_id = yield self.core.add_torrent_file_async(
+                filename, b64encode(filedump), options, save_state=False
+            )
+            torrent_ids.append(torrent_id)
+        # The download is loaded first, then the recently active seed, then the
+        # paused torrent.
+        self.tm.torrents[torrent_ids[0]].is_finished = True
+        self.tm._save_state()
+        resume_data = {
+            torrent_ids[0]: b'd11:last_uploadi%dee' % time.time(),
+            torrent_ids[1]: b'd11:last_uploadi0ee',
+        }
+
+        # Load the saved state again without adding the torrents twice.
+        with mock.patch.object(
+            self.tm, 'add_async', return_value=defer.succeed(None)
+        ) as add_async, mock.patch.object(
+            component.get('EventManager'), 'emit'
+        ) as emit, mock.patch.object(
+            self.tm, 'load_resume_data_file', return_value=resume_data
+        ), mock.patch(
+            'deluge.core.torrentmanager.STARTUP_BATCH_SIZE', 2
+        ):
+            yield self.tm.load_state()
+
+        # The torrents are added by tier with their torrent_info.
+        added = [kwargs['state'] for dummy_args, kwargs in add_async.call_args_list]
+        self.assertEqual(
+            [t_state.torrent_id for t_state in added],
+            [torrent_ids[1], torrent_ids[0], torrent_ids[2]],
+        )
+        for dummy_args, kwargs in add_async.call_args_list:
+            self.assertTrue(kwargs['torrent_info'])
+        self.assertEqual(self.tm.torrents_pending_load, {})
+
+        events = [call_args[0][0] for call_args in emit.call_args_list]
+        self.assertEqual(
+            [
+                (event.name, event.args)
+                for event in events
+                if event.name.startswith('Session')
+            ],
+            [
+                ('SessionLoadingEvent', [1, 3]),
+                ('SessionLoadingEvent', [2, 3]),
+                ('SessionLoadingEvent', [3, 3]),
+                ('SessionStartedEvent', []),
+            ],
+        )
+        status = self.core.get_session_startup_status()
+        self.assertEqual((status['total'], status['loaded']), (3, 3))
+        self.assertEqual(status['downloads'], 1)
+        self.assertTrue(0 <= status['downloads_duration'] <= status['duration'])
+
+    @defer.inlineCallbacks
+    def test_pending_torrents(self):
+        torrent_id = 'a' * 40
+        self.tm.torrents_pending_load[torrent_id] = TorrentState(
+            torrent_id, paused=True, queue=3, name='Pending'
+        )
+
+        self.assertEqual(
+            self.core.get_torrent_status(torrent_id, ['name', 'state', 'progress']),
+            {'name': 'Pending', 'state': 'Paused'},
+        )
+        status = yield self.core.get_torrents_status({'id': [torrent_id]}, ['queue'])
+        self.assertEqual(status, {torrent_id: {'queue': 3}})
+
+        filtermanager = self.core.filtermanager
+        self.assertEqual(filtermanager.filter_torrent_ids({}), [torrent_id])
+        self.assertEqual(
+            filtermanager.filter_torrent_ids({'state': 'Paused'}), [torrent_id]
+        )
+        self.assertEqual(filtermanager.filter_torrent_ids({'state': 'Seeding'}), [])
+        self.assertEqual(filtermanager.filter_torrent_ids({'name': 'Pending'}), [])
+        tree = self.core.get_filter_tree()
+        self.assertIn(('Paused', 1), tree['state'])
+        self.assertIn(('All', 1), tree['state'])
+        del self.tm.torrents_pending_load[torrent_id]
+
+    def test_state_index(self):
+        filepath = os.path.join(self.config_dir, 'state', 'torrents.state.index')
+        index = StateIndex(filepath)
+        index.write(
+            [
+                ('b' * 40, 'Über', '/downloads', 1, 'user', False, True, True),
+                ('a' * 40, '', '/other', 0, 'localclient', True, False, False),
+            ]
+        )
+        self.assertTrue(index.open())
+        self.assertEqual(index.get_torrent_ids(), ['a' * 40, 'b' * 40])
+        self.assertIn('b' * 40, index)
+        self.assertNotIn('c' * 40, index)
+        self.assertEqual(
+            index.get_status('b' * 40, ['name', 'state', 'owner', 'progress']),
+            {'name': 'Über', 'state': 'Queued', 'owner': 'user'},
+        )
+        self.assertEqual(
+            index.get_status('a' * 40, ['name', 'paused', 'save_path']),
+            {'name': 'a' * 40, 'paused': True, 'save_path': '/other'},
+        )
+        self.assertRaises(KeyError, index.get_status, 'c' * 40, [])
+        index.close()
+
+        # An index older than the state files is ignored.
+        self.assertFalse(index.open(time.time() + 10))
+        with open(filepath, 'r+b') as _file:
+            _file.truncate(STATE_INDEX_HEADER.size + 1)
+        self.assertFalse(index.open())
+
+    def test_pending_torrents_from_state_index(self):
+        torrent_id = 'a' * 40
+        self.tm.state_index.write(
+            [(torrent_id, 'Indexed', '/downloads', 2, 'user', True, False, False)]
+        )
+        self.assertTrue(self.tm.state_index.open())
+        self.assertTrue(self.tm.is_pending(torrent_id))
+        self.assertIn(torrent_id, self.core.get_session_state())
+        self.assertEqual(
+            self.core.get_torrent_status(torrent_id, ['name', 'queue']),
+            {'name': 'Indexed', 'queue': 2},
+        )
+        self.assertEqual(
+            self.core.filtermanager.filter_torrent_ids({'state': 'Paused'}),
+            [torrent_id],
+        )
+        self.tm.state_index.close()
+        self.assertFalse(self.tm.is_pending(torrent_id))
+
     def test_open_state_from_python2(self):
         """Open a Python2 state with a UTF-8 encoded torrent filename."""
         shutil.copy(
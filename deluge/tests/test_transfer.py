@@ -10,12 +10,27 @@
 from __future__ import print_function, unicode_literals
 
 import base64
+import random
+import struct
+import zlib
 
 import rencode
 from twisted.trial import unittest
 
 import deluge.log
-from deluge.transfer import DelugeTransferProtocol
+from deluge.transfer import (
+    COMPRESSION_DEFAULT,
+    COMPRESSION_FAST,
+    COMPRESSION_NONE,
+    FLAG_COMPRESSED,
+    MESSAGE_HEADER_FORMAT_V2,
+    MESSAGE_HEADER_SIZE_V2,
+    PROTOCOL_VERSION,
+    DelugeTransferProtocol,
+    get_compression_level,
+)
+
+from .common import fuzz_corpus, make_event_flood
 
 deluge.log.setup_logger('none')
 
@@ -358,6 +373,106 @@ def test_receive_middle_of_header(self):
         message2 = self.transfer.get_messages_in().pop(0)
         self.assertEqual(rencode.dumps(self.msg2), rencode.dumps(message2))
 
+    def test_receive_large_message_in_small_parts(self):
+        """
+        Receive a message larger than a single packet, split into many parts,
+        followed by the start of the next message, and verify that only the
+        unprocessed data remains in the buffer.
+
+        """
+        msg_big = {'key_list': list(range(5000)), 'key_str': 'some string' * 100}
+        self.transfer.transfer_message(msg_big)
+        big_bytes = self.transfer.get_messages_out_joined()
+        msg1_bytes = base64.b64decode(self.msg1_expected_compressed_base64)
+
+        for d in self.receive_parts_helper(big_bytes + msg1_bytes[:3], 7):
+            pass
+
+        self.assertEqual(1, len(self.transfer.get_messages_in()))
+        self.assertEqual(3, len(self.transfer._buffer))
+
+        self.transfer.dataReceived(msg1_bytes[3:])
+        self.assertEqual(0, len(self.transfer._buffer))
+        message1 = self.transfer.get_messages_in().pop(0)
+        self.assertEqual(rencode.dumps(msg_big), rencode.dumps(message1))
+        message2 = self.transfer.get_messages_in().pop(0)
+        self.assertEqual(rencode.dumps(self.msg1), rencode.dumps(message2))
+
+    def test_send_message_version_2_below_threshold(self):
+        """
+        Send a message smaller than the compression threshold with version 2
+        and verify that the body is not compressed.
+
+        """
+        self.transfer.set_protocol_options(PROTOCOL_VERSION, COMPRESSION_FAST, 1024)
+        self.transfer.transfer_message(self.msg1)
+        message = self.transfer.get_messages_out_joined()
+        version, flags, length = struct.unpack_from(MESSAGE_HEADER_FORMAT_V2, message)
+        self.assertEqual(PROTOCOL_VERSION, version)
+        self.assertEqual(0, flags)
+        self.assertEqual(rencode.dumps(self.msg1), message[MESSAGE_HEADER_SIZE_V2:])
+        self.assertEqual(length, len(message) - MESSAGE_HEADER_SIZE_V2)
+
+    def test_send_message_version_2_compressed(self):
+        self.transfer.set_protocol_options(PROTOCOL_VERSION, COMPRESSION_FAST, 0)
+        self.transfer.transfer_message(self.msg1)
+        message = self.transfer.get_messages_out_joined()
+        version, flags, length = struct.unpack_from(MESSAGE_HEADER_FORMAT_V2, message)
+        self.assertEqual(FLAG_COMPRESSED, flags)
+        self.assertEqual(
+            rencode.dumps(self.msg1),
+            zlib.decompress(message[MESSAGE_HEADER_SIZE_V2:]),
+        )
+
+    def test_send_message_version_2_compression_none(self):
+        self.transfer.set_protocol_options(PROTOCOL_VERSION, COMPRESSION_NONE, 0)
+        self.transfer.transfer_message(self.msg2)
+        message = self.transfer.get_messages_out_joined()
+        version, flags, length = struct.unpack_from(MESSAGE_HEADER_FORMAT_V2, message)
+        self.assertEqual(0, flags)
+
+    def test_receive_mixed_protocol_versions_in_parts(self):
+        """
+        Receive a version 1 message and version 2 messages, both compressed and
+        uncompressed, one byte at a time.
+
+        """
+        msg_bytes = base64.b64decode(self.msg1_expected_compressed_base64)
+        for threshold in (0, 1024):
+            self.transfer.set_protocol_options(
+                PROTOCOL_VERSION, COMPRESSION_DEFAULT, threshold
+            )
+            self.transfer.transfer_message(self.msg2)
+        msg_bytes += self.transfer.get_messages_out_joined()
+
+        for d in self.receive_parts_helper(msg_bytes, 1):
+            pass
+
+        messages = self.transfer.get_messages_in()
+        self.assertEqual(3, len(messages))
+        self.assertEqual(rencode.dumps(self.msg1), rencode.dumps(messages[0]))
+        self.assertEqual(rencode.dumps(self.msg2), rencode.dumps(messages[1]))
+        self.assertEqual(rencode.dumps(self.msg2), rencode.dumps(messages[2]))
+        self.assertEqual(0, len(self.transfer._buffer))
+
+    def test_get_compression_level(self):
+        self.assertEqual(COMPRESSION_NONE, get_compression_level('127.0.0.1'))
+        self.assertEqual(COMPRESSION_NONE, get_compression_level('::1'))
+        self.assertEqual(COMPRESSION_NONE, get_compression_level('::ffff:127.0.0.1'))
+        self.assertEqual(COMPRESSION_FAST, get_compression_level('192.168.1.10'))
+        self.assertEqual(COMPRESSION_FAST, get_compression_level('10.0.0.1'))
+        self.assertEqual(COMPRESSION_DEFAULT, get_compression_level('8.8.8.8'))
+        self.assertEqual(COMPRESSION_DEFAULT, get_compression_level('invalid'))
+
+    def test_receive_fuzz_corpus(self):
+        rng = random.Random(1)
+        messages = [self.msg1, self.msg2, make_event_flood(rng, 1)[0]]
+        for data in fuzz_corpus(rng, messages, 300):
+            transfer = TransferTestClass()
+            for offset in range(0, len(data), 7):
+                transfer.dataReceived(data[offset : offset + 7])
+            self.assertTrue(len(transfer.get_messages_in()) <= 1)
+
     # Needs file containing big data structure e.g. like thetorrent list as it is transfered by the daemon
     # def test_simulate_big_transfer(self):
     #    filename = '../deluge.torrentlist'
@@ -17,11 +17,60 @@
 import rencode
 from twisted.internet.protocol import Protocol
 
+from deluge.common import PY2, decode_bytes
+
 log = logging.getLogger(__name__)
 
-PROTOCOL_VERSION = 1
+PROTOCOL_VERSION = 2
+PROTOCOL_VERSION_LEGACY = 1
+# Version 1 header, all bodies are compressed.
 MESSAGE_HEADER_FORMAT = '!BI'
 MESSAGE_HEADER_SIZE = struct.calcsize(MESSAGE_HEADER_FORMAT)
+# Version 2 header, the flags describe the encoding of the body.
+MESSAGE_HEADER_FORMAT_V2 = '!BBI'
+MESSAGE_HEADER_SIZE_V2 = struct.calcsize(MESSAGE_HEADER_FORMAT_V2)
+
+FLAG_COMPRESSED = 0x01
+
+# Compression level used to disable compression of message bodies.
+COMPRESSION_NONE = 0
+COMPRESSION_FAST = zlib.Z_BEST_SPEED
+COMPRESSION_DEFAULT = zlib.Z_DEFAULT_COMPRESSION
+# Bodies smaller than this many bytes are not worth compressing.
+COMPRESSION_THRESHOLD = 1024
+
+
+def get_compression_level(host):
+    """Choose the compression level for messages sent to a peer.
+
+    Compression is disabled for loopback connections and reduced to the
+    fastest level on private networks, where bandwidth is cheaper than CPU.
+
+    Args:
+        host (str): The IP address of the peer.
+
+    Returns:
+        int: The zlib compression level or COMPRESSION_NONE.
+
+    """
+    try:
+        import ipaddress
+    except ImportError:
+        return COMPRESSION_DEFAULT
+
+    try:
+        address = ipaddress.ip_address(decode_bytes(host))
+    except ValueError:
+        return COMPRESSION_DEFAULT
+
+    if getattr(address, 'ipv4_mapped', None):
+        address = address.ipv4_mapped
+
+    if address.is_loopback:
+        return COMPRESSION_NONE
+    elif address.is_private or address.is_link_local:
+        return COMPRESSION_FAST
+    return COMPRESSION_DEFAULT
 
 
 class DelugeTransferProtocol(Protocol, object):
@@ -31,21 +80,74 @@ class DelugeTransferProtocol(Protocol, object):
     Data messages are transfered with a header containing a protocol version
     and the length of the data to be transfered (payload).
 
-    The format is::
+    The version 1 format is::
 
             ubyte    uint4     bytestring
         |.version.|..size..|.....body.....|
 
+    The version 2 format is::
+
+            ubyte    ubyte    uint4     bytestring
+        |.version.|.flags.|..size..|.....body.....|
+
     The version is an unsigned byte that indicates the protocol version.
+    The flags is an unsigned byte, if FLAG_COMPRESSED is set the body is compressed.
     The size is a unsigned 32-bit integer that is equal to the length of the body bytestring.
-    The body is the compressed rencoded byte string of the data object.
+    The body is the rencoded byte string of the data object, compressed
+    with zlib for version 1 and as indicated by the flags for version 2.
+
+    Messages are sent using version 1 until :meth:`set_protocol_options` is
+    called with the options agreed with the peer, but both versions are
+    always accepted when receiving.
     """
 
     def __init__(self):
-        self._buffer = b''  # TODO: Look into using bytearray instead of byte string.
+        self._buffer = bytearray()
         self._message_length = 0
+        self._message_flags = 0
         self._bytes_received = 0
         self._bytes_sent = 0
+        self._protocol_version = PROTOCOL_VERSION_LEGACY
+        self._compression_level = COMPRESSION_DEFAULT
+        self._compression_threshold = COMPRESSION_THRESHOLD
+
+    def set_protocol_options(
+        self,
+        version,
+        compression_level=COMPRESSION_DEFAULT,
+        compression_threshold=COMPRESSION_THRESHOLD,
+    ):
+        """
+        Set the options used to send messages, as negotiated with the peer.
+
+        :param version: the protocol version to send messages with.
+        :type version: int
+        :param compression_level: the zlib compression level or COMPRESSION_NONE.
+        :type compression_level: int
+        :param compression_threshold: the body size in bytes below which
+            bodies are sent uncompressed.
+        :type compression_threshold: int
+
+        """
+        if version not in (PROTOCOL_VERSION_LEGACY, PROTOCOL_VERSION):
+            raise ValueError('Unsupported protocol version: {}'.format(version))
+        self._protocol_version = version
+        self._compression_level = compression_level
+        self._compression_threshold = compression_threshold
+
+    def get_protocol_options(self):
+        """
+        Returns the options used to send messages.
+
+        :returns: the protocol version, compression level and threshold.
+        :rtype: dict
+
+        """
+        return {
+            'version': self._protocol_version,
+            'compression_level': self._compression_level,
+            'compression_threshold': self._compression_threshold,
+        }
 
     def transfer_message(self, data):
         """
@@ -53,14 +155,50 @@ def transfer_message(self, data):
 
         :param data: data to be transfered in a data structure serializable by rencode.
         """
-        body = zlib.compress(rencode.dumps(data))
-        body_len = len(body)
-        message = struct.pack(
-            '{}{}s'.format(MESSAGE_HEADER_FORMAT, body_len),
-            PROTOCOL_VERSION,
-            body_len,
-            body,
-        )
+        self.write_message(self.encode_message(rencode.dumps(data)))
+
+    def encode_message(self, body):
+        """
+        Build the message for an encoded body with the protocol options of
+        this connection.
+
+        The same message can be written to every connection with the same
+        :meth:`get_protocol_options`, which avoids encoding data sent to many
+        peers more than once.
+
+        :param body: the data encoded with rencode.
+        :type body: bytes
+
+        :returns: the message with the header.
+        :rtype: bytes
+
+        """
+        if self._protocol_version == PROTOCOL_VERSION_LEGACY:
+            body = zlib.compress(body)
+            header = struct.pack(
+                MESSAGE_HEADER_FORMAT, self._protocol_version, len(body)
+            )
+        else:
+            flags = 0
+            if (
+                self._compression_level != COMPRESSION_NONE
+                and len(body) >= self._compression_threshold
+            ):
+                body = zlib.compress(body, self._compression_level)
+                flags |= FLAG_COMPRESSED
+            header = struct.pack(
+                MESSAGE_HEADER_FORMAT_V2, self._protocol_version, flags, len(body)
+            )
+        return header + body
+
+    def write_message(self, message):
+        """
+        Write a message built by :meth:`encode_message` to the transport.
+
+        :param message: the message with the header.
+        :type message: bytes
+
+        """
         self._bytes_sent += len(message)
         self.transport.write(message)
 
@@ -72,63 +210,116 @@ def dataReceived(self, data):  # NOQA: N802
                      a messsage.
 
         Global variables:
-            _buffer         - contains the data received
+            _buffer         - contains the data received but not yet processed.
             _message_length - the length of the payload of the current message.
 
+        The received data is appended to a growable bytearray and complete
+        messages are handed on as memoryview slices of it (bytes on Python 2),
+        so a message arriving in many parts is not copied again for every part.
+
         """
         self._buffer += data
         self._bytes_received += len(data)
 
-        while len(self._buffer) >= MESSAGE_HEADER_SIZE:
+        offset = 0
+        while True:
             if self._message_length == 0:
-                self._handle_new_message()
+                if len(self._buffer) - offset < MESSAGE_HEADER_SIZE:
+                    break
+                header_size = self._handle_new_message(offset)
+                if header_size is None:
+                    # The buffer has been discarded along with the invalid header.
+                    return
+                elif not header_size:
+                    # Wait for the rest of the header.
+                    break
+                offset += header_size
+
+            message_end = offset + self._message_length
+            if len(self._buffer) < message_end:
+                break
             # We have a complete packet
-            if len(self._buffer) >= self._message_length:
-                self._handle_complete_message(self._buffer[: self._message_length])
-                # Remove message data from buffer
-                self._buffer = self._buffer[self._message_length :]
-                self._message_length = 0
+            if PY2:
+                # zlib and rencode do not accept a memoryview on Python 2.
+                body = bytes(self._buffer[offset:message_end])
             else:
-                break
+                body = memoryview(self._buffer)[offset:message_end]
+            try:
+                self._handle_complete_message(body)
+            finally:
+                # Release the view so that the buffer can be resized, even if a
+                # reference to it is still held, e.g. by a logged traceback.
+                if not PY2:
+                    body.release()
+            offset = message_end
+            self._message_length = 0
+
+        # Remove processed data from buffer
+        if offset:
+            del self._buffer[:offset]
 
-    def _handle_new_message(self):
+    def _handle_new_message(self, offset=0):
         """
         Handle the start of a new message. This method is called only when the
-        beginning of the buffer contains data from a new message (i.e. the header).
+        buffer contains data from a new message (i.e. the header) at `offset`.
+
+        :param offset: the position of the header in the buffer.
+        :type offset: int
+
+        :returns: the size of the header, 0 if the header is incomplete or
+            None if the header is invalid and the buffer was discarded.
+        :rtype: int
 
         """
         try:
-            # Read the first bytes of the message (MESSAGE_HEADER_SIZE bytes)
-            header = self._buffer[:MESSAGE_HEADER_SIZE]
-            # Extract the length stored as an unsigned 32-bit integer
-            version, self._message_length = struct.unpack(MESSAGE_HEADER_FORMAT, header)
-            if version != PROTOCOL_VERSION:
-                raise Exception(
-                    'Received invalid protocol version: {}. PROTOCOL_VERSION is {}.'.format(
-                        version, PROTOCOL_VERSION
-                    )
+            # The first byte of the header is the protocol version.
+            version = self._buffer[offset]
+            if version == PROTOCOL_VERSION_LEGACY:
+                # Extract the length stored as an unsigned 32-bit integer
+                version, self._message_length = struct.unpack_from(
+                    MESSAGE_HEADER_FORMAT, self._buffer, offset
+                )
+                self._message_flags = FLAG_COMPRESSED
+                return MESSAGE_HEADER_SIZE
+            elif version == PROTOCOL_VERSION:
+                if len(self._buffer) - offset < MESSAGE_HEADER_SIZE_V2:
+                    return 0
+                (
+                    version,
+                    self._message_flags,
+                    self._message_length,
+                ) = struct.unpack_from(MESSAGE_HEADER_FORMAT_V2, self._buffer, offset)
+                return MESSAGE_HEADER_SIZE_V2
+            raise Exception(
+                'Received invalid protocol version: {}. PROTOCOL_VERSION is {}.'.format(
+                    version, PROTOCOL_VERSION
                 )
-            # Remove the header from the buffer
-            self._buffer = self._buffer[MESSAGE_HEADER_SIZE:]
+            )
         except Exception as ex:
             log.warning('Error occurred when parsing message header: %s.', ex)
             log.warning(
                 'This version of Deluge cannot communicate with the sender of this data.'
             )
             self._message_length = 0
-            self._buffer = b''
+            self._message_flags = 0
+            self._buffer = bytearray()
+            return None
 
     def _handle_complete_message(self, data):
         """
         Handles a complete message as it is transfered on the network.
 
-        :param data: a zlib compressed string encoded with rencode.
+        :param data: a string encoded with rencode, zlib compressed if the
+            message flags include FLAG_COMPRESSED.
+        :type data: bytes-like object, e.g. a memoryview of the receive buffer.
 
         """
         try:
-            self.message_received(
-                rencode.loads(zlib.decompress(data), decode_utf8=True)
-            )
+            if self._message_flags & FLAG_COMPRESSED:
+                data = zlib.decompress(data)
+            else:
+                data = bytes(data)
+            self.message_received(rencode.loads(data, decode_utf8=True))
         except Exception as ex:
             log.warning(
                 'Failed to decompress (%d bytes) and load serialized data with rencode: %s',
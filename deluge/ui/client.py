@@ -16,15 +16,17 @@
 
 from twisted.internet import defer, reactor, ssl
 from twisted.internet.protocol import ClientFactory
+from twisted.python.failure import Failure
 
 from deluge import error
 from deluge.common import get_localhost_auth, get_version
 from deluge.decorators import deprecated
-from deluge.transfer import DelugeTransferProtocol
+from deluge.transfer import PROTOCOL_VERSION, DelugeTransferProtocol
 
 RPC_RESPONSE = 1
 RPC_ERROR = 2
 RPC_EVENT = 3
+RPC_RESPONSE_CHUNK = 4
 
 log = logging.getLogger(__name__)
 
@@ -83,6 +85,11 @@ def format_message(self):
 class DelugeRPCProtocol(DelugeTransferProtocol):
     def connectionMade(self):  # NOQA: N802
         self.__rpc_requests = {}
+        # Holds the requests waiting to be sent in the next message
+        self.__pending_requests = []
+        self.__flush_call = None
+        # Holds the partial results of chunked responses with the request_id as key
+        self.__rpc_chunks = {}
         # Set the protocol in the daemon so it can send data
         self.factory.daemon.protocol = self
         # Get the address of the daemon that we've connected to
@@ -124,6 +131,23 @@ def message_received(self, request):
 
         request_id = request[1]
 
+        if message_type == RPC_RESPONSE_CHUNK:
+            if request_id not in self.__rpc_requests:
+                # The request has already failed on an earlier chunk.
+                return
+            try:
+                result = self.__add_response_chunk(*request[1:])
+            except error.DelugeError as ex:
+                log.warning(ex)
+                self.factory.daemon.pop_deferred(request_id).errback(ex)
+                del self.__rpc_requests[request_id]
+                return
+            if result is None:
+                # Wait for the remaining chunks of the response.
+                return
+            message_type = RPC_RESPONSE
+            request = (RPC_RESPONSE, request_id, result)
+
         # We get the Deferred object for this request_id to either run the
         # callbacks or the errbacks dependent on the response from the daemon.
         d = self.factory.daemon.pop_deferred(request_id)
@@ -132,6 +156,8 @@ def message_received(self, request):
             # Run the callbacks registered with this Deferred object
             d.callback(request[2])
         elif message_type == RPC_ERROR:
+            # Discard the chunks received before the error.
+            self.__rpc_chunks.pop(request_id, None)
             # Recreate exception and errback'it
             try:
                 # The exception class is located in deluge.error
@@ -182,21 +208,63 @@ def message_received(self, request):
             d.errback(exception)
         del self.__rpc_requests[request_id]
 
+    def __add_response_chunk(self, request_id, sequence, last, chunk):
+        """
+        Adds a chunk of a RPC Response sent in parts by the daemon.
+
+        :returns: the complete result once the last chunk is received, None otherwise.
+        :rtype: dict
+        :raises DelugeError: if a chunk is out of sequence, the partial result is
+            discarded.
+
+        """
+        expected_sequence, result = self.__rpc_chunks.pop(request_id, (0, {}))
+        if sequence != expected_sequence:
+            raise error.DelugeError(
+                'Received response chunk %s for request %s, expected %s'
+                % (sequence, request_id, expected_sequence)
+            )
+        result.update(chunk)
+        if last:
+            return result
+        self.__rpc_chunks[request_id] = (sequence + 1, result)
+        return None
+
     def send_request(self, request):
         """
         Sends a RPCRequest to the server.
 
+        The request is queued and all the requests made within the same reactor
+        iteration are sent together in a single message.
+
         :param request: RPCRequest
 
         """
+        # Store the DelugeRPCRequest object just in case a RPCError is sent in
+        # response to this request.  We use the extra information when printing
+        # out the error for debugging purposes.
+        self.__rpc_requests[request.request_id] = request
+        self.__pending_requests.append(request)
+        if not self.__flush_call:
+            self.__flush_call = reactor.callLater(0, self.flush_requests)
+
+    def flush_requests(self):
+        """
+        Sends the queued RPCRequests to the server in a single message.
+        """
+        if self.__flush_call and self.__flush_call.active():
+            self.__flush_call.cancel()
+        self.__flush_call = None
+
+        if not self.__pending_requests:
+            return
+        requests, self.__pending_requests = self.__pending_requests, []
         try:
-            # Store the DelugeRPCRequest object just in case a RPCError is sent in
-            # response to this request.  We use the extra information when printing
-            # out the error for debugging purposes.
-            self.__rpc_requests[request.request_id] = request
-            # log.debug('Sending RPCRequest %s: %s', request.request_id, request)
-            # Send the request in a tuple because multiple requests can be sent at once
-            self.transfer_message((request.format_message(),))
+            # log.debug('Sending RPCRequests: %s', requests)
+            # Send the requests in a tuple because multiple requests can be sent at once
+            self.transfer_message(
+                tuple(request.format_message() for request in requests)
+            )
         except Exception as ex:
             log.warning('Error occurred when sending message: %s', ex)
 
@@ -243,12 +311,89 @@ def clientConnectionLost(self, connector, reason):  # NOQA: N802
             self.daemon.disconnect_callback()
 
 
+class RPCBatch(object):
+    """
+    Context manager sending the RPCs made within it to the daemon in a single
+    message as soon as the context exits.
+
+    The Deferreds of the calls are collected in :attr:`deferreds` and, once
+    the context exits, :attr:`deferred` is a DeferredList of them. The
+    failures of the calls are reported in its result and still reach the
+    errbacks of the calls.
+
+    Example::
+
+        with client.batch() as batch:
+            client.core.get_config()
+            client.core.get_session_state()
+        batch.deferred.addCallback(on_results)
+
+    """
+
+    def __init__(self, daemon):
+        self.daemon = daemon
+        self.deferreds = []
+        self.deferred = None
+
+    def __enter__(self):
+        self.daemon.active_batches.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.daemon.active_batches.remove(self)
+        if not self.daemon.active_batches:
+            self.daemon.flush_requests()
+        self.deferred = defer.DeferredList(
+            [self.observe(deferred) for deferred in self.deferreds],
+            consumeErrors=True,
+        )
+        return False
+
+    @staticmethod
+    def observe(deferred):
+        """
+        Returns a Deferred fired with the result of `deferred`, leaving the
+        result of `deferred` unchanged.
+        """
+        observer = defer.Deferred()
+
+        def on_result(result):
+            if isinstance(result, Failure):
+                observer.errback(result)
+            else:
+                observer.callback(result)
+            return result
+
+        deferred.addBoth(on_result)
+        return observer
+
+
 class DaemonProxy(object):
-    pass
+    def __init__(self):
+        # The RPCBatch contexts the calls are currently made in
+        self.active_batches = []
+
+    def batch(self):
+        """
+        Returns a context manager grouping the calls made within it.
+
+        :returns: a RPCBatch
+
+        """
+        return RPCBatch(self)
+
+    def add_to_batches(self, deferred):
+        for batch in self.active_batches:
+            batch.deferreds.append(deferred)
+
+    def flush_requests(self):
+        """Sends any queued RPCRequests to the daemon."""
+        pass
 
 
 class DaemonSSLProxy(DaemonProxy):
     def __init__(self, event_handlers=None):
+        super(DaemonSSLProxy, self).__init__()
         if event_handlers is None:
             event_handlers = {}
         self.__factory = DelugeRPCClientFactory(self, event_handlers)
@@ -300,6 +445,7 @@ def connect(self, host, port):
 
     def disconnect(self):
         log.debug('sslproxy.disconnect()')
+        self.flush_requests()
         self.disconnect_deferred = defer.Deferred()
         self.__connector.disconnect()
         return self.disconnect_deferred
@@ -336,8 +482,14 @@ def call(self, method, *args, **kwargs):
         # before a response is received.
         self.__request_counter += 1
 
+        self.add_to_batches(d)
         return d
 
+    def flush_requests(self):
+        """Sends the RPCRequests queued in this reactor iteration to the daemon."""
+        if self.protocol:
+            self.protocol.flush_requests()
+
     def pop_deferred(self, request_id):
         """
         Pops a Deferred object.  This is generally called once we receive the
@@ -423,6 +575,11 @@ def __on_login(self, result, username, login_deferred):
         log.debug('__on_login called: %s %s', username, result)
         self.username = username
         self.authentication_level = result
+        # Agree on the wire protocol, older daemons respond with an error and
+        # messages continue to be sent using the legacy protocol.
+        self.call('daemon.negotiate_protocol', PROTOCOL_VERSION).addCallbacks(
+            self.__on_negotiate_protocol, self.__on_negotiate_protocol_fail
+        )
         # We need to tell the daemon what events we're interested in receiving
         if self.__factory.event_handlers:
             self.call('daemon.set_event_interest', list(self.__factory.event_handlers))
@@ -435,6 +592,13 @@ def __on_login(self, result, username, login_deferred):
     def __on_login_fail(self, result, login_deferred):
         login_deferred.errback(result)
 
+    def __on_negotiate_protocol(self, options):
+        log.debug('Negotiated protocol options with daemon: %s', options)
+        self.protocol.set_protocol_options(**options)
+
+    def __on_negotiate_protocol_fail(self, reason):
+        log.debug('Daemon does not support protocol negotiation: %s', reason.value)
+
     def __on_auth_levels_mappings(self, result):
         auth_levels_mapping, auth_levels_mapping_reverse = result
         self.auth_levels_mapping = auth_levels_mapping
@@ -456,6 +620,7 @@ def get_bytes_sent(self):
 
 class DaemonStandaloneProxy(DaemonProxy):
     def __init__(self, event_handlers=None):
+        super(DaemonStandaloneProxy, self).__init__()
         if event_handlers is None:
             event_handlers = {}
         from deluge.core import daemon
@@ -495,9 +660,11 @@ def call(self, method, *args, **kwargs):
             m = self.__daemon.rpcserver.get_object_method(method)
         except Exception as ex:
             log.exception(ex)
-            return defer.fail(ex)
+            d = defer.fail(ex)
         else:
-            return defer.maybeDeferred(m, *copy.deepcopy(args), **copy.deepcopy(kwargs))
+            d = defer.maybeDeferred(m, *copy.deepcopy(args), **copy.deepcopy(kwargs))
+        self.add_to_batches(d)
+        return d
 
     def register_event_handler(self, event, handler):
         """
@@ -771,6 +938,21 @@ def deregister_event_handler(self, event, handler):
         if self._daemon_proxy:
             self._daemon_proxy.deregister_event_handler(event, handler)
 
+    def batch(self):
+        """
+        Returns a context manager sending the RPCs made within it to the daemon
+        in a single message. Calls made in the same reactor iteration are
+        always grouped, the context sends them immediately on exit and
+        collects their Deferreds.
+
+        :returns: a RPCBatch, its `deferred` attribute is a DeferredList of
+            the calls once the context exits.
+
+        """
+        if self._daemon_proxy:
+            return self._daemon_proxy.batch()
+        return RPCBatch(DaemonProxy())
+
     def force_call(self, block=False):
         # no-op for now.. we'll see if we need this in the future
         pass
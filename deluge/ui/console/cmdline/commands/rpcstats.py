@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Deluge and is licensed under GNU General Public License 3.0, or later, with
+# the additional special exception to link portions of this program with the OpenSSL library.
+# See LICENSE for more details.
+#
+
+from __future__ import unicode_literals
+
+import deluge.component as component
+from deluge.common import fsize
+from deluge.ui.client import client
+
+from . import BaseCommand
+
+SORT_KEYS = {
+    'calls': lambda stats: stats['calls'],
+    'errors': lambda stats: stats['errors'],
+    'time': lambda stats: stats['wall_time']['total'] + stats['deferred_time']['total'],
+    'size': lambda stats: stats['response_bytes']['total'],
+}
+
+
+def format_time(seconds):
+    return '%.1fms' % (seconds * 1000)
+
+
+def mean(histogram):
+    return float(histogram['total']) / histogram['count'] if histogram['count'] else 0
+
+
+class Command(BaseCommand):
+    """Show the RPC call statistics of the daemon"""
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '-u',
+            '--users',
+            action='store_true',
+            default=False,
+            dest='users',
+            help=_('Show the statistics per user'),
+        )
+        parser.add_argument(
+            '-s',
+            '--sort',
+            choices=sorted(SORT_KEYS),
+            default='time',
+            dest='sort',
+            help=_('Sort the methods by this key (default: %(default)s)'),
+        )
+
+    def handle(self, options):
+        self.console = component.get('ConsoleUI')
+
+        def on_rpc_stats(stats):
+            if options.users:
+                for username, methods in sorted(stats['users'].items()):
+                    self.console.write('{!info!}User: {!input!}%s' % username)
+                    self.show_methods(methods, options.sort)
+            else:
+                self.show_methods(stats['methods'], options.sort)
+
+        return client.daemon.get_rpc_stats().addCallback(on_rpc_stats)
+
+    def show_methods(self, methods, sort):
+        for method, stats in sorted(
+            methods.items(), key=lambda item: SORT_KEYS[sort](item[1]), reverse=True
+        ):
+            self.console.write(
+                '{!info!}%s: {!input!}%d calls, %d errors, %d rejected, '
+                'time %s (max %s), deferred %s (max %s), '
+                'request %s, response %s (max %s)'
+                % (
+                    method,
+                    stats['calls'],
+                    stats['errors'],
+                    stats['rejected'],
+                    format_time(mean(stats['wall_time'])),
+                    format_time(stats['wall_time']['max']),
+                    format_time(mean(stats['deferred_time'])),
+                    format_time(stats['deferred_time']['max']),
+                    fsize(mean(stats['request_bytes'])),
+                    fsize(mean(stats['response_bytes'])),
+                    fsize(stats['response_bytes']['max']),
+                )
+            )
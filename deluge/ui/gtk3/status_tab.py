@@ -12,7 +12,7 @@
 import logging
 
 import deluge.component as component
-from deluge.common import decode_bytes, fpeer
+from deluge.common import decode_bytes, fpeer, unpack_pieces
 from deluge.configmanager import ConfigManager
 
 from .piecesbar import PiecesBar
@@ -40,6 +40,9 @@ def __init__(self):
 
         self.progressbar = self.main_builder.get_object('progressbar')
         self.piecesbar = None
+        self.pieces = None
+        # Daemons older than the pieces_packed key are sent the pieces key.
+        self.pieces_key = 'pieces_packed'
 
         self.add_tab_widget('summary_availability', fratio, ('distributed_copies',))
         self.add_tab_widget(
@@ -94,7 +97,7 @@ def update(self):
         status_keys = self.status_keys
         status_keys.extend(['sum_peers'])
         if self.config['show_piecesbar']:
-            status_keys.extend(['pieces', 'num_pieces'])
+            status_keys.extend([self.pieces_key, 'num_pieces'])
 
         component.get('SessionProxy').get_torrent_status(
             selected, status_keys
@@ -129,12 +132,18 @@ def _on_get_torrent_status(self, status):
         if self.config['show_piecesbar']:
             if self.piecesbar.get_fraction() != fraction:
                 self.piecesbar.set_fraction(fraction)
-            if (
-                status['state'] != 'Checking'
-                and self.piecesbar.get_pieces() != status['pieces']
-            ):
+            if self.pieces_key not in status:
+                # The daemon does not know the key, request the pieces instead.
+                self.pieces_key = 'pieces'
+            # The pieces are only unpacked when they changed.
+            pieces = (status.get(self.pieces_key), status['num_pieces'])
+            if status['state'] != 'Checking' and self.pieces != pieces:
                 # Skip pieces assignment if checking torrent.
-                self.piecesbar.set_pieces(status['pieces'], status['num_pieces'])
+                self.pieces = pieces
+                if self.pieces_key == 'pieces':
+                    self.piecesbar.set_pieces(*pieces)
+                else:
+                    self.piecesbar.set_pieces(unpack_pieces(*pieces), pieces[1])
             self.piecesbar.update()
         else:
             if self.progressbar.get_fraction() != fraction:
@@ -149,6 +158,7 @@ def on_show_piecesbar_config_changed(self, key, show):
     def show_piecesbar(self):
         if self.piecesbar is None:
             self.piecesbar = PiecesBar()
+            self.pieces = None
             self.main_builder.get_object('status_progress_vbox').pack_start(
                 self.piecesbar, False, False, 0
             )
@@ -170,6 +180,8 @@ def clear(self):
             widget[0].set_text('')
 
         if self.config['show_piecesbar']:
+            self.pieces = None
+            self.pieces_key = 'pieces_packed'
             self.piecesbar.clear()
         else:
             self.progressbar.set_fraction(0)
@@ -547,30 +547,32 @@ def got_torrents(torrents):
         def on_complete(result):
             d.callback(ui_info)
 
-        d1 = component.get('SessionProxy').get_torrents_status(filter_dict, keys)
-        d1.addCallback(got_torrents)
-
-        d2 = client.core.get_filter_tree()
-        d2.addCallback(got_filters)
-
-        d3 = client.core.get_session_status(
-            [
-                'num_peers',
-                'payload_download_rate',
-                'payload_upload_rate',
-                'download_rate',
-                'upload_rate',
-                'dht_nodes',
-                'has_incoming_connections',
-            ]
-        )
-        d3.addCallback(got_stats)
+        # Send the core calls to the daemon in a single message.
+        with client.batch():
+            d1 = component.get('SessionProxy').get_torrents_status(filter_dict, keys)
+            d1.addCallback(got_torrents)
+
+            d2 = client.core.get_filter_tree()
+            d2.addCallback(got_filters)
+
+            d3 = client.core.get_session_status(
+                [
+                    'num_peers',
+                    'payload_download_rate',
+                    'payload_upload_rate',
+                    'download_rate',
+                    'upload_rate',
+                    'dht_nodes',
+                    'has_incoming_connections',
+                ]
+            )
+            d3.addCallback(got_stats)
 
-        d4 = client.core.get_free_space(self.core_config.get('download_location'))
-        d4.addCallback(got_free_space)
+            d4 = client.core.get_free_space(self.core_config.get('download_location'))
+            d4.addCallback(got_free_space)
 
-        d5 = client.core.get_external_ip()
-        d5.addCallback(got_external_ip)
+            d5 = client.core.get_external_ip()
+            d5.addCallback(got_external_ip)
 
         dl = DeferredList([d1, d2, d3, d4, d5], consumeErrors=True)
         dl.addCallback(on_complete)